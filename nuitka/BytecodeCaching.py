@@ -5,6 +5,14 @@
 
 Initially this deals with preserving compiled module state after bytecode demotion
 such that it allows to restore it directly.
+
+Cache entries are content addressed, their names are made from the module name,
+a hash of the configuration influencing the optimization, and a hash of the
+source code. That allows to share them for standard library modules between
+projects and machines via "--shared-bytecode-cache-dir" that is used read-only
+unless asked to populate it. Writes are done with atomic renames, so concurrent
+compilations can populate the same directory. With "--remote-cache" entries are
+also exchanged with a cache shared between machines.
 """
 
 import os
@@ -12,13 +20,26 @@ import sys
 
 from nuitka.containers.OrderedSets import OrderedSet
 from nuitka.importing.Importing import locateModule, makeModuleUsageAttempt
+from nuitka.importing.StandardLibrary import isStandardLibraryPath
 from nuitka.ModuleRegistry import getModuleOptimizationTimingInfos
+from nuitka.options.Options import (
+    getSharedBytecodeCacheDir,
+    shallUpdateSharedBytecodeCache,
+)
 from nuitka.plugins.Hooks import getPluginsCacheContributionValues
+from nuitka.Tracing import cache_logger
 from nuitka.utils.AppDirs import getCacheDir
-from nuitka.utils.FileOperations import getNormalizedPathJoin
+from nuitka.utils.CacheUsage import countCacheHit, countCacheMiss
+from nuitka.utils.FileOperations import (
+    getFileContents,
+    getNormalizedPathJoin,
+    makePath,
+    putBinaryFileContentsAtomic,
+)
 from nuitka.utils.Hashing import Hash, getStringHash
-from nuitka.utils.Json import loadJsonFromFilename, writeJsonToFilename
+from nuitka.utils.Json import loadJsonFromFilename, writeJsonToFilenameAtomic
 from nuitka.utils.ModuleNames import ModuleName
+from nuitka.utils.RemoteCaching import getRemoteCache
 from nuitka.Version import version_string
 
 
@@ -32,6 +53,49 @@ def _getCacheFilename(module_name, extension):
     )
 
 
+def _getSharedCacheFilename(module_name, extension):
+    shared_cache_dir = getSharedBytecodeCacheDir()
+
+    if shared_cache_dir is None:
+        return None
+
+    return getNormalizedPathJoin(shared_cache_dir, "%s.%s" % (module_name, extension))
+
+
+def _loadCacheData(cache_name, use_shared):
+    cache_filename = _getCacheFilename(cache_name, "json")
+
+    if not os.path.exists(cache_filename):
+        # Populate the local cache from the remote cache if there is any.
+        remote_cache = getRemoteCache()
+
+        if remote_cache is not None:
+            contents = remote_cache.getCacheEntry(
+                "module-cache", os.path.basename(cache_filename)
+            )
+
+            if contents is not None:
+                putBinaryFileContentsAtomic(cache_filename, contents)
+
+    # Only standard library modules are shared between projects.
+    for cache_filename in (
+        cache_filename,
+        _getSharedCacheFilename(cache_name, "json") if use_shared else None,
+    ):
+        if cache_filename is None or not os.path.exists(cache_filename):
+            continue
+
+        data = loadJsonFromFilename(cache_filename)
+
+        if (
+            data is not None
+            and data.get("file_format_version") == _cache_format_version
+        ):
+            return data
+
+    return None
+
+
 def makeCacheName(module_name, source_code):
     module_config_hash = _getModuleConfigHash(module_name)
 
@@ -49,6 +113,18 @@ def hasCachedImportedModuleUsageAttempts(module_name, source_code, source_ref):
         module_name=module_name, source_code=source_code, source_ref=source_ref
     )
 
+    if result is not None:
+        cache_filename = _getCacheFilename(
+            makeCacheName(module_name, source_code), "json"
+        )
+
+        countCacheHit(
+            "bytecode",
+            cache_filename if os.path.exists(cache_filename) else None,
+        )
+    else:
+        countCacheMiss("bytecode")
+
     return result is not None
 
 
@@ -58,19 +134,14 @@ _cache_format_version = 8
 
 def getCachedImportedModuleUsageAttempts(module_name, source_code, source_ref):
     cache_name = makeCacheName(module_name, source_code)
-    cache_filename = _getCacheFilename(cache_name, "json")
-
-    if not os.path.exists(cache_filename):
-        return None
 
-    data = loadJsonFromFilename(cache_filename)
+    data = _loadCacheData(
+        cache_name, use_shared=isStandardLibraryPath(source_ref.getFilename())
+    )
 
     if data is None:
         return None
 
-    if data.get("file_format_version") != _cache_format_version:
-        return None
-
     if data["module_name"] != module_name:
         return None
 
@@ -135,6 +206,7 @@ def writeImportedModulesNamesToCache(
     source_code,
     used_modules,
     distribution_names,
+    is_stdlib,
 ):
     cache_name = makeCacheName(module_name, source_code)
     cache_filename = _getCacheFilename(cache_name, "json")
@@ -156,7 +228,31 @@ def writeImportedModulesNamesToCache(
         ),
     }
 
-    writeJsonToFilename(filename=cache_filename, contents=data)
+    writeJsonToFilenameAtomic(filename=cache_filename, contents=data)
+
+    remote_cache = getRemoteCache()
+
+    if remote_cache is not None:
+        remote_cache.putCacheEntry(
+            "module-cache",
+            os.path.basename(cache_filename),
+            getFileContents(cache_filename, mode="rb"),
+        )
+
+    # Only standard library modules are shared between projects, others are
+    # unlikely to be reused elsewhere.
+    if is_stdlib and shallUpdateSharedBytecodeCache():
+        shared_cache_filename = _getSharedCacheFilename(cache_name, "json")
+
+        if not os.path.exists(shared_cache_filename):
+            try:
+                makePath(os.path.dirname(shared_cache_filename))
+                writeJsonToFilenameAtomic(filename=shared_cache_filename, contents=data)
+            except (IOError, OSError) as e:
+                cache_logger.warning(
+                    "Failed to update shared bytecode cache '%s' due to '%s'."
+                    % (shared_cache_filename, e)
+                )
 
 
 def _getModuleConfigHash(full_name):
@@ -166,8 +262,9 @@ def _getModuleConfigHash(full_name):
     # Plugins may change their influence.
     hash_value.updateFromValues(*getPluginsCacheContributionValues(full_name))
 
-    # Take Nuitka and Python version into account as well, ought to catch code changes.
-    hash_value.updateFromValues(version_string, sys.version)
+    # Take Nuitka and Python version into account as well, ought to catch code
+    # changes, and the platform, as shared caches can be used by many machines.
+    hash_value.updateFromValues(version_string, sys.version, sys.platform)
 
     return hash_value.asHexDigest()
 
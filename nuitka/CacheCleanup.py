@@ -5,12 +5,37 @@
 
 This is triggered by "--clean-cache=" usage, and can cleanup all kinds of
 caches and is supposed to run before or instead of Nuitka compilation.
+
+With "--cache-size-limit" and "--cache-age-limit" given, this also evicts
+the least recently used entries of caches after compilation, such that they
+stay within their budgets.
 """
 
 import os
+import time
 
 from nuitka.Tracing import cache_logger
 from nuitka.utils.AppDirs import getCacheDir, removeCacheDir
+from nuitka.utils.CacheUsage import countCacheEvictions
+from nuitka.utils.FileOperations import (
+    deleteFile,
+    getFileList,
+    getFileSize,
+    removeDirectory,
+)
+
+# Cache names as used for limit options, their directory name, and if their
+# entries are directories rather than files. For downloads, the unpacked
+# contents of a download must be removed together.
+_evictable_caches = (
+    ("bytecode", "module-cache", False),
+    ("compression", "onefile-compression", False),
+    ("dll-dependencies", "library_dependencies", False),
+    ("downloads", "downloads", True),
+    ("import-index", "import-index", False),
+)
+
+evictable_cache_names = tuple(cache_name for cache_name, _, _ in _evictable_caches)
 
 
 def _cleanCacheDirectory(cache_name, cache_basename):
@@ -32,11 +57,101 @@ def _cleanCacheDirectory(cache_name, cache_basename):
             cache_logger.info("Done.")
 
 
+def _getCacheEntries(cache_dir, directory_entries):
+    """Cache entries with last use time and size."""
+
+    if directory_entries:
+        for entry_name in os.listdir(cache_dir):
+            entry_path = os.path.join(cache_dir, entry_name)
+
+            if os.path.isdir(entry_path):
+                yield (
+                    entry_path,
+                    os.stat(entry_path).st_mtime,
+                    sum(getFileSize(filename) for filename in getFileList(entry_path)),
+                )
+    else:
+        for filename in getFileList(cache_dir):
+            yield filename, os.stat(filename).st_mtime, getFileSize(filename)
+
+
+def _evictCacheDirectory(
+    cache_name, cache_basename, directory_entries, size_limit, age_limit
+):
+    cache_dir = getCacheDir(cache_basename, create=False)
+
+    if not os.path.isdir(cache_dir):
+        return
+
+    # Oldest first, these are the least recently used ones.
+    entries = sorted(
+        _getCacheEntries(cache_dir, directory_entries), key=lambda entry: entry[1]
+    )
+
+    total_size = sum(entry[2] for entry in entries)
+    min_mtime = None if age_limit is None else time.time() - age_limit * 86400
+
+    evicted_count = 0
+    evicted_size = 0
+
+    for entry_path, entry_mtime, entry_size in entries:
+        if (size_limit is None or total_size <= size_limit) and (
+            min_mtime is None or entry_mtime >= min_mtime
+        ):
+            break
+
+        if directory_entries:
+            removeDirectory(
+                path=entry_path,
+                logger=cache_logger,
+                ignore_errors=True,
+                extra_recommendation=None,
+            )
+        else:
+            deleteFile(entry_path, must_exist=False)
+
+        total_size -= entry_size
+        evicted_count += 1
+        evicted_size += entry_size
+
+    countCacheEvictions(cache_name, count=evicted_count, size=evicted_size)
+
+    if evicted_count:
+        cache_logger.info(
+            "Evicted %d least recently used entries with %d bytes from '%s' cache."
+            % (evicted_count, evicted_size, cache_name)
+        )
+
+
+def evictCaches():
+    """Evict least recently used cache entries to stay within the limits."""
+    from nuitka.options.Options import getCacheAgeLimits, getCacheSizeLimits
+
+    size_limits = getCacheSizeLimits()
+    age_limits = getCacheAgeLimits()
+
+    for cache_name, cache_basename, directory_entries in _evictable_caches:
+        size_limit = size_limits.get(cache_name, size_limits.get("all"))
+        age_limit = age_limits.get(cache_name, age_limits.get("all"))
+
+        if size_limit is None and age_limit is None:
+            continue
+
+        _evictCacheDirectory(
+            cache_name=cache_name,
+            cache_basename=cache_basename,
+            directory_entries=directory_entries,
+            size_limit=size_limit,
+            age_limit=age_limit,
+        )
+
+
 def cleanCaches():
     _cleanCacheDirectory("ccache", "ccache")
     _cleanCacheDirectory("clcache", "clcache")
     _cleanCacheDirectory("zig", "zig")
     _cleanCacheDirectory("bytecode", "module-cache")
+    _cleanCacheDirectory("import-index", "import-index")
     _cleanCacheDirectory("dll-dependencies", "library_dependencies")
 
 
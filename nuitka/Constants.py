@@ -415,9 +415,22 @@ def getConstantValueGuide(constant, elements_only):
     elif constant_type is dict:
         for value in iterItems(constant):
             if isMutable(value):
-                return "D"
+                break
+        else:
+            return "d"
 
-        return "d"
+        # With ordered dictionaries, the values are copied in the order given
+        # at compile time, sharing the immutable ones, otherwise the copy has
+        # to discover the value types at run time.
+        if python_version < 0x360:
+            return "D"
+
+        return ("%s" if elements_only else "M%s") % (
+            "".join(
+                getConstantValueGuide(value, elements_only=False)
+                for value in constant.values()
+            ),
+        )
     else:
         return "?"
 
@@ -23,6 +23,7 @@ from nuitka.build.SconsUtils import (
     readSconsReport,
     readSconsResourceUsageReports,
 )
+from nuitka.CacheCleanup import evictCaches
 from nuitka.code_generation.CodeGeneration import (
     generateHelpersCode,
     generateModuleCode,
@@ -31,6 +32,7 @@ from nuitka.code_generation.ConstantCodes import (
     addDistributionMetadataValue,
     getDistributionMetadataValues,
 )
+from nuitka.freezer.DistManifest import finishDistManifest, loadDistManifest
 from nuitka.freezer.IncludedDataFiles import (
     addIncludedDataFilesFromFileOptions,
     addIncludedDataFilesFromFlavor,
@@ -38,6 +40,7 @@ from nuitka.freezer.IncludedDataFiles import (
     addIncludedDataFilesFromPlugins,
     checkProjectExpectedDataFiles,
     copyDataFiles,
+    getEmbeddedDataFiles,
 )
 from nuitka.freezer.IncludedEntryPoints import (
     addExtensionModuleEntryPoint,
@@ -47,6 +50,7 @@ from nuitka.freezer.IncludedEntryPoints import (
 )
 from nuitka.freezer.MacOSApp import addIncludedDataFilesFromMacOSAppOptions
 from nuitka.freezer.MacOSDmg import createDmgFile
+from nuitka.importing.ImportIndex import saveImportIndex
 from nuitka.importing.Importing import (
     getRecompileDecisionReason,
     locateModule,
@@ -66,6 +70,7 @@ from nuitka.options.Options import (
     getFileReferenceMode,
     getForcedStderrPath,
     getForcedStdoutPath,
+    getFreeListSizes,
     getMainArgs,
     getMainEntryPointFilenames,
     getMustIncludeModules,
@@ -93,6 +98,7 @@ from nuitka.options.Options import (
     isCompileTimeProfile,
     isCPgoMode,
     isExperimental,
+    isFreeListAdaptive,
     isLowMemory,
     isMultidistMode,
     isOnefileMode,
@@ -176,14 +182,21 @@ from nuitka.utils.FileOperations import (
     getNormalizedPathJoin,
     getReportPath,
     isFilesystemEncodable,
+    makePath,
     openTextFile,
+    relpath,
     removeDirectory,
 )
 from nuitka.utils.Importing import getPackageDirFilename
 from nuitka.utils.InstanceCounters import printInstanceCounterStats
-from nuitka.utils.MemoryUsage import reportMemoryUsage, showMemoryTrace
+from nuitka.utils.MemoryUsage import (
+    reportMemoryUsage,
+    showMemoryTrace,
+    showObjectMemoryUsage,
+)
 from nuitka.utils.ModuleNames import ModuleName
 from nuitka.utils.ReExecute import callExecProcess, reExecuteNuitka
+from nuitka.utils.RemoteCaching import reportRemoteCacheStatistics
 from nuitka.utils.StaticLibraries import getSystemStaticLibPythonPath
 from nuitka.utils.Timing import withProfiling
 from nuitka.utils.Utils import getArchitecture, isMacOS, isWin32Windows
@@ -202,6 +215,7 @@ from .freezer.Onefile import getCompressorPython, packDistFolderToOnefile
 from .freezer.Standalone import (
     checkFreezingModuleSet,
     copyDllsUsed,
+    deduplicateDistFiles,
     detectUsedDLLs,
     signDistributionMacOS,
 )
@@ -283,9 +297,17 @@ use the correct name instead.""" % (distribution_name, real_distribution_name))
     if not shallOnlyExecCCompilerCall():
         cleanSconsDirectory(source_dir)
 
-        # Prepare the ".dist" directory, throwing away what was there before.
+        # Prepare the ".dist" directory, throwing away what was there before,
+        # unless it is to be updated incrementally.
         if isStandaloneMode():
-            OutputDirectories.initStandaloneDirectory(logger=general)
+            if loadDistManifest():
+                makePath(
+                    OutputDirectories.getStandaloneDirectoryPath(
+                        bundle=False, real=False
+                    )
+                )
+            else:
+                OutputDirectories.initStandaloneDirectory(logger=general)
 
     # Delete result file, to avoid confusion with previous build and to
     # avoid locking issues after the build.
@@ -748,6 +770,15 @@ def runSconsBackend():
     if isLowMemory():
         scons_options["low_memory"] = asBoolStr(True)
 
+    free_list_sizes = getFreeListSizes()
+    if free_list_sizes:
+        scons_options["free_list_sizes"] = ",".join(
+            "%s=%d" % (kind, count) for kind, count in sorted(free_list_sizes.items())
+        )
+
+    if isFreeListAdaptive():
+        scons_options["free_list_adaptive"] = asBoolStr(True)
+
     scons_options["result_exe"] = OutputDirectories.getResultFullpath(
         onefile=False, real=False
     )
@@ -996,6 +1027,9 @@ def compileTree():
 
     general.info("Completed Python level compilation and optimization.")
 
+    # Module finding is mostly done, make it available to other compilations.
+    saveImportIndex()
+
     if not shallOnlyExecCCompilerCall():
         general.info("Generating source code for C backend compiler.")
 
@@ -1054,6 +1088,7 @@ def compileTree():
 
     if isShowMemory():
         printInstanceCounterStats()
+        showObjectMemoryUsage()
 
     Reports.doMissingOptimizationReport()
 
@@ -1062,7 +1097,8 @@ def compileTree():
 
     general.info("Running data composer tool for optimal constant value handling.")
 
-    runDataComposer(source_dir)  # TODO: This should be a hook too
+    # TODO: This should be a hook too
+    runDataComposer(source_dir, embedded_data_files=getEmbeddedDataFiles())
 
     writeExtraCodeFiles(onefile=False)
 
@@ -1273,8 +1309,18 @@ def _main():
                     copy_standalone_entry_points=copy_standalone_entry_points,
                 )
 
+            data_file_dest_paths = [
+                relpath(data_file_path, dist_dir) for data_file_path in data_file_paths
+            ]
+
             dist_dir = OutputDirectories.renameStandaloneDirectory(dist_dir)
 
+            deduplicateDistFiles(
+                dist_dir=dist_dir, data_file_paths=data_file_dest_paths
+            )
+
+            finishDistManifest(dist_dir)
+
         onStandaloneDistributionFinished(
             dist_dir=dist_dir,
             standalone_binary=OutputDirectories.getResultFullpath(
@@ -1362,6 +1408,9 @@ exist, out e.g. '--output-dir=output' to sure is importable.""" % base_path,
     if shallCreateDmgFile():
         createDmgFile(general)
 
+    reportRemoteCacheStatistics()
+    evictCaches()
+
     writeCompilationReports(aborted=False)
     printPluginUsageStats()
 
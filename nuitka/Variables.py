@@ -393,6 +393,32 @@ class ModuleVariable(Variable):
         else:
             return bool(self.writers)
 
+    def getSingleModuleAssignSource(self):
+        """Source node of the only assignment, which must be the module's own.
+
+        Returns None if there are other assignments, deletions, or writers
+        from elsewhere, or if that cannot be known.
+        """
+        if not self.owner.locals_scope.complete:
+            return None
+
+        if self.writers != set((self.owner,)):
+            return None
+
+        result = None
+
+        for trace in self.traces[self.owner].values():
+            if trace.isDeletedTrace():
+                return None
+
+            if trace.isAssignTrace():
+                if result is not None:
+                    return None
+
+                result = trace.getAssignNode().subnode_source
+
+        return result
+
     def getModule(self):
         return self.owner
 
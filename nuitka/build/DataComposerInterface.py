@@ -18,7 +18,7 @@ from nuitka.utils.FileOperations import (
     getNormalizedPathJoin,
     makeContainingPath,
 )
-from nuitka.utils.Json import loadJsonFromFilename
+from nuitka.utils.Json import loadJsonFromFilename, writeJsonToFilename
 
 # Indicate not done with -1
 _data_composer_size = None
@@ -29,10 +29,22 @@ def getDataComposerReportValues():
     return OrderedDict(blob_size=_data_composer_size, stats=_data_composer_stats)
 
 
-def runDataComposer(source_dir):
+def runDataComposer(source_dir, embedded_data_files):
+    """Run the data composer to create the constants blob.
+
+    Args:
+        source_dir: The build directory with the ".const" files.
+        embedded_data_files: Tuples of name and source path of data files to
+            embed into the blob.
+    """
     # This module is a singleton, pylint: disable=global-statement
     global _data_composer_stats
 
+    writeJsonToFilename(
+        filename=getEmbeddedDataFilesListFilename(source_dir),
+        contents=list(embedded_data_files),
+    )
+
     onDataComposerRun()
     blob_filename, _data_composer_stats = _runDataComposer(source_dir=source_dir)
     onDataComposerResult(blob_filename)
@@ -101,6 +113,12 @@ def getConstantBlobFilename(source_dir):
     return result
 
 
+def getEmbeddedDataFilesListFilename(source_dir):
+    result = getNormalizedPathJoin(source_dir, "blobs", "__embedded_data.json")
+    makeContainingPath(result)
+    return result
+
+
 def deriveModuleConstantsBlobName(filename):
     assert filename.endswith(".const")
 
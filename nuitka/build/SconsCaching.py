@@ -148,7 +148,7 @@ def _injectCcache(env, cc_path, python_prefix, assume_yes_for_downloads):
     return False
 
 
-def enableCcache(env, source_dir, python_prefix, disable_ccache):
+def enableCcache(env, source_dir, python_prefix, disable_ccache, remote_storage):
     inject_ccache = not disable_ccache and not env.zig_mode
 
     if inject_ccache:
@@ -177,6 +177,12 @@ def enableCcache(env, source_dir, python_prefix, disable_ccache):
             )
             setEnvironmentVariable(env, "CLCACHE_MEMCACHED", None)
 
+        # Share results between machines, ccache 4.4 and 4.5 used the name
+        # secondary storage for it.
+        if remote_storage is not None and "CCACHE_REMOTE_STORAGE" not in os.environ:
+            setEnvironmentVariable(env, "CCACHE_REMOTE_STORAGE", remote_storage)
+            setEnvironmentVariable(env, "CCACHE_SECONDARY_STORAGE", remote_storage)
+
         # We know the include files we created are safe to use.
         setEnvironmentVariable(
             env, "CCACHE_SLOPPINESS", "include_file_ctime,include_file_mtime"
@@ -384,6 +390,8 @@ def _normalizeCcacheHit(result):
         return "cache hit"
     elif result == "cache_miss":
         return "cache miss"
+    elif result == "remote_storage_hit":
+        return "remote cache hit"
 
     # Newer ccache has these, but they duplicate:
     if result in (
@@ -398,6 +406,10 @@ def _normalizeCcacheHit(result):
         "local_storage_read_miss",
         "local_storage_write",
         "local_storage_miss",
+        "remote_storage_read_hit",
+        "remote_storage_read_miss",
+        "remote_storage_write",
+        "remote_storage_miss",
         # Usage of incbin causes this for the constants blob integration.
         "unsupported code directive",
         "disabled",
@@ -436,7 +448,7 @@ to install it.""")
                     if result is None:
                         continue
 
-                    if result in ("cache hit", "cache miss"):
+                    if result in ("cache hit", "remote cache hit", "cache miss"):
                         module_name = _getModuleNameFromCommand(command)
                         if module_name is not None:
                             ccache_module_stats[module_name] = ("ccache", result)
@@ -1271,6 +1271,7 @@ def createNuitkaSconsEnvironment(needs_source_dir=True):
                 source_dir=source_dir,
                 python_prefix=env.python_prefix_external,
                 disable_ccache=disable_ccache,
+                remote_storage=getArgumentDefaulted("ccache_remote_storage", None),
             )
 
         if env.msvc_mode and not disable_ccache:
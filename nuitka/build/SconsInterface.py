@@ -108,6 +108,7 @@ from nuitka.utils.FileOperations import (
 from nuitka.utils.InstalledPythons import findInstalledPython
 from nuitka.utils.Json import loadJsonFromFilename
 from nuitka.utils.PrivatePipSpace import getZigBinaryPath
+from nuitka.utils.RemoteCaching import getRemoteCache
 from nuitka.utils.SharedLibraries import detectBinaryMinMacOS
 from nuitka.utils.Utils import (
     getArchitecture,
@@ -667,6 +668,10 @@ def getCommonSconsOptions():
 
     if shallDisableCCacheUsage():
         scons_options["disable_ccache"] = asBoolStr(True)
+    elif getRemoteCache() is not None:
+        scons_options["ccache_remote_storage"] = (
+            getRemoteCache().getCcacheRemoteStorageValue()
+        )
 
     if isWin32Windows() and getWindowsConsoleMode() != "attach":
         scons_options["console_mode"] = getWindowsConsoleMode()
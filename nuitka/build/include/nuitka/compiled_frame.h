@@ -93,6 +93,12 @@ extern PyCodeObject *USE_CODE_OBJECT(PyThreadState *tstate, PyObject *code_objec
 
 extern PyTypeObject Nuitka_Frame_Type;
 
+#ifdef Py_GIL_DISABLED
+// Frame caches are thread local, register one used by the current thread, so
+// its frame is released when the thread exits.
+extern void Nuitka_ThreadCachesRegisterFrameCache(struct Nuitka_FrameObject **frame_cache);
+#endif
+
 static inline bool Nuitka_Frame_CheckExact(PyObject *object) {
     CHECK_OBJECT(object);
     return Py_TYPE(object) == &Nuitka_Frame_Type;
@@ -122,12 +122,47 @@ extern PyObject *Nuitka_Function_ExtractCodeObjectDescription(PyThreadState *tst
                                                               struct Nuitka_FunctionObject *function);
 #endif
 
+// Function for "__compiled__.free_list_stats" to inspect free list usage.
+extern PyObject *Nuitka_MakeFreeListStatisticsFunction(void);
+
 static inline bool Nuitka_Function_Check(PyObject *object) { return Py_TYPE(object) == &Nuitka_Function_Type; }
 
 static inline PyObject *Nuitka_Function_GetName(PyObject *object) {
     return ((struct Nuitka_FunctionObject *)object)->m_name;
 }
 
+// Check if an object is a compiled function with the given implementation,
+// which then has known parameters.
+static inline bool Nuitka_Function_CheckImpl(PyObject *object, function_impl_code c_code) {
+    return Nuitka_Function_Check(object) && ((struct Nuitka_FunctionObject *)object)->m_c_code == c_code;
+}
+
+// Call a compiled function through its implementation, after checking it with
+// "Nuitka_Function_CheckImpl", with exactly the positional arguments needed.
+static inline PyObject *Nuitka_CallFunctionImpl(PyThreadState *tstate, function_impl_code c_code, PyObject *called,
+                                                PyObject *const *args, Py_ssize_t args_size) {
+    assert(Nuitka_Function_CheckImpl(called, c_code));
+    assert(((struct Nuitka_FunctionObject *)called)->m_args_simple);
+    assert(((struct Nuitka_FunctionObject *)called)->m_args_positional_count == args_size);
+    CHECK_OBJECTS(args, args_size);
+
+    if (unlikely(Py_EnterRecursiveCall((char *)" while calling a Python object"))) {
+        return NULL;
+    }
+
+    for (Py_ssize_t i = 0; i < args_size; i++) {
+        Py_INCREF(args[i]);
+    }
+
+    PyObject *result = c_code(tstate, (struct Nuitka_FunctionObject const *)called, (PyObject **)args);
+
+    Py_LeaveRecursiveCall();
+
+    CHECK_OBJECT_X(result);
+
+    return result;
+}
+
 PyObject *Nuitka_CallFunctionNoArgs(PyThreadState *tstate, struct Nuitka_FunctionObject const *function);
 
 PyObject *Nuitka_CallFunctionPosArgs(PyThreadState *tstate, struct Nuitka_FunctionObject const *function,
@@ -13,12 +13,129 @@ static const bool use_freelists = false;
 static const bool use_freelists = true;
 #endif
 
+// The state of a free list, the current limit of entries to keep, and statistics
+// of its usage, for introspection via "__compiled__.free_list_stats" and to
+// adapt the limit at runtime.
+struct Nuitka_FreeListState {
+    // Entries to keep at most currently, and as configured for the build.
+    int limit;
+    int configured_limit;
+
+    // Highest number of entries kept at once.
+    int peak;
+
+    // Allocations that were served from the free list, and that were not.
+    size_t hits;
+    size_t misses;
+
+#if _NUITKA_FREE_LIST_ADAPTIVE
+    // Misses at the time the limit was last raised.
+    size_t grown_misses;
+
+    // Lowest number of entries kept since the last trimming, and allocations
+    // at that time.
+    int low_water;
+    size_t trimmed_allocations;
+#endif
+};
+
+#if _NUITKA_FREE_LIST_ADAPTIVE
+#define NUITKA_FREE_LIST_STATE_INIT(limit) {limit, limit, 0, 0, 0, 0, 0, 0}
+#else
+#define NUITKA_FREE_LIST_STATE_INIT(limit) {limit, limit, 0, 0, 0}
+#endif
+
+#if _NUITKA_FREE_LIST_ADAPTIVE
+// Free lists can grow up to this factor of their configured size.
+#define NUITKA_FREE_LIST_ADAPTIVE_FACTOR 16
+
+// A full free list, that allocations found empty since it was last grown, is
+// too small for the workload, so its limit is raised.
+static inline bool _Nuitka_FreeListGrow(struct Nuitka_FreeListState *state) {
+    int max_limit = state->configured_limit * NUITKA_FREE_LIST_ADAPTIVE_FACTOR;
+
+    if (state->misses == state->grown_misses || state->limit >= max_limit) {
+        return false;
+    }
+
+    state->limit = state->limit * 2 < max_limit ? state->limit * 2 : max_limit;
+    state->grown_misses = state->misses;
+
+    return true;
+}
+
+// Entries that stayed in the free list over as many allocations as it can hold,
+// were not needed, so a grown limit is lowered by that and they are released,
+// but never below the configured size.
+NUITKA_MAY_BE_UNUSED static void _Nuitka_FreeListTrim(void **free_list, int *free_list_count,
+                                                      struct Nuitka_FreeListState *state) {
+    size_t allocations = state->hits + state->misses;
+
+    if (allocations - state->trimmed_allocations < (size_t)state->limit) {
+        return;
+    }
+
+    if (state->low_water > 0 && state->limit > state->configured_limit) {
+        state->limit -= state->low_water;
+        if (state->limit < state->configured_limit) {
+            state->limit = state->configured_limit;
+        }
+
+        while (*free_list_count > state->limit) {
+            void *entry = *free_list;
+            *free_list = *((void **)entry);
+            *free_list_count -= 1;
+
+            PyObject_GC_Del(entry);
+        }
+    }
+
+    state->low_water = *free_list_count;
+    state->trimmed_allocations = allocations;
+}
+
+#define _NUITKA_FREE_LIST_LOW_WATER(count, state)                                                                      \
+    if ((count) < (state).low_water) {                                                                                 \
+        (state).low_water = (count);                                                                                   \
+    }
+#define _NUITKA_FREE_LIST_GROW(state) _Nuitka_FreeListGrow(&(state))
+#define _NUITKA_FREE_LIST_TRIM(free_list, count, state) _Nuitka_FreeListTrim((void **)&(free_list), &(count), &(state))
+#else
+#define _NUITKA_FREE_LIST_LOW_WATER(count, state)
+#define _NUITKA_FREE_LIST_GROW(state) false
+#define _NUITKA_FREE_LIST_TRIM(free_list, count, state)
+#endif
+
+#ifdef Py_GIL_DISABLED
+// Free lists are thread local, and are registered when first used by a thread,
+// so that their entries get released when it exits. After that, the thread
+// must not cache anything anymore.
+extern void Nuitka_ThreadCachesRegisterFreeList(void **free_list, int *free_list_count);
+
+NUITKA_MAY_BE_UNUSED NUITKA_THREAD_CACHE_STORAGE bool thread_caches_released = false;
+
+#define _NUITKA_FREE_LIST_DISABLED() (use_freelists == false || thread_caches_released)
+#define _NUITKA_FREE_LIST_REGISTER(free_list, count, state)                                                            \
+    if ((state).peak == 0) {                                                                                           \
+        Nuitka_ThreadCachesRegisterFreeList((void **)&(free_list), &(count));                                          \
+    }
+#else
+#define _NUITKA_FREE_LIST_DISABLED() (use_freelists == false)
+#define _NUITKA_FREE_LIST_REGISTER(free_list, count, state)
+#endif
+
+#define NUITKA_FREE_LIST_LOW_WATER(free_list) _NUITKA_FREE_LIST_LOW_WATER(free_list##_count, free_list##_state)
+#define NUITKA_FREE_LIST_GROW(free_list) _NUITKA_FREE_LIST_GROW(free_list##_state)
+#define NUITKA_FREE_LIST_TRIM(free_list) _NUITKA_FREE_LIST_TRIM(free_list, free_list##_count, free_list##_state)
+
 #define allocateFromFreeList(free_list, object_type, type_type, size)                                                  \
     if (free_list != NULL) {                                                                                           \
         result = free_list;                                                                                            \
         free_list = *((object_type **)free_list);                                                                      \
         free_list##_count -= 1;                                                                                        \
         assert(free_list##_count >= 0);                                                                                \
+        free_list##_state.hits += 1;                                                                                   \
+        NUITKA_FREE_LIST_LOW_WATER(free_list)                                                                          \
                                                                                                                        \
         if (Py_SIZE(result) < size) {                                                                                  \
             result = PyObject_GC_Resize(object_type, result, size);                                                    \
@@ -27,6 +144,7 @@ static const bool use_freelists = true;
                                                                                                                        \
         Nuitka_Py_NewReference((PyObject *)result);                                                                    \
     } else {                                                                                                           \
+        free_list##_state.misses += 1;                                                                                 \
         result = (object_type *)Nuitka_GC_NewVar(&type_type, size);                                                    \
     }                                                                                                                  \
     CHECK_OBJECT(result);
@@ -37,30 +155,106 @@ static const bool use_freelists = true;
         free_list = *((object_type **)free_list);                                                                      \
         free_list##_count -= 1;                                                                                        \
         assert(free_list##_count >= 0);                                                                                \
+        free_list##_state.hits += 1;                                                                                   \
+        NUITKA_FREE_LIST_LOW_WATER(free_list)                                                                          \
                                                                                                                        \
         Nuitka_Py_NewReference((PyObject *)result);                                                                    \
     } else {                                                                                                           \
+        free_list##_state.misses += 1;                                                                                 \
         result = (object_type *)Nuitka_GC_New(&type_type);                                                             \
     }                                                                                                                  \
     CHECK_OBJECT(result);
 
-#define releaseToFreeList(free_list, object, max_free_list_count)                                                      \
-    if (free_list != NULL || max_free_list_count == 0 || use_freelists == false) {                                     \
-        if (free_list##_count >= max_free_list_count) {                                                                \
-            PyObject_GC_Del(object);                                                                                   \
-        } else {                                                                                                       \
-            *((void **)object) = (void *)free_list;                                                                    \
-            free_list = object;                                                                                        \
-                                                                                                                       \
-            free_list##_count += 1;                                                                                    \
-        }                                                                                                              \
+#define releaseToFreeList(free_list, object)                                                                           \
+    if (_NUITKA_FREE_LIST_DISABLED() ||                                                                                \
+        (free_list##_count >= free_list##_state.limit && NUITKA_FREE_LIST_GROW(free_list) == false)) {                 \
+        PyObject_GC_Del(object);                                                                                       \
     } else {                                                                                                           \
+        _NUITKA_FREE_LIST_REGISTER(free_list, free_list##_count, free_list##_state)                                    \
+        *((void **)object) = (void *)free_list;                                                                        \
         free_list = object;                                                                                            \
-        *((void **)object) = NULL;                                                                                     \
-                                                                                                                       \
-        assert(free_list##_count == 0);                                                                                \
                                                                                                                        \
         free_list##_count += 1;                                                                                        \
+        if (free_list##_count > free_list##_state.peak) {                                                              \
+            free_list##_state.peak = free_list##_count;                                                                \
+        }                                                                                                              \
+    }                                                                                                                  \
+    NUITKA_FREE_LIST_TRIM(free_list)
+
+// Variable sized objects, e.g. generators with their heap storage, are kept
+// in free lists per size class, so that reuse does not depend on the first
+// free object being large enough. Class "i" holds objects with room for
+// exactly "base << i" items, and the last class holds all larger objects,
+// which are resized as necessary.
+#define NUITKA_FREE_LIST_SIZE_CLASSES 8
+
+#define NUITKA_FREE_LIST_STATES_INIT(limit)                                                                            \
+    {NUITKA_FREE_LIST_STATE_INIT(limit), NUITKA_FREE_LIST_STATE_INIT(limit), NUITKA_FREE_LIST_STATE_INIT(limit),       \
+     NUITKA_FREE_LIST_STATE_INIT(limit), NUITKA_FREE_LIST_STATE_INIT(limit), NUITKA_FREE_LIST_STATE_INIT(limit),       \
+     NUITKA_FREE_LIST_STATE_INIT(limit), NUITKA_FREE_LIST_STATE_INIT(limit)}
+
+static inline int Nuitka_FreeListSizeClass(Py_ssize_t size, Py_ssize_t base) {
+    int size_class = 0;
+
+    while (size > base && size_class < NUITKA_FREE_LIST_SIZE_CLASSES - 1) {
+        base <<= 1;
+        size_class += 1;
+    }
+
+    return size_class;
+}
+
+// Items to allocate for an object of a size class, only the last class uses
+// the requested size.
+static inline Py_ssize_t Nuitka_FreeListSizeClassCapacity(int size_class, Py_ssize_t size, Py_ssize_t base) {
+    return size_class < NUITKA_FREE_LIST_SIZE_CLASSES - 1 ? base << size_class : size;
+}
+
+#define allocateFromSizedFreeList(free_list, object_type, type_type, size, base)                                       \
+    {                                                                                                                  \
+        int size_class = Nuitka_FreeListSizeClass(size, base);                                                         \
+                                                                                                                       \
+        if (free_list[size_class] != NULL) {                                                                           \
+            result = free_list[size_class];                                                                            \
+            free_list[size_class] = *((object_type **)result);                                                         \
+            free_list##_count[size_class] -= 1;                                                                        \
+            assert(free_list##_count[size_class] >= 0);                                                                \
+            free_list##_state[size_class].hits += 1;                                                                   \
+            _NUITKA_FREE_LIST_LOW_WATER(free_list##_count[size_class], free_list##_state[size_class])                  \
+                                                                                                                       \
+            if (Py_SIZE(result) < size) {                                                                              \
+                result = PyObject_GC_Resize(object_type, result, size);                                                \
+                assert(result != NULL);                                                                                \
+            }                                                                                                          \
+                                                                                                                       \
+            Nuitka_Py_NewReference((PyObject *)result);                                                                \
+        } else {                                                                                                       \
+            free_list##_state[size_class].misses += 1;                                                                 \
+            result = (object_type *)Nuitka_GC_NewVar(&type_type,                                                       \
+                                                     Nuitka_FreeListSizeClassCapacity(size_class, size, base));        \
+        }                                                                                                              \
+    }                                                                                                                  \
+    CHECK_OBJECT(result);
+
+#define releaseToSizedFreeList(free_list, object, base)                                                                \
+    {                                                                                                                  \
+        int size_class = Nuitka_FreeListSizeClass(Py_SIZE(object), base);                                              \
+                                                                                                                       \
+        if (_NUITKA_FREE_LIST_DISABLED() || (free_list##_count[size_class] >= free_list##_state[size_class].limit &&   \
+                                             _NUITKA_FREE_LIST_GROW(free_list##_state[size_class]) == false)) {        \
+            PyObject_GC_Del(object);                                                                                   \
+        } else {                                                                                                       \
+            _NUITKA_FREE_LIST_REGISTER(free_list[size_class], free_list##_count[size_class],                           \
+                                       free_list##_state[size_class])                                                  \
+            *((void **)object) = (void *)free_list[size_class];                                                        \
+            free_list[size_class] = object;                                                                            \
+                                                                                                                       \
+            free_list##_count[size_class] += 1;                                                                        \
+            if (free_list##_count[size_class] > free_list##_state[size_class].peak) {                                  \
+                free_list##_state[size_class].peak = free_list##_count[size_class];                                    \
+            }                                                                                                          \
+        }                                                                                                              \
+        _NUITKA_FREE_LIST_TRIM(free_list[size_class], free_list##_count[size_class], free_list##_state[size_class])    \
     }
 
 #if PYTHON_VERSION >= 0x3d0
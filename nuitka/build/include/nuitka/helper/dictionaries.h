@@ -457,6 +457,9 @@ extern PyObject *MAKE_DICT_EMPTY(PyThreadState *tstate);
 #define MAKE_DICT_EMPTY(tstate) PyDict_New()
 #endif
 
+// Create an empty dictionary, presized for what is left in an iterator.
+extern PyObject *MAKE_DICT_FOR_ITERATOR(PyThreadState *tstate, PyObject *iterator);
+
 // Create a dictionary from key/value pairs.
 extern PyObject *MAKE_DICT(PyObject **pairs, Py_ssize_t size);
 // Create a dictionary from key/value pairs (NULL value means skip)
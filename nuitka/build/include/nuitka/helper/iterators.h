@@ -378,6 +378,50 @@ NUITKA_MAY_BE_UNUSED static bool UNPACK_ITERATOR_CHECK(PyThreadState *tstate,
     }
 }
 
+// Length of what is left of an iterator, if it is a built-in one where that
+// is cheap to ask and cannot run user code, otherwise -1 without an error.
+NUITKA_MAY_BE_UNUSED static Py_ssize_t ITERATOR_LENGTH_HINT(PyThreadState *tstate, PyObject *iterator) {
+#if PYTHON_VERSION >= 0x300
+    PyTypeObject *type = Py_TYPE(iterator);
+
+    // List and tuple iterators match the layout of sequence iterators.
+    if (type == &PyListIter_Type) {
+        seqiterobject *list_iterator = (seqiterobject *)iterator;
+
+        if (list_iterator->it_seq == NULL) {
+            return 0;
+        }
+
+        Py_ssize_t size = PyList_GET_SIZE(list_iterator->it_seq) - list_iterator->it_index;
+        return size > 0 ? size : 0;
+    } else if (type == &PyTupleIter_Type) {
+        seqiterobject *tuple_iterator = (seqiterobject *)iterator;
+
+        if (tuple_iterator->it_seq == NULL) {
+            return 0;
+        }
+
+        Py_ssize_t size = PyTuple_GET_SIZE(tuple_iterator->it_seq) - tuple_iterator->it_index;
+        return size > 0 ? size : 0;
+    }
+
+    if (type == &PyRangeIter_Type || type == &PyLongRangeIter_Type || type == &PyDictIterKey_Type ||
+        type == &PyDictIterValue_Type || type == &PyDictIterItem_Type || type == &PySetIter_Type) {
+        Py_ssize_t result = PyObject_LengthHint(iterator, -1);
+
+        if (unlikely(result < 0)) {
+            CLEAR_ERROR_OCCURRED(tstate);
+            return -1;
+        }
+
+        return result;
+    }
+#endif
+
+    // Python2 does not export the iterator types.
+    return -1;
+}
+
 #endif
 
 //     Part of "Nuitka", an optimizing Python compiler that is compatible and
@@ -24,6 +24,9 @@ extern PyObject *MAKE_LIST_EMPTY(PyThreadState *tstate, Py_ssize_t size);
 #define MAKE_LIST_EMPTY(tstate, size) PyList_New(size)
 #endif
 
+// Create an empty list, with space allocated for what is left in an iterator.
+extern PyObject *MAKE_LIST_FOR_ITERATOR(PyThreadState *tstate, PyObject *iterator);
+
 extern bool LIST_EXTEND_FROM_ITERABLE(PyThreadState *tstate, PyObject *list, PyObject *other);
 extern bool LIST_EXTEND_FOR_UNPACK(PyThreadState *tstate, PyObject *list, PyObject *other);
 
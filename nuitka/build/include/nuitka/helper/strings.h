@@ -11,6 +11,10 @@ extern PyObject *UNICODE_JOIN(PyThreadState *tstate, PyObject *str, PyObject *it
 extern PyObject *UNICODE_PARTITION(PyThreadState *tstate, PyObject *str, PyObject *sep);
 extern PyObject *UNICODE_RPARTITION(PyThreadState *tstate, PyObject *str, PyObject *sep);
 
+#if PYTHON_VERSION >= 0x300
+extern PyObject *UNICODE_JOIN_ARRAY(PyThreadState *tstate, PyObject *const *values, Py_ssize_t count);
+#endif
+
 extern PyObject *NuitkaUnicode_FromWideChar(wchar_t const *str, Py_ssize_t size);
 extern PyObject *Nuitka_Unicode_New(Py_ssize_t size, Py_UCS4 max_char);
 
@@ -238,6 +238,27 @@ NUITKA_MAY_BE_UNUSED static PyObject *LOOKUP_SUBSCRIPT(PyThreadState *tstate, Py
 #endif
 }
 
+// Lookup a subscript, but with "KeyError" not raised, instead indicated by
+// returning NULL without an error set. For dictionaries, the exception is not
+// even created.
+NUITKA_MAY_BE_UNUSED static PyObject *LOOKUP_SUBSCRIPT_NO_KEY_ERROR(PyThreadState *tstate, PyObject *source,
+                                                                   PyObject *subscript) {
+    CHECK_OBJECT(source);
+    CHECK_OBJECT(subscript);
+
+    if (PyDict_CheckExact(source)) {
+        return DICT_GET_ITEM_WITH_HASH_ERROR1(tstate, source, subscript);
+    }
+
+    PyObject *result = LOOKUP_SUBSCRIPT(tstate, source, subscript);
+
+    if (result == NULL) {
+        CHECK_AND_CLEAR_KEY_ERROR_OCCURRED(tstate);
+    }
+
+    return result;
+}
+
 bool MATCH_MAPPING_KEY(PyThreadState *tstate, PyObject *map, PyObject *key);
 
 NUITKA_MAY_BE_UNUSED static bool SET_SUBSCRIPT_CONST(PyThreadState *tstate, PyObject *target, PyObject *subscript,
@@ -373,6 +373,7 @@ extern PyObject *DEEP_COPY_SET(PyThreadState *tstate, PyObject *value);
 // Constants deep copies are guided by value type descriptions.
 extern PyObject *DEEP_COPY_LIST_GUIDED(PyThreadState *tstate, PyObject *value, char const *guide);
 extern PyObject *DEEP_COPY_TUPLE_GUIDED(PyThreadState *tstate, PyObject *value, char const *guide);
+extern PyObject *DEEP_COPY_DICT_GUIDED(PyThreadState *tstate, PyObject *value, char const *guide);
 
 // UnionType, normally not accessible
 extern PyTypeObject *Nuitka_PyUnion_Type;
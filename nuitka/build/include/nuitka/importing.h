@@ -31,6 +31,12 @@ extern PyObject *IMPORT_EMBEDDED_MODULE(PyThreadState *tstate, char const *name)
 // Execute a module, the module object is prepared empty, but with __name__.
 extern PyObject *EXECUTE_EMBEDDED_MODULE(PyThreadState *tstate, PyObject *module);
 
+// Import time report of embedded modules, enabled with "NUITKA_IMPORT_TIME"
+// at run time, modules report the time for creating their constants.
+extern bool Nuitka_import_time_enabled;
+extern uint64_t getImportTimeNow(void);
+extern void recordImportTimeConstants(uint64_t start_time);
+
 // Import a name from a module.
 extern PyObject *IMPORT_NAME_FROM_MODULE(PyThreadState *tstate, PyObject *module, PyObject *import_name);
 
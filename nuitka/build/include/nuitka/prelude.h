@@ -64,6 +64,22 @@
 #define NUITKA_MAY_BE_UNUSED
 #endif
 
+/* Storage for caches of reusable objects, i.e. free lists and cached frames.
+ * For free-threaded Python, sharing these between threads would need locking,
+ * instead every thread gets its own, which also scales best.
+ */
+#ifdef Py_GIL_DISABLED
+#if defined(__cplusplus)
+#define NUITKA_THREAD_CACHE_STORAGE static thread_local
+#elif defined(_MSC_VER) && !defined(__clang__)
+#define NUITKA_THREAD_CACHE_STORAGE static __declspec(thread)
+#else
+#define NUITKA_THREAD_CACHE_STORAGE static _Thread_local
+#endif
+#else
+#define NUITKA_THREAD_CACHE_STORAGE static
+#endif
+
 // We are not following the 3.10 change to an inline function. At least
 // not immediately.
 #if PYTHON_VERSION >= 0x3a0 && PYTHON_VERSION < 0x3c0
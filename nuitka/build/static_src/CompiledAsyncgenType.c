@@ -906,6 +906,12 @@ static PySendResult _Nuitka_Asyncgen_am_send(struct Nuitka_AsyncgenObject *async
     Py_INCREF(arg);
     PySendResult res = _Nuitka_Asyncgen_sendR(tstate, asyncgen, arg, false, &exception_state, result);
 
+    // Finished asyncgen have no return value, but raise like CPython does.
+    if (res == PYGEN_RETURN) {
+        SET_CURRENT_EXCEPTION_STOP_ASYNC_ITERATION(tstate);
+        res = PYGEN_ERROR;
+    }
+
 #if _DEBUG_ASYNCGEN
     PRINT_ASYNCGEN_STATUS("Leave", asyncgen);
     PRINT_COROUTINE_VALUE("result", *result);
@@ -955,9 +961,15 @@ static void Nuitka_Asyncgen_tp_finalize(struct Nuitka_AsyncgenObject *asyncgen)
     RESTORE_ERROR_OCCURRED_STATE(tstate, &saved_exception_state);
 }
 
+#ifndef MAX_ASYNCGEN_FREE_LIST_COUNT
 #define MAX_ASYNCGEN_FREE_LIST_COUNT 100
-static struct Nuitka_AsyncgenObject *free_list_asyncgens = NULL;
-static int free_list_asyncgens_count = 0;
+#endif
+// Smallest size class, in pointers for closure and heap storage.
+#define ASYNCGEN_FREE_LIST_SIZE_BASE 4
+NUITKA_THREAD_CACHE_STORAGE struct Nuitka_AsyncgenObject *free_list_asyncgens[NUITKA_FREE_LIST_SIZE_CLASSES] = {NULL};
+NUITKA_THREAD_CACHE_STORAGE int free_list_asyncgens_count[NUITKA_FREE_LIST_SIZE_CLASSES] = {0};
+NUITKA_THREAD_CACHE_STORAGE struct Nuitka_FreeListState free_list_asyncgens_state[NUITKA_FREE_LIST_SIZE_CLASSES] =
+    NUITKA_FREE_LIST_STATES_INIT(MAX_ASYNCGEN_FREE_LIST_COUNT);
 
 // TODO: This might have to be finalize actually.
 static void Nuitka_Asyncgen_tp_dealloc(struct Nuitka_AsyncgenObject *asyncgen) {
@@ -1002,7 +1014,7 @@ static void Nuitka_Asyncgen_tp_dealloc(struct Nuitka_AsyncgenObject *asyncgen) {
     _PyGC_CLEAR_FINALIZED((PyObject *)asyncgen);
 
     /* Put the object into free list or release to GC */
-    releaseToFreeList(free_list_asyncgens, asyncgen, MAX_ASYNCGEN_FREE_LIST_COUNT);
+    releaseToSizedFreeList(free_list_asyncgens, asyncgen, ASYNCGEN_FREE_LIST_SIZE_BASE);
 }
 
 static PyObject *Nuitka_Asyncgen_tp_repr(struct Nuitka_AsyncgenObject *asyncgen) {
@@ -1128,7 +1140,8 @@ PyObject *Nuitka_Asyncgen_New(asyncgen_code code, PyObject *module, PyObject *na
     Py_ssize_t full_size = closure_given + (heap_storage_size + sizeof(void *) - 1) / sizeof(void *);
 
     // Macro to assign result memory from GC or free list.
-    allocateFromFreeList(free_list_asyncgens, struct Nuitka_AsyncgenObject, Nuitka_Asyncgen_Type, full_size);
+    allocateFromSizedFreeList(free_list_asyncgens, struct Nuitka_AsyncgenObject, Nuitka_Asyncgen_Type, full_size,
+                              ASYNCGEN_FREE_LIST_SIZE_BASE);
 
     // For quicker access of generator heap.
     result->m_heap_storage = &result->m_closure[closure_given];
@@ -1194,8 +1207,10 @@ struct Nuitka_AsyncgenWrappedValueObject {
         PyObject *m_value;
 };
 
-static struct Nuitka_AsyncgenWrappedValueObject *free_list_asyncgen_value_wrappers = NULL;
-static int free_list_asyncgen_value_wrappers_count = 0;
+NUITKA_THREAD_CACHE_STORAGE struct Nuitka_AsyncgenWrappedValueObject *free_list_asyncgen_value_wrappers = NULL;
+NUITKA_THREAD_CACHE_STORAGE int free_list_asyncgen_value_wrappers_count = 0;
+NUITKA_THREAD_CACHE_STORAGE struct Nuitka_FreeListState free_list_asyncgen_value_wrappers_state =
+    NUITKA_FREE_LIST_STATE_INIT(MAX_ASYNCGEN_FREE_LIST_COUNT);
 
 static void Nuitka_AsyncgenValueWrapper_tp_dealloc(struct Nuitka_AsyncgenWrappedValueObject *asyncgen_value_wrapper) {
 #if _DEBUG_REFCOUNTS
@@ -1209,7 +1224,7 @@ static void Nuitka_AsyncgenValueWrapper_tp_dealloc(struct Nuitka_AsyncgenWrapped
     Py_DECREF(asyncgen_value_wrapper->m_value);
 
     /* Put the object into free list or release to GC */
-    releaseToFreeList(free_list_asyncgen_value_wrappers, asyncgen_value_wrapper, MAX_ASYNCGEN_FREE_LIST_COUNT);
+    releaseToFreeList(free_list_asyncgen_value_wrappers, asyncgen_value_wrapper);
 }
 
 static int Nuitka_AsyncgenValueWrapper_tp_traverse(struct Nuitka_AsyncgenWrappedValueObject *asyncgen_value_wrapper,
@@ -1357,12 +1372,12 @@ static PyTypeObject *Nuitka_PyAsyncGenWrappedValue_Type = NULL;
 #define _PyAsyncGenWrappedValue_CheckExact(o) (Py_TYPE(o) == Nuitka_PyAsyncGenWrappedValue_Type)
 #endif
 
-static PyObject *_Nuitka_Asyncgen_unwrap_value(PyThreadState *tstate, struct Nuitka_AsyncgenObject *asyncgen,
-                                               PyObject *result) {
+static PySendResult _Nuitka_Asyncgen_unwrap_valueR(PyThreadState *tstate, struct Nuitka_AsyncgenObject *asyncgen,
+                                                   PyObject *value, PyObject **result) {
     CHECK_OBJECT(asyncgen);
-    CHECK_OBJECT_X(result);
+    CHECK_OBJECT_X(value);
 
-    if (result == NULL) {
+    if (value == NULL) {
         PyObject *error = GET_ERROR_OCCURRED(tstate);
 
         if (error == NULL) {
@@ -1376,36 +1391,52 @@ static PyObject *_Nuitka_Asyncgen_unwrap_value(PyThreadState *tstate, struct Nui
 #if PYTHON_VERSION >= 0x380
         asyncgen->m_running_async = false;
 #endif
-        return NULL;
+        return PYGEN_ERROR;
     }
 
-    if (_PyAsyncGenWrappedValue_CheckExact(result)) {
-        /* async yield */
-        Nuitka_SetStopIterationValue(tstate, ((struct _PyAsyncGenWrappedValue *)result)->agw_val);
+    // For async yield, the value is the return value of the awaitable.
+    if (_PyAsyncGenWrappedValue_CheckExact(value)) {
+        *result = ((struct _PyAsyncGenWrappedValue *)value)->agw_val;
+    } else if (Nuitka_AsyncgenWrappedValue_CheckExact(value)) {
+        *result = ((struct Nuitka_AsyncgenWrappedValueObject *)value)->m_value;
+    } else {
+        *result = value;
+        return PYGEN_NEXT;
+    }
 
-        Py_DECREF(result);
+    Py_INCREF(*result);
+    Py_DECREF(value);
 
 #if PYTHON_VERSION >= 0x380
-        asyncgen->m_running_async = false;
+    asyncgen->m_running_async = false;
 #endif
-        return NULL;
-    } else if (Nuitka_AsyncgenWrappedValue_CheckExact(result)) {
-        /* async yield */
-        Nuitka_SetStopIterationValue(tstate, ((struct Nuitka_AsyncgenWrappedValueObject *)result)->m_value);
+    return PYGEN_RETURN;
+}
+
+static PyObject *_Nuitka_Asyncgen_unwrap_value(PyThreadState *tstate, struct Nuitka_AsyncgenObject *asyncgen,
+                                               PyObject *value) {
+    PyObject *result;
+    PySendResult res = _Nuitka_Asyncgen_unwrap_valueR(tstate, asyncgen, value, &result);
 
+    switch (res) {
+    case PYGEN_RETURN:
+        Nuitka_SetStopIterationValue(tstate, result);
         Py_DECREF(result);
 
-#if PYTHON_VERSION >= 0x380
-        asyncgen->m_running_async = false;
-#endif
         return NULL;
+    case PYGEN_NEXT:
+        return result;
+    case PYGEN_ERROR:
+        return NULL;
+    default:
+        NUITKA_CANNOT_GET_HERE("invalid _Nuitka_Asyncgen_unwrap_valueR result");
     }
-
-    return result;
 }
 
-static struct Nuitka_AsyncgenAsendObject *free_list_asyncgen_asends = NULL;
-static int free_list_asyncgen_asends_count = 0;
+NUITKA_THREAD_CACHE_STORAGE struct Nuitka_AsyncgenAsendObject *free_list_asyncgen_asends = NULL;
+NUITKA_THREAD_CACHE_STORAGE int free_list_asyncgen_asends_count = 0;
+NUITKA_THREAD_CACHE_STORAGE struct Nuitka_FreeListState free_list_asyncgen_asends_state =
+    NUITKA_FREE_LIST_STATE_INIT(MAX_ASYNCGEN_FREE_LIST_COUNT);
 
 static void Nuitka_AsyncgenAsend_tp_dealloc(struct Nuitka_AsyncgenAsendObject *asyncgen_asend) {
 #if _DEBUG_REFCOUNTS
@@ -1421,7 +1452,7 @@ static void Nuitka_AsyncgenAsend_tp_dealloc(struct Nuitka_AsyncgenAsendObject *a
     CHECK_OBJECT(asyncgen_asend->m_sendval);
     Py_DECREF(asyncgen_asend->m_sendval);
 
-    releaseToFreeList(free_list_asyncgen_asends, asyncgen_asend, MAX_ASYNCGEN_FREE_LIST_COUNT);
+    releaseToFreeList(free_list_asyncgen_asends, asyncgen_asend);
 }
 
 static int Nuitka_AsyncgenAsend_tp_traverse(struct Nuitka_AsyncgenAsendObject *asyncgen_asend, visitproc visit,
@@ -1437,15 +1468,15 @@ static int Nuitka_AsyncgenAsend_tp_traverse(struct Nuitka_AsyncgenAsendObject *a
     return 0;
 }
 
-static PyObject *_Nuitka_AsyncgenAsend_send(struct Nuitka_AsyncgenAsendObject *asyncgen_asend, PyObject *arg) {
+static PySendResult _Nuitka_AsyncgenAsend_sendR(PyThreadState *tstate,
+                                                struct Nuitka_AsyncgenAsendObject *asyncgen_asend, PyObject *arg,
+                                                PyObject **result) {
 #if _DEBUG_ASYNCGEN
     PRINT_ASYNCGEN_ASEND_STATUS("Enter", asyncgen_asend);
     PRINT_COROUTINE_VALUE("arg", arg);
     PRINT_NEW_LINE();
 #endif
 
-    PyThreadState *tstate = PyThreadState_GET();
-
     if (asyncgen_asend->m_state == AWAITABLE_STATE_CLOSED) {
 #if PYTHON_VERSION < 0x390
         SET_CURRENT_EXCEPTION_STOP_ITERATION_EMPTY(tstate);
@@ -1460,13 +1491,13 @@ static PyObject *_Nuitka_AsyncgenAsend_send(struct Nuitka_AsyncgenAsendObject *a
         PRINT_NEW_LINE();
 #endif
 
-        return NULL;
+        return PYGEN_ERROR;
     } else if (asyncgen_asend->m_state == AWAITABLE_STATE_INIT) {
 #if PYTHON_VERSION >= 0x380
         if (asyncgen_asend->m_gen->m_running_async) {
             SET_CURRENT_EXCEPTION_TYPE0_STR(tstate, PyExc_RuntimeError,
                                             "anext(): asynchronous generator is already running");
-            return NULL;
+            return PYGEN_ERROR;
         }
 #endif
         if (arg == NULL || arg == Py_None) {
@@ -1496,40 +1527,62 @@ static PyObject *_Nuitka_AsyncgenAsend_send(struct Nuitka_AsyncgenAsendObject *a
     struct Nuitka_ExceptionPreservationItem exception_state;
     INIT_ERROR_OCCURRED_STATE(&exception_state);
 
-    PyObject *result = _Nuitka_Asyncgen_send(tstate, asyncgen_asend->m_gen, arg, false, &exception_state);
+    PyObject *value = _Nuitka_Asyncgen_send(tstate, asyncgen_asend->m_gen, arg, false, &exception_state);
 
 #if _DEBUG_ASYNCGEN
     PRINT_ASYNCGEN_ASEND_STATUS("Returned from _Nuitka_Asyncgen_send", asyncgen_asend);
-    PRINT_COROUTINE_VALUE("result", result);
-    PRINT_CURRENT_EXCEPTION();
-#endif
-
-    result = _Nuitka_Asyncgen_unwrap_value(tstate, asyncgen_asend->m_gen, result);
-#if _DEBUG_ASYNCGEN
-    PRINT_ASYNCGEN_ASEND_STATUS("Returned from _Nuitka_Asyncgen_unwrap_value", asyncgen_asend);
-    PRINT_COROUTINE_VALUE("result", result);
+    PRINT_COROUTINE_VALUE("value", value);
     PRINT_CURRENT_EXCEPTION();
 #endif
 
-#if _DEBUG_ASYNCGEN
-    PRINT_COROUTINE_VALUE("result", result);
-    PRINT_CURRENT_EXCEPTION();
-    PRINT_NEW_LINE();
-#endif
+    PySendResult res = _Nuitka_Asyncgen_unwrap_valueR(tstate, asyncgen_asend->m_gen, value, result);
 
-    if (result == NULL) {
+    if (res != PYGEN_NEXT) {
         asyncgen_asend->m_state = AWAITABLE_STATE_CLOSED;
     }
 
 #if _DEBUG_ASYNCGEN
     PRINT_ASYNCGEN_ASEND_STATUS("Leave", asyncgen_asend);
-    PRINT_COROUTINE_VALUE("result", result);
+    PRINT_COROUTINE_VALUE("result", res != PYGEN_ERROR ? *result : NULL);
+    PRINT_CURRENT_EXCEPTION();
     PRINT_NEW_LINE();
 #endif
 
-    return result;
+    return res;
 }
 
+static PyObject *_Nuitka_AsyncgenAsend_send(struct Nuitka_AsyncgenAsendObject *asyncgen_asend, PyObject *arg) {
+    PyThreadState *tstate = PyThreadState_GET();
+
+    PyObject *result;
+    PySendResult res = _Nuitka_AsyncgenAsend_sendR(tstate, asyncgen_asend, arg, &result);
+
+    switch (res) {
+    case PYGEN_RETURN:
+        Nuitka_SetStopIterationValue(tstate, result);
+        Py_DECREF(result);
+
+        return NULL;
+    case PYGEN_NEXT:
+        return result;
+    case PYGEN_ERROR:
+        return NULL;
+    default:
+        NUITKA_CANNOT_GET_HERE("invalid _Nuitka_AsyncgenAsend_sendR result");
+    }
+}
+
+#if PYTHON_VERSION >= 0x3a0
+// The "PyIter_Send" interface, which avoids creating "StopIteration" for the
+// value produced by the async generator.
+static PySendResult _Nuitka_AsyncgenAsend_am_send(struct Nuitka_AsyncgenAsendObject *asyncgen_asend, PyObject *arg,
+                                                  PyObject **result) {
+    PyThreadState *tstate = PyThreadState_GET();
+
+    return _Nuitka_AsyncgenAsend_sendR(tstate, asyncgen_asend, arg, result);
+}
+#endif
+
 static PyObject *Nuitka_AsyncgenAsend_send(PyObject *asyncgen_asend_obj, PyObject *arg) {
     return _Nuitka_AsyncgenAsend_send((struct Nuitka_AsyncgenAsendObject *)asyncgen_asend_obj, arg);
 }
@@ -1679,6 +1732,10 @@ static PyAsyncMethods Nuitka_AsyncgenAsend_as_async = {
     0, // am_await (PyObject_SelfIter)
     0, // am_aiter
     0  // am_anext
+#if PYTHON_VERSION >= 0x3a0
+    ,
+    (sendfunc)_Nuitka_AsyncgenAsend_am_send // am_send
+#endif
 };
 
 static PyTypeObject Nuitka_AsyncgenAsend_Type = {
@@ -1796,8 +1853,10 @@ NUITKA_MAY_BE_UNUSED static void _PRINT_ASYNCGEN_ATHROW_STATUS(char const *descr
 
 #endif
 
-static struct Nuitka_AsyncgenAthrowObject *free_list_asyncgen_athrows = NULL;
-static int free_list_asyncgen_athrows_count = 0;
+NUITKA_THREAD_CACHE_STORAGE struct Nuitka_AsyncgenAthrowObject *free_list_asyncgen_athrows = NULL;
+NUITKA_THREAD_CACHE_STORAGE int free_list_asyncgen_athrows_count = 0;
+NUITKA_THREAD_CACHE_STORAGE struct Nuitka_FreeListState free_list_asyncgen_athrows_state =
+    NUITKA_FREE_LIST_STATE_INIT(MAX_ASYNCGEN_FREE_LIST_COUNT);
 
 static void Nuitka_AsyncgenAthrow_dealloc(struct Nuitka_AsyncgenAthrowObject *asyncgen_athrow) {
 #if _DEBUG_REFCOUNTS
@@ -1814,7 +1873,7 @@ static void Nuitka_AsyncgenAthrow_dealloc(struct Nuitka_AsyncgenAthrowObject *as
     Py_XDECREF(asyncgen_athrow->m_args);
 
     /* Put the object into free list or release to GC */
-    releaseToFreeList(free_list_asyncgen_athrows, asyncgen_athrow, MAX_ASYNCGEN_FREE_LIST_COUNT);
+    releaseToFreeList(free_list_asyncgen_athrows, asyncgen_athrow);
 }
 
 static int Nuitka_AsyncgenAthrow_traverse(struct Nuitka_AsyncgenAthrowObject *asyncgen_athrow, visitproc visit,
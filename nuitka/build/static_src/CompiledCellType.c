@@ -23,9 +23,13 @@ int count_released_Nuitka_Cell_Type;
 #endif
 
 // Freelist setup
+#ifndef MAX_CELL_FREE_LIST_COUNT
 #define MAX_CELL_FREE_LIST_COUNT 1000
-static struct Nuitka_CellObject *free_list_cells = NULL;
-static int free_list_cells_count = 0;
+#endif
+NUITKA_THREAD_CACHE_STORAGE struct Nuitka_CellObject *free_list_cells = NULL;
+NUITKA_THREAD_CACHE_STORAGE int free_list_cells_count = 0;
+NUITKA_THREAD_CACHE_STORAGE struct Nuitka_FreeListState free_list_cells_state =
+    NUITKA_FREE_LIST_STATE_INIT(MAX_CELL_FREE_LIST_COUNT);
 
 static void Nuitka_Cell_tp_dealloc(struct Nuitka_CellObject *cell) {
 #if _DEBUG_REFCOUNTS
@@ -36,7 +40,7 @@ static void Nuitka_Cell_tp_dealloc(struct Nuitka_CellObject *cell) {
     Nuitka_GC_UnTrack(cell);
     Py_XDECREF(cell->ob_ref);
 
-    releaseToFreeList(free_list_cells, cell, MAX_CELL_FREE_LIST_COUNT);
+    releaseToFreeList(free_list_cells, cell);
 }
 
 #if PYTHON_VERSION < 0x300
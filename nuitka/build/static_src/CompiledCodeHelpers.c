@@ -2232,6 +2232,10 @@ PyObject *MAKE_UNION_TYPE(PyObject *args) {
 
 #include "MetaPathBasedLoader.c"
 
+#ifdef Py_GIL_DISABLED
+#include "HelpersThreadCaches.c"
+#endif
+
 #ifdef _NUITKA_EXPERIMENTAL_DUMP_C_TRACEBACKS
 #include "HelpersDumpBacktraces.c"
 #endif
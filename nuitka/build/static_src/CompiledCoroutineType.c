@@ -234,7 +234,25 @@ static PyObject *_Nuitka_YieldFromCore(PyThreadState *tstate, PyObject *yield_fr
 
         retval =
             _Nuitka_Coroutine_send(tstate, yield_from_coroutine, Py_None, mode ? false : true, &no_exception_state);
-    } else if (send_value == Py_None && Py_TYPE(yield_from)->tp_iternext != NULL) {
+    }
+#if PYTHON_VERSION >= 0x3a0
+    // The "PyIter_Send" interface gives the return value without raising
+    // "StopIteration", e.g. for compiled coroutines and "asyncio" futures.
+    else if (Py_TYPE(yield_from)->tp_as_async != NULL && Py_TYPE(yield_from)->tp_as_async->am_send != NULL) {
+        PySendResult res = Py_TYPE(yield_from)->tp_as_async->am_send(yield_from, send_value, &retval);
+
+        if (res == PYGEN_RETURN) {
+            CHECK_OBJECT(retval);
+            assert(!HAS_ERROR_OCCURRED(tstate));
+
+            *returned_value = retval;
+            return NULL;
+        } else if (res == PYGEN_ERROR) {
+            retval = NULL;
+        }
+    }
+#endif
+    else if (send_value == Py_None && Py_TYPE(yield_from)->tp_iternext != NULL) {
         retval = Py_TYPE(yield_from)->tp_iternext(yield_from);
     } else {
 #if 0
@@ -1017,8 +1035,14 @@ static long Nuitka_Coroutine_tp_traverse(struct Nuitka_CoroutineObject *coroutin
     return 0;
 }
 
-static struct Nuitka_CoroutineWrapperObject *free_list_coro_wrappers = NULL;
-static int free_list_coro_wrappers_count = 0;
+// Freelist setup
+#ifndef MAX_COROUTINE_FREE_LIST_COUNT
+#define MAX_COROUTINE_FREE_LIST_COUNT 100
+#endif
+NUITKA_THREAD_CACHE_STORAGE struct Nuitka_CoroutineWrapperObject *free_list_coro_wrappers = NULL;
+NUITKA_THREAD_CACHE_STORAGE int free_list_coro_wrappers_count = 0;
+NUITKA_THREAD_CACHE_STORAGE struct Nuitka_FreeListState free_list_coro_wrappers_state =
+    NUITKA_FREE_LIST_STATE_INIT(MAX_COROUTINE_FREE_LIST_COUNT);
 
 static PyObject *Nuitka_Coroutine_await(struct Nuitka_CoroutineObject *coroutine) {
     CHECK_OBJECT(coroutine);
@@ -1066,6 +1090,12 @@ static PySendResult _Nuitka_Coroutine_am_send(struct Nuitka_CoroutineObject *cor
 
     PySendResult res = _Nuitka_Coroutine_sendR(tstate, coroutine, arg, false, &exception_state, result);
 
+    // The protocol requires a value for return, also when there is none.
+    if (res == PYGEN_RETURN && *result == NULL) {
+        Py_INCREF_IMMORTAL(Py_None);
+        *result = Py_None;
+    }
+
 #if _DEBUG_COROUTINE
     PRINT_COROUTINE_STATUS("Leave", coroutine);
     PRINT_COROUTINE_VALUE("result", *result);
@@ -1096,9 +1126,12 @@ static void Nuitka_Coroutine_tp_finalize(struct Nuitka_CoroutineObject *coroutin
 }
 
 // Freelist setup
-#define MAX_COROUTINE_FREE_LIST_COUNT 100
-static struct Nuitka_CoroutineObject *free_list_coroutines = NULL;
-static int free_list_coroutines_count = 0;
+// Smallest size class, in pointers for closure and heap storage.
+#define COROUTINE_FREE_LIST_SIZE_BASE 4
+NUITKA_THREAD_CACHE_STORAGE struct Nuitka_CoroutineObject *free_list_coroutines[NUITKA_FREE_LIST_SIZE_CLASSES] = {NULL};
+NUITKA_THREAD_CACHE_STORAGE int free_list_coroutines_count[NUITKA_FREE_LIST_SIZE_CLASSES] = {0};
+NUITKA_THREAD_CACHE_STORAGE struct Nuitka_FreeListState free_list_coroutines_state[NUITKA_FREE_LIST_SIZE_CLASSES] =
+    NUITKA_FREE_LIST_STATES_INIT(MAX_COROUTINE_FREE_LIST_COUNT);
 
 static void Nuitka_Coroutine_tp_dealloc(struct Nuitka_CoroutineObject *coroutine) {
 #if _DEBUG_REFCOUNTS
@@ -1149,7 +1182,7 @@ static void Nuitka_Coroutine_tp_dealloc(struct Nuitka_CoroutineObject *coroutine
     _PyGC_CLEAR_FINALIZED((PyObject *)coroutine);
 
     /* Put the object into free list or release to GC */
-    releaseToFreeList(free_list_coroutines, coroutine, MAX_COROUTINE_FREE_LIST_COUNT);
+    releaseToSizedFreeList(free_list_coroutines, coroutine, COROUTINE_FREE_LIST_SIZE_BASE);
 }
 
 // TODO: Set "__doc__" automatically for method clones of compiled types from
@@ -1257,7 +1290,7 @@ static void Nuitka_CoroutineWrapper_tp_dealloc(struct Nuitka_CoroutineWrapperObj
     assert(Py_REFCNT(cw) == 1);
     Py_SET_REFCNT(cw, 0);
 
-    releaseToFreeList(free_list_coro_wrappers, cw, MAX_COROUTINE_FREE_LIST_COUNT);
+    releaseToFreeList(free_list_coro_wrappers, cw);
 }
 
 static PyObject *Nuitka_CoroutineWrapper_tp_iternext(struct Nuitka_CoroutineWrapperObject *cw) {
@@ -1454,7 +1487,8 @@ PyObject *Nuitka_Coroutine_New(PyThreadState *tstate, coroutine_code code, PyObj
     Py_ssize_t full_size = closure_given + (heap_storage_size + sizeof(void *) - 1) / sizeof(void *);
 
     // Macro to assign result memory from GC or free list.
-    allocateFromFreeList(free_list_coroutines, struct Nuitka_CoroutineObject, Nuitka_Coroutine_Type, full_size);
+    allocateFromSizedFreeList(free_list_coroutines, struct Nuitka_CoroutineObject, Nuitka_Coroutine_Type, full_size,
+                              COROUTINE_FREE_LIST_SIZE_BASE);
 
     // For quicker access of generator heap.
     result->m_heap_storage = &result->m_closure[closure_given];
@@ -1709,8 +1743,10 @@ static int Nuitka_AIterWrapper_traverse(struct Nuitka_AIterWrapper *aw, visitpro
     return 0;
 }
 
-static struct Nuitka_AIterWrapper *free_list_coroutine_aiter_wrappers = NULL;
-static int free_list_coroutine_aiter_wrappers_count = 0;
+NUITKA_THREAD_CACHE_STORAGE struct Nuitka_AIterWrapper *free_list_coroutine_aiter_wrappers = NULL;
+NUITKA_THREAD_CACHE_STORAGE int free_list_coroutine_aiter_wrappers_count = 0;
+NUITKA_THREAD_CACHE_STORAGE struct Nuitka_FreeListState free_list_coroutine_aiter_wrappers_state =
+    NUITKA_FREE_LIST_STATE_INIT(MAX_COROUTINE_FREE_LIST_COUNT);
 
 static void Nuitka_AIterWrapper_dealloc(struct Nuitka_AIterWrapper *aw) {
 #if _DEBUG_REFCOUNTS
@@ -1724,7 +1760,7 @@ static void Nuitka_AIterWrapper_dealloc(struct Nuitka_AIterWrapper *aw) {
     Py_DECREF(aw->aw_aiter);
 
     /* Put the object into free list or release to GC */
-    releaseToFreeList(free_list_coroutine_aiter_wrappers, aw, MAX_COROUTINE_FREE_LIST_COUNT);
+    releaseToFreeList(free_list_coroutine_aiter_wrappers, aw);
 }
 
 static PyAsyncMethods Nuitka_AIterWrapper_as_async = {
@@ -421,9 +421,15 @@ static int Nuitka_Frame_tp_clear(PyObject *frame_obj) {
 }
 
 // Freelist setup
+#ifndef MAX_FRAME_FREE_LIST_COUNT
 #define MAX_FRAME_FREE_LIST_COUNT 100
-static struct Nuitka_FrameObject *free_list_frames = NULL;
-static int free_list_frames_count = 0;
+#endif
+// Smallest size class, in bytes for locals storage.
+#define FRAME_FREE_LIST_SIZE_BASE 16
+NUITKA_THREAD_CACHE_STORAGE struct Nuitka_FrameObject *free_list_frames[NUITKA_FREE_LIST_SIZE_CLASSES] = {NULL};
+NUITKA_THREAD_CACHE_STORAGE int free_list_frames_count[NUITKA_FREE_LIST_SIZE_CLASSES] = {0};
+NUITKA_THREAD_CACHE_STORAGE struct Nuitka_FreeListState free_list_frames_state[NUITKA_FREE_LIST_SIZE_CLASSES] =
+    NUITKA_FREE_LIST_STATES_INIT(MAX_FRAME_FREE_LIST_COUNT);
 
 static void Nuitka_Frame_tp_dealloc(struct Nuitka_FrameObject *nuitka_frame) {
 #if _DEBUG_REFCOUNTS
@@ -478,7 +484,7 @@ static void Nuitka_Frame_tp_dealloc(struct Nuitka_FrameObject *nuitka_frame) {
     Py_SET_SIZE(nuitka_frame, nuitka_frame->m_ob_size);
 #endif
 
-    releaseToFreeList(free_list_frames, nuitka_frame, MAX_FRAME_FREE_LIST_COUNT);
+    releaseToSizedFreeList(free_list_frames, nuitka_frame, FRAME_FREE_LIST_SIZE_BASE);
 
 #ifndef __NUITKA_NO_ASSERT__
     struct Nuitka_ExceptionPreservationItem saved_exception_state2;
@@ -775,7 +781,8 @@ static struct Nuitka_FrameObject *_MAKE_COMPILED_FRAME(PyCodeObject *code, PyObj
     struct Nuitka_FrameObject *result;
 
     // Macro to assign result memory from GC or free list.
-    allocateFromFreeList(free_list_frames, struct Nuitka_FrameObject, Nuitka_Frame_Type, locals_size);
+    allocateFromSizedFreeList(free_list_frames, struct Nuitka_FrameObject, Nuitka_Frame_Type, locals_size,
+                              FRAME_FREE_LIST_SIZE_BASE);
 
     result->m_type_description = NULL;
 
@@ -870,9 +870,13 @@ static PyObject *Nuitka_Function_clone(struct Nuitka_FunctionObject *function, P
 }
 
 // Freelist setup
+#ifndef MAX_FUNCTION_FREE_LIST_COUNT
 #define MAX_FUNCTION_FREE_LIST_COUNT 100
-static struct Nuitka_FunctionObject *free_list_functions = NULL;
-static int free_list_functions_count = 0;
+#endif
+NUITKA_THREAD_CACHE_STORAGE struct Nuitka_FunctionObject *free_list_functions = NULL;
+NUITKA_THREAD_CACHE_STORAGE int free_list_functions_count = 0;
+NUITKA_THREAD_CACHE_STORAGE struct Nuitka_FreeListState free_list_functions_state =
+    NUITKA_FREE_LIST_STATE_INIT(MAX_FUNCTION_FREE_LIST_COUNT);
 
 static void Nuitka_Function_tp_dealloc(struct Nuitka_FunctionObject *function) {
 #if _DEBUG_REFCOUNTS
@@ -931,7 +935,7 @@ static void Nuitka_Function_tp_dealloc(struct Nuitka_FunctionObject *function) {
     }
 
     /* Put the object into free list or release to GC */
-    releaseToFreeList(free_list_functions, function, MAX_FUNCTION_FREE_LIST_COUNT);
+    releaseToFreeList(free_list_functions, function);
 
 #ifndef __NUITKA_NO_ASSERT__
     struct Nuitka_ExceptionPreservationItem saved_exception_state2;
@@ -3468,6 +3472,103 @@ static PyObject *Nuitka_Function_tp_vectorcall(struct Nuitka_FunctionObject *fun
 
 #include "InspectPatcher.c"
 
+static PyObject *_makeFreeListStatistics(int count, struct Nuitka_FreeListState const *state) {
+    PyObject *stats = Py_BuildValue("{s:i,s:i,s:i,s:i,s:n,s:n}", "count", count, "limit", state->limit,
+                                    "configured_limit", state->configured_limit, "peak", state->peak, "hits",
+                                    (Py_ssize_t)state->hits, "misses", (Py_ssize_t)state->misses);
+    CHECK_OBJECT(stats);
+
+    return stats;
+}
+
+static void _addFreeListStatistics(PyObject *result, char const *name, int count,
+                                   struct Nuitka_FreeListState const *state) {
+    PyObject *stats = _makeFreeListStatistics(count, state);
+
+    PyDict_SetItemString(result, name, stats);
+    Py_DECREF(stats);
+}
+
+// Free lists with size classes are reported summed up, and in debug mode with
+// the statistics per size class too, keyed by the capacity of its objects.
+static void _addSizedFreeListStatistics(PyObject *result, char const *name, int const *counts,
+                                        struct Nuitka_FreeListState const *states, Py_ssize_t base) {
+    int count = 0;
+    struct Nuitka_FreeListState total = NUITKA_FREE_LIST_STATE_INIT(0);
+
+    for (int i = 0; i < NUITKA_FREE_LIST_SIZE_CLASSES; i++) {
+        count += counts[i];
+        total.limit += states[i].limit;
+        total.configured_limit += states[i].configured_limit;
+        total.peak += states[i].peak;
+        total.hits += states[i].hits;
+        total.misses += states[i].misses;
+    }
+
+    PyObject *stats = _makeFreeListStatistics(count, &total);
+
+#ifndef __NUITKA_NO_ASSERT__
+    PyObject *size_classes = MAKE_DICT_EMPTY(PyThreadState_GET());
+
+    for (int i = 0; i < NUITKA_FREE_LIST_SIZE_CLASSES; i++) {
+        PyObject *key =
+            i < NUITKA_FREE_LIST_SIZE_CLASSES - 1 ? PyLong_FromSsize_t(base << i) : Nuitka_String_FromString("larger");
+        PyObject *size_class_stats = _makeFreeListStatistics(counts[i], &states[i]);
+
+        PyDict_SetItem(size_classes, key, size_class_stats);
+
+        Py_DECREF(key);
+        Py_DECREF(size_class_stats);
+    }
+
+    PyDict_SetItemString(stats, "size_classes", size_classes);
+    Py_DECREF(size_classes);
+#endif
+
+    PyDict_SetItemString(result, name, stats);
+    Py_DECREF(stats);
+}
+
+// Statistics of the free lists of compiled objects, of the current thread only
+// for free-threaded Python.
+static PyObject *Nuitka_getFreeListStatistics(PyObject *self, PyObject *unused) {
+    PyObject *result = MAKE_DICT_EMPTY(PyThreadState_GET());
+
+    _addFreeListStatistics(result, "function", free_list_functions_count, &free_list_functions_state);
+    _addFreeListStatistics(result, "method", free_list_methods_count, &free_list_methods_state);
+    _addSizedFreeListStatistics(result, "generator", free_list_generators_count, free_list_generators_state,
+                                GENERATOR_FREE_LIST_SIZE_BASE);
+#if PYTHON_VERSION >= 0x350
+    _addSizedFreeListStatistics(result, "coroutine", free_list_coroutines_count, free_list_coroutines_state,
+                                COROUTINE_FREE_LIST_SIZE_BASE);
+    _addFreeListStatistics(result, "coroutine_wrapper", free_list_coro_wrappers_count, &free_list_coro_wrappers_state);
+    _addFreeListStatistics(result, "coroutine_aiter_wrapper", free_list_coroutine_aiter_wrappers_count,
+                           &free_list_coroutine_aiter_wrappers_state);
+#endif
+#if PYTHON_VERSION >= 0x360
+    _addSizedFreeListStatistics(result, "asyncgen", free_list_asyncgens_count, free_list_asyncgens_state,
+                                ASYNCGEN_FREE_LIST_SIZE_BASE);
+    _addFreeListStatistics(result, "asyncgen_value_wrapper", free_list_asyncgen_value_wrappers_count,
+                           &free_list_asyncgen_value_wrappers_state);
+    _addFreeListStatistics(result, "asyncgen_asend", free_list_asyncgen_asends_count, &free_list_asyncgen_asends_state);
+    _addFreeListStatistics(result, "asyncgen_athrow", free_list_asyncgen_athrows_count,
+                           &free_list_asyncgen_athrows_state);
+#endif
+    _addSizedFreeListStatistics(result, "frame", free_list_frames_count, free_list_frames_state,
+                                FRAME_FREE_LIST_SIZE_BASE);
+    _addFreeListStatistics(result, "cell", free_list_cells_count, &free_list_cells_state);
+    _addFreeListStatistics(result, "traceback", free_list_tracebacks_count, &free_list_tracebacks_state);
+
+    return result;
+}
+
+static PyMethodDef _method_def_free_list_stats = {"free_list_stats", (PyCFunction)Nuitka_getFreeListStatistics,
+                                                  METH_NOARGS, NULL};
+
+PyObject *Nuitka_MakeFreeListStatisticsFunction(void) {
+    return PyCFunction_New(&_method_def_free_list_stats, NULL);
+}
+
 //     Part of "Nuitka", an optimizing Python compiler that is compatible and
 //     integrates with CPython, but also works on its own.
 //
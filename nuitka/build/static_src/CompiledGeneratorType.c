@@ -408,6 +408,23 @@ static PyObject *_Nuitka_YieldFromGeneratorCore(PyThreadState *tstate, struct Nu
     else if (PyCoro_CheckExact(yield_from)) {
         retval = Nuitka_PyGen_Send(tstate, (PyGenObject *)yield_from, Py_None);
     }
+#endif
+#if PYTHON_VERSION >= 0x3a0
+    // The "PyIter_Send" interface gives the return value without raising
+    // "StopIteration", e.g. for compiled generators.
+    else if (Py_TYPE(yield_from)->tp_as_async != NULL && Py_TYPE(yield_from)->tp_as_async->am_send != NULL) {
+        PySendResult res = Py_TYPE(yield_from)->tp_as_async->am_send(yield_from, send_value, &retval);
+
+        if (res == PYGEN_RETURN) {
+            CHECK_OBJECT(retval);
+            assert(!HAS_ERROR_OCCURRED(tstate));
+
+            generator->m_returned = retval;
+            return NULL;
+        } else if (res == PYGEN_ERROR) {
+            retval = NULL;
+        }
+    }
 #endif
     else if (send_value == Py_None && Py_TYPE(yield_from)->tp_iternext != NULL) {
         retval = Py_TYPE(yield_from)->tp_iternext(yield_from);
@@ -550,8 +567,9 @@ static void RAISE_RUNTIME_ERROR_RAISED_STOP_ITERATION(PyThreadState *tstate, cha
 }
 #endif
 
-static PyObject *_Nuitka_Generator_send(PyThreadState *tstate, struct Nuitka_GeneratorObject *generator,
-                                        PyObject *value, struct Nuitka_ExceptionPreservationItem *exception_state) {
+static PySendResult _Nuitka_Generator_sendR(PyThreadState *tstate, struct Nuitka_GeneratorObject *generator,
+                                            PyObject *value, struct Nuitka_ExceptionPreservationItem *exception_state,
+                                            PyObject **result) {
     CHECK_OBJECT(generator);
     assert(Nuitka_Generator_Check((PyObject *)generator));
     CHECK_EXCEPTION_STATE_X(exception_state);
@@ -574,7 +592,7 @@ static PyObject *_Nuitka_Generator_send(PyThreadState *tstate, struct Nuitka_Gen
             Py_XDECREF(value);
 
             SET_CURRENT_EXCEPTION_TYPE0_STR(tstate, PyExc_ValueError, "generator already executing");
-            return NULL;
+            return PYGEN_ERROR;
         }
 
 #if PYTHON_VERSION < 0x300
@@ -701,31 +719,32 @@ static PyObject *_Nuitka_Generator_send(PyThreadState *tstate, struct Nuitka_Gen
                 GET_ERROR_OCCURRED(tstate) == PyExc_StopIteration) {
                 RAISE_RUNTIME_ERROR_RAISED_STOP_ITERATION(tstate, "generator raised StopIteration");
 
-                return NULL;
+                return PYGEN_ERROR;
             }
 #endif
 
-            // Create StopIteration if necessary, i.e. return value that is not "None" was
-            // given. TODO: Push this further down the user line, we might be able to avoid
-            // it for some uses, e.g. quick iteration entirely.
+            // Return value is given to the caller, which creates StopIteration only if
+            // necessary, "am_send" users do not need it.
 #if PYTHON_VERSION >= 0x300
             if (generator->m_returned) {
-                if (generator->m_returned != Py_None) {
-                    Nuitka_SetStopIterationValue(tstate, generator->m_returned);
-                }
-
-                Py_DECREF(generator->m_returned);
+                *result = generator->m_returned;
                 generator->m_returned = NULL;
 
 #if _DEBUG_GENERATOR
-                PRINT_GENERATOR_STATUS("Return value to exception set", generator);
-                PRINT_CURRENT_EXCEPTION();
+                PRINT_GENERATOR_STATUS("Return value given", generator);
+                PRINT_COROUTINE_VALUE("return_value", *result);
                 PRINT_NEW_LINE();
 #endif
+                return PYGEN_RETURN;
             }
 #endif
 
-            return NULL;
+            if (HAS_ERROR_OCCURRED(tstate)) {
+                return PYGEN_ERROR;
+            }
+
+            *result = NULL;
+            return PYGEN_RETURN;
         } else {
 #if _NUITKA_MAINTAIN_SYS_EXC_VARS
             PyObject *old_type = tstate->exc_type;
@@ -781,7 +800,8 @@ static PyObject *_Nuitka_Generator_send(PyThreadState *tstate, struct Nuitka_Gen
             }
 #endif
 
-            return yielded;
+            *result = yielded;
+            return PYGEN_NEXT;
         }
     } else {
         Py_XDECREF(value);
@@ -789,7 +809,35 @@ static PyObject *_Nuitka_Generator_send(PyThreadState *tstate, struct Nuitka_Gen
         // Release exception if any, we are finished with it and will raise another.
         RELEASE_ERROR_OCCURRED_STATE_X(exception_state);
 
+        *result = NULL;
+        return PYGEN_RETURN;
+    }
+}
+
+static PyObject *_Nuitka_Generator_send(PyThreadState *tstate, struct Nuitka_GeneratorObject *generator,
+                                        PyObject *value, struct Nuitka_ExceptionPreservationItem *exception_state) {
+    PyObject *result;
+    PySendResult res = _Nuitka_Generator_sendR(tstate, generator, value, exception_state, &result);
+
+    switch (res) {
+    case PYGEN_RETURN:
+        // Create StopIteration if necessary, i.e. return value that is not "None" was
+        // given.
+        if (result != NULL) {
+            if (result != Py_None) {
+                Nuitka_SetStopIterationValue(tstate, result);
+            }
+
+            Py_DECREF(result);
+        }
+
+        return NULL;
+    case PYGEN_NEXT:
+        return result;
+    case PYGEN_ERROR:
         return NULL;
+    default:
+        NUITKA_CANNOT_GET_HERE("invalid _Nuitka_Generator_sendR result");
     }
 }
 
@@ -826,6 +874,43 @@ static PyObject *Nuitka_Generator_send(struct Nuitka_GeneratorObject *generator,
     return result;
 }
 
+#if PYTHON_VERSION >= 0x3a0
+// The "PyIter_Send" interface, which avoids creating "StopIteration" for the
+// return value.
+static PySendResult _Nuitka_Generator_am_send(struct Nuitka_GeneratorObject *generator, PyObject *arg,
+                                              PyObject **result) {
+    CHECK_OBJECT(arg);
+
+    PyThreadState *tstate = PyThreadState_GET();
+
+    if (generator->m_status == status_Unused && arg != Py_None) {
+#if PYTHON_VERSION < 0x3a2
+        Nuitka_MarkGeneratorAsFinished(generator);
+#endif
+
+        SET_CURRENT_EXCEPTION_TYPE0_STR(tstate, PyExc_TypeError,
+                                        "can't send non-None value to a just-started generator");
+        return PYGEN_ERROR;
+    }
+
+    // We need to transfer ownership of the sent value.
+    Py_INCREF(arg);
+
+    struct Nuitka_ExceptionPreservationItem exception_state;
+    INIT_ERROR_OCCURRED_STATE(&exception_state);
+
+    PySendResult res = _Nuitka_Generator_sendR(tstate, generator, arg, &exception_state, result);
+
+    // The protocol requires a value for return, also when there is none.
+    if (res == PYGEN_RETURN && *result == NULL) {
+        Py_INCREF_IMMORTAL(Py_None);
+        *result = Py_None;
+    }
+
+    return res;
+}
+#endif
+
 static PyObject *Nuitka_Generator_tp_iternext(struct Nuitka_GeneratorObject *generator) {
 #if _DEBUG_GENERATOR
     PRINT_GENERATOR_STATUS("Enter", generator);
@@ -1500,9 +1585,15 @@ static void Nuitka_Generator_tp_finalizer(struct Nuitka_GeneratorObject *generat
 #endif
 
 // Freelist setup
+#ifndef MAX_GENERATOR_FREE_LIST_COUNT
 #define MAX_GENERATOR_FREE_LIST_COUNT 100
-static struct Nuitka_GeneratorObject *free_list_generators = NULL;
-static int free_list_generators_count = 0;
+#endif
+// Smallest size class, in pointers for closure and heap storage.
+#define GENERATOR_FREE_LIST_SIZE_BASE 4
+NUITKA_THREAD_CACHE_STORAGE struct Nuitka_GeneratorObject *free_list_generators[NUITKA_FREE_LIST_SIZE_CLASSES] = {NULL};
+NUITKA_THREAD_CACHE_STORAGE int free_list_generators_count[NUITKA_FREE_LIST_SIZE_CLASSES] = {0};
+NUITKA_THREAD_CACHE_STORAGE struct Nuitka_FreeListState free_list_generators_state[NUITKA_FREE_LIST_SIZE_CLASSES] =
+    NUITKA_FREE_LIST_STATES_INIT(MAX_GENERATOR_FREE_LIST_COUNT);
 
 static void Nuitka_Generator_tp_dealloc(struct Nuitka_GeneratorObject *generator) {
 #if _DEBUG_REFCOUNTS
@@ -1580,7 +1671,7 @@ static void Nuitka_Generator_tp_dealloc(struct Nuitka_GeneratorObject *generator
 #endif
 
     /* Put the object into free list or release to GC */
-    releaseToFreeList(free_list_generators, generator, MAX_GENERATOR_FREE_LIST_COUNT);
+    releaseToSizedFreeList(free_list_generators, generator, GENERATOR_FREE_LIST_SIZE_BASE);
 
 #if PYTHON_VERSION < 0x300
     RESTORE_ERROR_OCCURRED_STATE(tstate, &saved_exception_state);
@@ -1747,8 +1838,7 @@ static PyAsyncMethods Nuitka_Generator_as_async = {
     NULL, /* am_await */
     NULL, /* am_aiter */
     NULL, /* am_anext */
-    // TODO: have this too, (sendfunc)_Nuitka_Generator_am_send
-    NULL /* am_send */
+    (sendfunc)_Nuitka_Generator_am_send /* am_send */
 };
 #endif
 
@@ -1886,7 +1976,8 @@ PyObject *Nuitka_Generator_New(generator_code code, PyObject *module, PyObject *
     Py_ssize_t full_size = closure_given + (heap_storage_size + sizeof(void *) - 1) / sizeof(void *);
 
     // Macro to assign result memory from GC or free list.
-    allocateFromFreeList(free_list_generators, struct Nuitka_GeneratorObject, Nuitka_Generator_Type, full_size);
+    allocateFromSizedFreeList(free_list_generators, struct Nuitka_GeneratorObject, Nuitka_Generator_Type, full_size,
+                              GENERATOR_FREE_LIST_SIZE_BASE);
 
     // For quicker access of generator heap.
     result->m_heap_storage = &result->m_closure[closure_given];
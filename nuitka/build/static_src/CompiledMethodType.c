@@ -413,9 +413,13 @@ static Py_hash_t Nuitka_Method_tp_hash(struct Nuitka_MethodObject *method) {
 }
 
 // Freelist setup
+#ifndef MAX_METHOD_FREE_LIST_COUNT
 #define MAX_METHOD_FREE_LIST_COUNT 100
-static struct Nuitka_MethodObject *free_list_methods = NULL;
-static int free_list_methods_count = 0;
+#endif
+NUITKA_THREAD_CACHE_STORAGE struct Nuitka_MethodObject *free_list_methods = NULL;
+NUITKA_THREAD_CACHE_STORAGE int free_list_methods_count = 0;
+NUITKA_THREAD_CACHE_STORAGE struct Nuitka_FreeListState free_list_methods_state =
+    NUITKA_FREE_LIST_STATE_INIT(MAX_METHOD_FREE_LIST_COUNT);
 
 static void Nuitka_Method_tp_dealloc(struct Nuitka_MethodObject *method) {
 #if _DEBUG_REFCOUNTS
@@ -444,7 +448,7 @@ static void Nuitka_Method_tp_dealloc(struct Nuitka_MethodObject *method) {
     Py_DECREF((PyObject *)method->m_function);
 
     /* Put the object into free list or release to GC */
-    releaseToFreeList(free_list_methods, method, MAX_METHOD_FREE_LIST_COUNT);
+    releaseToFreeList(free_list_methods, method);
 
 #ifndef __NUITKA_NO_ASSERT__
     struct Nuitka_ExceptionPreservationItem saved_exception_state2;
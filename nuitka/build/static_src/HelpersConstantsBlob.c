@@ -1337,6 +1337,83 @@ static void unpackBlobConstants(PyThreadState *tstate, PyObject **output, unsign
     _unpackBlobConstants(tstate, output, data, count);
 }
 
+// FNV-1a hash of section names, must match "_getSectionNameHash" of the data
+// composer.
+static uint32_t _hashBlobSectionName(char const *name) {
+    uint32_t result = 2166136261U;
+
+    while (*name != 0) {
+        result ^= (unsigned char)*name++;
+        result *= 16777619U;
+    }
+
+    return result;
+}
+
+// Directory of the sections, sorted by name hash, with entries of name hash,
+// offset, and CRC32 of the section.
+static uint32_t constant_bin_section_count = 0;
+static unsigned char const *constant_bin_directory = NULL;
+
+static unsigned char const *findConstantsBlobSection(char const *name) {
+    uint32_t hash = _hashBlobSectionName(name);
+
+    // Binary search for the first entry with that hash.
+    uint32_t low = 0;
+    uint32_t high = constant_bin_section_count;
+
+    while (low < high) {
+        uint32_t middle = low + (high - low) / 2;
+
+        unsigned char const *entry = constant_bin_directory + 12 * middle;
+
+        if (unpackValueUint32(&entry) < hash) {
+            low = middle + 1;
+        } else {
+            high = middle;
+        }
+    }
+
+    // Hash collisions are possible, check the names of all candidates.
+    for (uint32_t i = low; i < constant_bin_section_count; i++) {
+        unsigned char const *entry = constant_bin_directory + 12 * i;
+
+        if (unpackValueUint32(&entry) != hash) {
+            break;
+        }
+
+        uint32_t offset = unpackValueUint32(&entry);
+        uint32_t crc32 = unpackValueUint32(&entry);
+
+        unsigned char const *w = constant_bin + offset;
+
+        if (strcmp(name, (char const *)w) != 0) {
+            continue;
+        }
+
+        unsigned char const *section = w;
+
+        w += strlen((char const *)w) + 1;
+        uint32_t size = unpackValueUint32(&w);
+
+#ifdef _NUITKA_EXPERIMENTAL_DEBUG_CONSTANTS
+        printf("Loading blob named '%s' with size %d\n", name, size);
+#endif
+
+        // Only check sections when they are used, the others need not be read
+        // at all.
+        if (calcCRC32(section, (uint32_t)(w - section) + size) != crc32) {
+            puts("Error, corrupted constants object");
+            abort();
+        }
+
+        return w;
+    }
+
+    printf("Error, missing constants blob section '%s'\n", name);
+    abort();
+}
+
 void loadConstantsBlob(PyThreadState *tstate, PyObject **output, char const *name) {
     static bool init_done = false;
 
@@ -1356,21 +1433,24 @@ void loadConstantsBlob(PyThreadState *tstate, PyObject **output, char const *nam
         NUITKA_PRINT_TIMING("loadConstantsBlob(): Found blob, decoding now.");
         DECODE(constant_bin);
 
-        NUITKA_PRINT_TIMING("loadConstantsBlob(): CRC32 that blob for correctness.");
-        uint32_t hash = unpackValueUint32(&constant_bin);
-        uint32_t size = unpackValueUint32(&constant_bin);
+        NUITKA_PRINT_TIMING("loadConstantsBlob(): CRC32 the blob directory for correctness.");
+        unsigned char const *w = constant_bin;
+
+        uint32_t hash = unpackValueUint32(&w);
+        constant_bin_directory = w;
+        constant_bin_section_count = unpackValueUint32(&constant_bin_directory);
 
 #ifdef _NUITKA_EXPERIMENTAL_DEBUG_CONSTANTS
         printf("loadConstantsBlob '%u' hash value\n", hash);
-        printf("loadConstantsBlob '%u' size value\n", size);
+        printf("loadConstantsBlob '%u' sections\n", constant_bin_section_count);
 #endif
-        if (calcCRC32(constant_bin, size) != hash) {
+        if (calcCRC32(w, 4 + 12 * constant_bin_section_count) != hash) {
             puts("Error, corrupted constants object");
             abort();
         }
 
 #ifdef _NUITKA_EXPERIMENTAL_DEBUG_CONSTANTS
-        printf("Checked CRC32 to match hash %u size %u\n", hash, size);
+        printf("Checked CRC32 to match hash %u\n", hash);
 #endif
 
         NUITKA_PRINT_TIMING("loadConstantsBlob(): One time init complete.");
@@ -1386,30 +1466,7 @@ void loadConstantsBlob(PyThreadState *tstate, PyObject **output, char const *nam
         initCaches();
     }
 
-    unsigned char const *w = constant_bin;
-
-    for (;;) {
-        int match = strcmp(name, (char const *)w);
-        w += strlen((char const *)w) + 1;
-
-#ifdef _NUITKA_EXPERIMENTAL_DEBUG_CONSTANTS
-        printf("offset of blob size %d\n", w - constant_bin);
-#endif
-
-        uint32_t size = unpackValueUint32(&w);
-
-        if (match == 0) {
-#ifdef _NUITKA_EXPERIMENTAL_DEBUG_CONSTANTS
-            printf("Loading blob named '%s' with size %d\n", name, size);
-#endif
-            break;
-        }
-
-        // Skip other module data.
-        w += size;
-    }
-
-    unpackBlobConstants(tstate, output, w);
+    unpackBlobConstants(tstate, output, findConstantsBlobSection(name));
 }
 
 //     Part of "Nuitka", an optimizing Python compiler that is compatible and
@@ -513,6 +513,8 @@ static PyObject *_DEEP_COPY_ELEMENT_GUIDED(PyThreadState *tstate, PyObject *valu
         return DEEP_COPY_DICT(tstate, value);
     case 'd':
         return DICT_COPY(tstate, value);
+    case 'M':
+        return _DEEP_COPY_DICT_GUIDED(tstate, value, guide);
     case 'S':
         return DEEP_COPY_SET(tstate, value);
     case 'B':
@@ -571,6 +573,12 @@ PyObject *DEEP_COPY_TUPLE_GUIDED(PyThreadState *tstate, PyObject *value, char co
     return result;
 }
 
+PyObject *DEEP_COPY_DICT_GUIDED(PyThreadState *tstate, PyObject *value, char const *guide) {
+    PyObject *result = _DEEP_COPY_DICT_GUIDED(tstate, value, &guide);
+    assert(*guide == 0);
+    return result;
+}
+
 //     Part of "Nuitka", an optimizing Python compiler that is compatible and
 //     integrates with CPython, but also works on its own.
 //
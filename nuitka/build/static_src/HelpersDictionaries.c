@@ -2216,6 +2216,27 @@ PyObject *MAKE_DICT_EMPTY(PyThreadState *tstate) {
 }
 #endif
 
+PyObject *MAKE_DICT_FOR_ITERATOR(PyThreadState *tstate, PyObject *iterator) {
+    Py_ssize_t size = ITERATOR_LENGTH_HINT(tstate, iterator);
+
+    // Small sizes fit into the empty dictionary anyway.
+    if (size <= 5) {
+        return MAKE_DICT_EMPTY(tstate);
+    }
+
+    PyObject *result = _PyDict_NewPresized(size);
+
+    // The size is only a hint, not being able to allocate it in one go is not
+    // an error yet.
+    if (unlikely(result == NULL)) {
+        CLEAR_ERROR_OCCURRED(tstate);
+
+        return MAKE_DICT_EMPTY(tstate);
+    }
+
+    return result;
+}
+
 PyObject *MAKE_DICT(PyObject **pairs, Py_ssize_t size) {
     PyObject *result = _PyDict_NewPresized(size);
 
@@ -142,6 +142,34 @@ PyObject *LIST_COPY(PyThreadState *tstate, PyObject *list) {
     return result;
 }
 
+PyObject *MAKE_LIST_FOR_ITERATOR(PyThreadState *tstate, PyObject *iterator) {
+#if _NUITKA_EXPERIMENTAL_DISABLE_LIST_OPT
+    return MAKE_LIST_EMPTY(tstate, 0);
+#else
+    Py_ssize_t size = ITERATOR_LENGTH_HINT(tstate, iterator);
+
+    if (size <= 0) {
+        return MAKE_LIST_EMPTY(tstate, 0);
+    }
+
+    // Allocate the items exactly, but start out empty, so appends fill it
+    // without reallocations.
+    PyObject *result = MAKE_LIST_EMPTY(tstate, size);
+
+    // The size is only a hint, not being able to allocate it in one go is not
+    // an error yet.
+    if (unlikely(result == NULL)) {
+        CLEAR_ERROR_OCCURRED(tstate);
+
+        return MAKE_LIST_EMPTY(tstate, 0);
+    }
+
+    Py_SET_SIZE(result, 0);
+
+    return result;
+#endif
+}
+
 static bool LIST_RESIZE(PyListObject *list, Py_ssize_t new_size) {
     CHECK_OBJECT(list);
     assert(new_size >= 0);
@@ -434,6 +462,14 @@ bool LIST_APPEND1(PyObject *target, PyObject *item) {
     // Overflow is not really realistic, so we only assert against it.
     assert(cur_size <= PY_SSIZE_T_MAX);
 
+    // Space may be allocated already, e.g. for presized lists of contractions.
+    if (cur_size < list->allocated) {
+        PyList_SET_ITEM(list, cur_size, item);
+        Py_SET_SIZE(list, cur_size + 1);
+
+        return true;
+    }
+
     if (LIST_RESIZE(list, cur_size + 1) == false) {
         return false;
     }
@@ -461,6 +497,14 @@ bool LIST_APPEND0(PyObject *target, PyObject *item) {
     // Overflow is not really realistic, so we only assert against it.
     assert(cur_size <= PY_SSIZE_T_MAX);
 
+    // Space may be allocated already, e.g. for presized lists of contractions.
+    if (cur_size < list->allocated) {
+        PyList_SET_ITEM0(list, cur_size, item);
+        Py_SET_SIZE(list, cur_size + 1);
+
+        return true;
+    }
+
     if (LIST_RESIZE(list, cur_size + 1) == false) {
         return false;
     }
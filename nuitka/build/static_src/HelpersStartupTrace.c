@@ -0,0 +1,116 @@
+//     Copyright 2026, Kay Hayen, mailto:kay.hayen@gmail.com find license text at end of file
+
+// Startup trace, enabled at run time by setting "NUITKA_STARTUP_TRACE" to the
+// name of a file. Events are appended to it as JSON objects, one per line, by
+// the onefile bootstrap and the main program alike, so all processes of one
+// program start end up in the same file. The "time_ns" values are from a
+// monotonic clock shared by all processes. Events of kind "phase" mark the
+// start of a phase, which lasts until the next one of the same process, and
+// events of kind "summary" carry extra values, e.g. for extracted files.
+
+// This file is included from another C file, help IDEs to still parse it on
+// its own.
+#ifdef __IDE_ONLY__
+#include "nuitka/environment_variables_system.h"
+#include <stdint.h>
+#include <stdio.h>
+#include <time.h>
+#endif
+
+static environment_char_t const *startup_trace_filename = NULL;
+static char const *startup_trace_component = NULL;
+
+static void initStartupTrace(char const *component) {
+    environment_char_t const *filename = getEnvironmentVariable("NUITKA_STARTUP_TRACE");
+
+    if (filename != NULL && *filename != 0) {
+        startup_trace_filename = filename;
+        startup_trace_component = component;
+    }
+}
+
+static inline bool isStartupTraceEnabled(void) { return startup_trace_filename != NULL; }
+
+static uint64_t getStartupTraceTime(void) {
+#if defined(_WIN32)
+    static LARGE_INTEGER frequency = {0};
+
+    if (frequency.QuadPart == 0) {
+        QueryPerformanceFrequency(&frequency);
+    }
+
+    LARGE_INTEGER counter;
+    QueryPerformanceCounter(&counter);
+
+    return (uint64_t)(counter.QuadPart / frequency.QuadPart) * 1000000000 +
+           (uint64_t)(counter.QuadPart % frequency.QuadPart) * 1000000000 / frequency.QuadPart;
+#else
+    struct timespec now;
+    clock_gettime(CLOCK_MONOTONIC, &now);
+
+    return (uint64_t)now.tv_sec * 1000000000 + (uint64_t)now.tv_nsec;
+#endif
+}
+
+static long getStartupTraceProcessId(void) {
+#if defined(_WIN32)
+    return (long)GetCurrentProcessId();
+#else
+    return (long)getpid();
+#endif
+}
+
+// Append a line to the trace file, opening it only for that, so it is not
+// inherited by child processes, and lines of processes do not mix.
+static void writeStartupTraceLine(char const *line) {
+#if defined(_WIN32)
+    FILE *trace_file = _wfopen(startup_trace_filename, L"a");
+#else
+    FILE *trace_file = fopen(startup_trace_filename, "a");
+#endif
+
+    if (trace_file != NULL) {
+        fputs(line, trace_file);
+        fclose(trace_file);
+    }
+}
+
+static void traceStartupRecord(char const *kind, char const *event, char const *details) {
+    char line[1024];
+    snprintf(line, sizeof(line),
+             "{\"component\": \"%s\", \"pid\": %ld, \"kind\": \"%s\", \"event\": \"%s\", \"time_ns\": %llu%s}\n",
+             startup_trace_component, getStartupTraceProcessId(), kind, event,
+             (unsigned long long)getStartupTraceTime(), details);
+
+    writeStartupTraceLine(line);
+}
+
+// Record the start of a phase.
+static void traceStartupPhase(char const *event) {
+    if (startup_trace_filename != NULL) {
+        traceStartupRecord("phase", event, "");
+    }
+}
+
+// Record a summary, with "details" being extra JSON members, each prefixed
+// with a comma.
+NUITKA_MAY_BE_UNUSED static void traceStartupSummary(char const *event, char const *details) {
+    if (startup_trace_filename != NULL) {
+        traceStartupRecord("summary", event, details);
+    }
+}
+
+//     Part of "Nuitka", an optimizing Python compiler that is compatible and
+//     integrates with CPython, but also works on its own.
+//
+//     Licensed under the GNU Affero General Public License, Version 3 (the "License");
+//     you may not use this file except in compliance with the License.
+//     You may obtain a copy of the License at
+//
+//        http://www.gnu.org/licenses/agpl.txt
+//
+//     Unless required by applicable law or agreed to in writing, software
+//     distributed under the License is distributed on an "AS IS" BASIS,
+//     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+//     See the License for the specific language governing permissions and
+//     limitations under the License.
@@ -762,6 +762,73 @@ bool UNICODE_APPEND(PyThreadState *tstate, PyObject **p_left, PyObject *right) {
 
     return true;
 }
+
+// Join an array of strings without separator, as done for f-strings. The final
+// length and the largest character are determined in one pass, and then the
+// values are copied into a single result object, without intermediate tuple.
+PyObject *UNICODE_JOIN_ARRAY(PyThreadState *tstate, PyObject *const *values, Py_ssize_t count) {
+    Py_ssize_t new_len = 0;
+    Py_UCS4 max_char = 0;
+    PyObject *last = NULL;
+
+    for (Py_ssize_t i = 0; i < count; i++) {
+        PyObject *value = values[i];
+        CHECK_OBJECT(value);
+
+        if (unlikely(!PyUnicode_Check(value))) {
+            PyErr_Format(PyExc_TypeError, "sequence item %zd: expected str instance, %.80s found", i,
+                         Py_TYPE(value)->tp_name);
+            return NULL;
+        }
+
+        if (unlikely(PyUnicode_READY(value) == -1)) {
+            return NULL;
+        }
+
+        Py_ssize_t value_len = PyUnicode_GET_LENGTH(value);
+
+        if (value_len == 0) {
+            continue;
+        }
+
+        if (unlikely(new_len > PY_SSIZE_T_MAX - value_len)) {
+            SET_CURRENT_EXCEPTION_TYPE0_STR(tstate, PyExc_OverflowError,
+                                            "join() result is too long for a Python string");
+            return NULL;
+        }
+
+        new_len += value_len;
+        max_char = Py_MAX(max_char, PyUnicode_MAX_CHAR_VALUE(value));
+
+        last = value;
+    }
+
+    // Only one non-empty value, then it can be the result itself.
+    if (last != NULL && new_len == PyUnicode_GET_LENGTH(last) && PyUnicode_CheckExact(last)) {
+        Py_INCREF(last);
+        return last;
+    }
+
+    PyObject *result = Nuitka_Unicode_New(new_len, max_char);
+    if (unlikely(result == NULL)) {
+        return NULL;
+    }
+
+    Py_ssize_t offset = 0;
+
+    for (Py_ssize_t i = 0; i < count; i++) {
+        Py_ssize_t value_len = PyUnicode_GET_LENGTH(values[i]);
+
+        if (value_len != 0) {
+            _NuitkaUnicode_FastCopyCharacters(result, offset, values[i], 0, value_len);
+            offset += value_len;
+        }
+    }
+
+    assert(offset == new_len);
+
+    return result;
+}
 #endif
 
 PyObject *UNICODE_JOIN(PyThreadState *tstate, PyObject *str, PyObject *iterable) {
@@ -0,0 +1,210 @@
+//     Copyright 2026, Kay Hayen, mailto:kay.hayen@gmail.com find license text at end of file
+
+/**
+ * Release of thread local caches, i.e. free lists and cached frames, when the
+ * thread using them exits, which is only relevant for free-threaded Python.
+ *
+ * The caches a thread used are registered in a capsule stored in its thread
+ * state dictionary. That is cleared by the exiting thread itself, and then the
+ * capsule destructor releases everything still cached.
+ */
+
+#ifdef __IDE_ONLY__
+#include "nuitka/freelists.h"
+#include "nuitka/prelude.h"
+#endif
+
+#ifdef Py_GIL_DISABLED
+
+struct Nuitka_ThreadCaches {
+    // Free lists and their entry counts.
+    void ***free_lists;
+    int **free_list_counts;
+    Py_ssize_t free_lists_used;
+    Py_ssize_t free_lists_size;
+
+    // Frame caches, as an open addressing hash set, as they can be registered
+    // again, once released for an exception.
+    struct Nuitka_FrameObject ***frame_caches;
+    Py_ssize_t frame_caches_used;
+    Py_ssize_t frame_caches_size;
+};
+
+#define NUITKA_THREAD_CACHES_CAPSULE_NAME "nuitka.thread_caches"
+
+NUITKA_THREAD_CACHE_STORAGE struct Nuitka_ThreadCaches *thread_caches = NULL;
+
+static void _Nuitka_ThreadCachesRelease(PyObject *capsule) {
+    struct Nuitka_ThreadCaches *caches =
+        (struct Nuitka_ThreadCaches *)PyCapsule_GetPointer(capsule, NUITKA_THREAD_CACHES_CAPSULE_NAME);
+
+    // Only the owning thread can access the caches, and normally it clears its
+    // thread state itself. For thread states cleared by others, e.g. after a
+    // fork, the caches are left alone.
+    if (caches == thread_caches) {
+        thread_caches = NULL;
+        thread_caches_released = true;
+
+        for (Py_ssize_t i = 0; i < caches->frame_caches_size; i++) {
+            if (caches->frame_caches[i] != NULL) {
+                Py_CLEAR(*caches->frame_caches[i]);
+            }
+        }
+
+        for (Py_ssize_t i = 0; i < caches->free_lists_used; i++) {
+            void **free_list = caches->free_lists[i];
+
+            while (*free_list != NULL) {
+                void *entry = *free_list;
+                *free_list = *((void **)entry);
+                *caches->free_list_counts[i] -= 1;
+
+                PyObject_GC_Del(entry);
+            }
+        }
+    }
+
+    free(caches->free_lists);
+    free(caches->free_list_counts);
+    free(caches->frame_caches);
+    free(caches);
+}
+
+static struct Nuitka_ThreadCaches *_Nuitka_ThreadCachesGet(void) {
+    if (thread_caches != NULL || thread_caches_released) {
+        return thread_caches;
+    }
+
+    // Called when releasing objects, which can happen with an exception set.
+    PyThreadState *tstate = PyThreadState_GET();
+
+    struct Nuitka_ExceptionPreservationItem saved_exception_state;
+    FETCH_ERROR_OCCURRED_STATE(tstate, &saved_exception_state);
+
+    struct Nuitka_ThreadCaches *caches = (struct Nuitka_ThreadCaches *)calloc(1, sizeof(struct Nuitka_ThreadCaches));
+
+    PyObject *capsule = NULL;
+    if (caches != NULL) {
+        capsule = PyCapsule_New(caches, NUITKA_THREAD_CACHES_CAPSULE_NAME, _Nuitka_ThreadCachesRelease);
+
+        if (capsule == NULL) {
+            free(caches);
+        }
+    }
+
+    if (capsule != NULL) {
+        // Every compiled extension module has its own caches, so the key must
+        // be unique to it.
+        PyObject *key = PyUnicode_FromFormat("nuitka_thread_caches_%p", (void *)&thread_caches);
+        PyObject *thread_dict = PyThreadState_GetDict();
+
+        if (key != NULL && thread_dict != NULL && PyDict_SetItem(thread_dict, key, capsule) == 0) {
+            thread_caches = caches;
+        }
+
+        Py_XDECREF(key);
+        Py_DECREF(capsule);
+    }
+
+    CLEAR_ERROR_OCCURRED(tstate);
+    RESTORE_ERROR_OCCURRED_STATE(tstate, &saved_exception_state);
+
+    return thread_caches;
+}
+
+void Nuitka_ThreadCachesRegisterFreeList(void **free_list, int *free_list_count) {
+    struct Nuitka_ThreadCaches *caches = _Nuitka_ThreadCachesGet();
+
+    if (caches == NULL) {
+        return;
+    }
+
+    if (caches->free_lists_used == caches->free_lists_size) {
+        Py_ssize_t size = caches->free_lists_size == 0 ? 64 : caches->free_lists_size * 2;
+
+        void ***free_lists = (void ***)realloc(caches->free_lists, size * sizeof(void **));
+        if (free_lists == NULL) {
+            return;
+        }
+        caches->free_lists = free_lists;
+
+        int **free_list_counts = (int **)realloc(caches->free_list_counts, size * sizeof(int *));
+        if (free_list_counts == NULL) {
+            return;
+        }
+        caches->free_list_counts = free_list_counts;
+
+        caches->free_lists_size = size;
+    }
+
+    caches->free_lists[caches->free_lists_used] = free_list;
+    caches->free_list_counts[caches->free_lists_used] = free_list_count;
+    caches->free_lists_used += 1;
+}
+
+static bool _Nuitka_ThreadCachesAddFrameCache(struct Nuitka_FrameObject ***frame_caches, Py_ssize_t size,
+                                              struct Nuitka_FrameObject **frame_cache) {
+    Py_ssize_t mask = size - 1;
+    Py_ssize_t i = (Py_ssize_t)(((uintptr_t)frame_cache / sizeof(void *)) & mask);
+
+    while (frame_caches[i] != NULL) {
+        if (frame_caches[i] == frame_cache) {
+            return false;
+        }
+
+        i = (i + 1) & mask;
+    }
+
+    frame_caches[i] = frame_cache;
+    return true;
+}
+
+void Nuitka_ThreadCachesRegisterFrameCache(struct Nuitka_FrameObject **frame_cache) {
+    struct Nuitka_ThreadCaches *caches = _Nuitka_ThreadCachesGet();
+
+    if (caches == NULL) {
+        return;
+    }
+
+    // Keep the hash set at most half full.
+    if (caches->frame_caches_used * 2 >= caches->frame_caches_size) {
+        Py_ssize_t size = caches->frame_caches_size == 0 ? 64 : caches->frame_caches_size * 2;
+
+        struct Nuitka_FrameObject ***frame_caches =
+            (struct Nuitka_FrameObject ***)calloc(size, sizeof(struct Nuitka_FrameObject **));
+        if (frame_caches == NULL) {
+            return;
+        }
+
+        for (Py_ssize_t i = 0; i < caches->frame_caches_size; i++) {
+            if (caches->frame_caches[i] != NULL) {
+                _Nuitka_ThreadCachesAddFrameCache(frame_caches, size, caches->frame_caches[i]);
+            }
+        }
+
+        free(caches->frame_caches);
+        caches->frame_caches = frame_caches;
+        caches->frame_caches_size = size;
+    }
+
+    if (_Nuitka_ThreadCachesAddFrameCache(caches->frame_caches, caches->frame_caches_size, frame_cache)) {
+        caches->frame_caches_used += 1;
+    }
+}
+
+#endif
+
+//     Part of "Nuitka", an optimizing Python compiler that is compatible and
+//     integrates with CPython, but also works on its own.
+//
+//     Licensed under the GNU Affero General Public License, Version 3 (the "License");
+//     you may not use this file except in compliance with the License.
+//     You may obtain a copy of the License at
+//
+//        http://www.gnu.org/licenses/agpl.txt
+//
+//     Unless required by applicable law or agreed to in writing, software
+//     distributed under the License is distributed on an "AS IS" BASIS,
+//     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+//     See the License for the specific language governing permissions and
+//     limitations under the License.
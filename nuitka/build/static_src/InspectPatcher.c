@@ -358,9 +358,13 @@ void patchTypeComparison(void) {
 #include "nuitka/freelists.h"
 
 // Freelist setup
+#ifndef MAX_TRACEBACK_FREE_LIST_COUNT
 #define MAX_TRACEBACK_FREE_LIST_COUNT 1000
-static PyTracebackObject *free_list_tracebacks = NULL;
-static int free_list_tracebacks_count = 0;
+#endif
+NUITKA_THREAD_CACHE_STORAGE PyTracebackObject *free_list_tracebacks = NULL;
+NUITKA_THREAD_CACHE_STORAGE int free_list_tracebacks_count = 0;
+NUITKA_THREAD_CACHE_STORAGE struct Nuitka_FreeListState free_list_tracebacks_state =
+    NUITKA_FREE_LIST_STATE_INIT(MAX_TRACEBACK_FREE_LIST_COUNT);
 
 // Create a traceback for a given frame, using a free list hacked into the
 // existing type.
@@ -410,7 +414,7 @@ static void Nuitka_tb_dealloc(PyTracebackObject *tb) {
     Py_XDECREF(tb->tb_next);
     Py_XDECREF(tb->tb_frame);
 
-    releaseToFreeList(free_list_tracebacks, tb, MAX_TRACEBACK_FREE_LIST_COUNT);
+    releaseToFreeList(free_list_tracebacks, tb);
 
 #if 0
 #if PYTHON_VERSION >= 0x380
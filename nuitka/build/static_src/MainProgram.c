@@ -141,6 +141,9 @@ static void prepareFrozenModules(void) {
 
 #include "nuitka/environment_variables.h"
 
+// For the startup trace, if enabled at run time.
+#include "HelpersStartupTrace.c"
+
 #if _NUITKA_STANDALONE_MODE
 
 #include "pythonrun.h"
@@ -1512,6 +1515,9 @@ static int Nuitka_Main(int argc, native_command_line_argument_t **argv) {
 #endif
 #endif
 
+    initStartupTrace("main");
+    traceStartupPhase("start");
+
     NUITKA_PRINT_TIMING("main(): Entered.");
 
     // NUITKA_INIT_PROGRAM_EARLY(argc, argv);
@@ -1528,11 +1534,13 @@ static int Nuitka_Main(int argc, native_command_line_argument_t **argv) {
 
 #if _NUITKA_STANDALONE_MODE
     NUITKA_PRINT_TIMING("main(): Prepare standalone environment.");
+    traceStartupPhase("standalone_environment");
     prepareStandaloneEnvironment();
 #endif
 
 #if _NUITKA_FROZEN > 0
     NUITKA_PRINT_TIMING("main(): Preparing frozen modules.");
+    traceStartupPhase("frozen_modules");
     prepareFrozenModules();
 #endif
 
@@ -1689,6 +1697,7 @@ static int Nuitka_Main(int argc, native_command_line_argument_t **argv) {
 
     /* Initialize the embedded CPython interpreter. */
     NUITKA_PRINT_TIMING("main(): Calling Nuitka_Py_Initialize to initialize interpreter.");
+    traceStartupPhase("python_init");
     Nuitka_Py_Initialize();
 
     PyThreadState *tstate = PyThreadState_GET();
@@ -1739,6 +1748,7 @@ static int Nuitka_Main(int argc, native_command_line_argument_t **argv) {
      * "sys.executable" while at it.
      */
     NUITKA_PRINT_TIMING("main(): Calling createGlobalConstants().");
+    traceStartupPhase("constants");
     createGlobalConstants(tstate);
     NUITKA_PRINT_TIMING("main(): Returned createGlobalConstants().");
 
@@ -1749,6 +1759,8 @@ static int Nuitka_Main(int argc, native_command_line_argument_t **argv) {
     createMainModuleConstants(tstate);
     NUITKA_PRINT_TIMING("main(): Returned createMainModuleConstants().");
 
+    traceStartupPhase("python_setup");
+
     NUITKA_PRINT_TRACE("main(): Calling _initBuiltinOriginalValues().");
     _initBuiltinOriginalValues();
 
@@ -2086,6 +2098,7 @@ static int Nuitka_Main(int argc, native_command_line_argument_t **argv) {
 #else
     /* Execute the "__main__" module. */
     NUITKA_PRINT_TIMING("main(): Calling " NUITKA_MAIN_MODULE_NAME ".");
+    traceStartupPhase("main_module");
     EXECUTE_MAIN_MODULE(tstate, NUITKA_MAIN_MODULE_NAME, NUITKA_MAIN_IS_PACKAGE_BOOL);
     NUITKA_PRINT_TIMING("main(): Exited from " NUITKA_MAIN_MODULE_NAME ".");
 
@@ -2116,6 +2129,7 @@ static int Nuitka_Main(int argc, native_command_line_argument_t **argv) {
     int exit_code = HANDLE_PROGRAM_EXIT(tstate);
 
     NUITKA_PRINT_TIMING("main(): Calling Py_Exit.");
+    traceStartupPhase("exit");
     Py_Exit(exit_code);
 
     // The "Py_Exit()" calls is not supposed to return.
@@ -578,6 +578,11 @@ static PyObject *_nuitka_loader_find_module(PyObject *self, PyObject *args, PyOb
     return Py_None;
 }
 
+#if _NUITKA_STANDALONE_MODE && PYTHON_VERSION >= 0x300
+// The embedded data files are implemented in a separate file.
+#include "MetaPathBasedLoaderEmbeddedDataFiles.c"
+#endif
+
 static char const *_kw_list_get_data[] = {"filename", NULL};
 
 static PyObject *_nuitka_loader_get_data(PyObject *self, PyObject *args, PyObject *kwds) {
@@ -591,6 +596,14 @@ static PyObject *_nuitka_loader_get_data(PyObject *self, PyObject *args, PyObjec
 
     PyThreadState *tstate = PyThreadState_GET();
 
+#if _NUITKA_STANDALONE_MODE && PYTHON_VERSION >= 0x300
+    PyObject *embedded_data = getEmbeddedDataFileBytes(tstate, filename);
+
+    if (embedded_data != NULL) {
+        return embedded_data;
+    }
+#endif
+
     return GET_FILE_BYTES(tstate, filename);
 }
 
@@ -1281,6 +1294,9 @@ static void _fixupSpecAttribute(PyThreadState *tstate, PyObject *module) {
 // Pointers to bytecode data.
 static char **_bytecode_data = NULL;
 
+// The import time report is implemented in a separate file.
+#include "MetaPathBasedLoaderImportTime.c"
+
 static PyObject *loadModule(PyThreadState *tstate, PyObject *module, PyObject *module_name,
                             struct Nuitka_MetaPathBasedLoaderEntry const *entry) {
 #if _NUITKA_STANDALONE_MODE && !defined(_NUITKA_DEPLOYMENT_MODE) &&                                                    \
@@ -1354,8 +1370,8 @@ static PyObject *loadModule(PyThreadState *tstate, PyObject *module, PyObject *m
     return Nuitka_GetModule(tstate, module_name);
 }
 
-static PyObject *_EXECUTE_EMBEDDED_MODULE(PyThreadState *tstate, PyObject *module, PyObject *module_name,
-                                          char const *name) {
+static PyObject *_EXECUTE_EMBEDDED_MODULE_UNTIMED(PyThreadState *tstate, PyObject *module, PyObject *module_name,
+                                                  char const *name) {
     // In case of extension modules, that is fine to be NULL.
     CHECK_OBJECT_X(module);
     CHECK_OBJECT(module_name);
@@ -1467,6 +1483,25 @@ static PyObject *_EXECUTE_EMBEDDED_MODULE(PyThreadState *tstate, PyObject *modul
     return Py_None;
 }
 
+static PyObject *_EXECUTE_EMBEDDED_MODULE(PyThreadState *tstate, PyObject *module, PyObject *module_name,
+                                          char const *name) {
+    if (likely(Nuitka_import_time_enabled == false)) {
+        return _EXECUTE_EMBEDDED_MODULE_UNTIMED(tstate, module, module_name, name);
+    }
+
+    struct Nuitka_MetaPathBasedLoaderEntry *entry = findEntry(name);
+
+    if (entry == NULL && hasFrozenModule(name) == false) {
+        return _EXECUTE_EMBEDDED_MODULE_UNTIMED(tstate, module, module_name, name);
+    }
+
+    uint64_t start_time = startImportTime();
+    PyObject *result = _EXECUTE_EMBEDDED_MODULE_UNTIMED(tstate, module, module_name, name);
+    finishImportTime(name, getImportTimeKind(entry), start_time);
+
+    return result;
+}
+
 // Note: This may become an entry point for hard coded imports of compiled
 // stuff.
 PyObject *IMPORT_EMBEDDED_MODULE(PyThreadState *tstate, char const *name) {
@@ -2292,14 +2327,18 @@ static PyObject *Nuitka_Loader_tp_repr(struct Nuitka_LoaderObject *loader) {
 // use the free list mechanism at all.
 
 // Freelist setup
+#ifndef MAX_LOADER_FREE_LIST_COUNT
 #define MAX_LOADER_FREE_LIST_COUNT 10
-static struct Nuitka_LoaderObject *free_list_loaders = NULL;
-static int free_list_loaders_count = 0;
+#endif
+NUITKA_THREAD_CACHE_STORAGE struct Nuitka_LoaderObject *free_list_loaders = NULL;
+NUITKA_THREAD_CACHE_STORAGE int free_list_loaders_count = 0;
+NUITKA_THREAD_CACHE_STORAGE struct Nuitka_FreeListState free_list_loaders_state =
+    NUITKA_FREE_LIST_STATE_INIT(MAX_LOADER_FREE_LIST_COUNT);
 
 static void Nuitka_Loader_tp_dealloc(struct Nuitka_LoaderObject *loader) {
     Nuitka_GC_UnTrack(loader);
 
-    releaseToFreeList(free_list_loaders, loader, MAX_LOADER_FREE_LIST_COUNT);
+    releaseToFreeList(free_list_loaders, loader);
 }
 
 static int Nuitka_Loader_tp_traverse(struct Nuitka_LoaderObject *loader, visitproc visit, void *arg) { return 0; }
@@ -2425,6 +2464,8 @@ void registerMetaPathBasedLoader(struct Nuitka_MetaPathBasedLoaderEntry *_loader
         PySys_WriteStderr("Setup nuitka compiled module/bytecode/extension importer.\n");
     }
 
+    initImportTime();
+
     loader_entries = _loader_entries;
 
 #if _NUITKA_MODULE_MODE && PYTHON_VERSION < 0x3c0
@@ -0,0 +1,277 @@
+//     Copyright 2026, Kay Hayen, mailto:kay.hayen@gmail.com find license text at end of file
+
+// This implements access to data files embedded into the constants blob in
+// standalone mode, as done with "--include-data-files-embedded" option. These
+// are not present on disk, but are served from memory by the loader and its
+// resource reader.
+
+// This file is included from another C file, help IDEs to still parse it on
+// its own.
+#ifdef __IDE_ONLY__
+#include "nuitka/prelude.h"
+#include "nuitka/unfreezing.h"
+#endif
+
+// Section of the constants blob, made by the data composer. It starts with the
+// count of files, followed by entries sorted by name, each with the offset of
+// the name, the offset of the data, and the size of the data. Offsets are from
+// the start of the section and names use "/" as path separator.
+static unsigned char const *embedded_data_files = NULL;
+static uint32_t embedded_data_files_count = 0;
+
+static void initEmbeddedDataFiles(void) {
+    if (embedded_data_files == NULL) {
+        embedded_data_files = findConstantsBlobSection(".embedded_data");
+
+        unsigned char const *w = embedded_data_files;
+        embedded_data_files_count = unpackValueUint32(&w);
+    }
+}
+
+static char const *getEmbeddedDataFileEntryName(uint32_t index, unsigned char const **entry) {
+    *entry = embedded_data_files + 4 + 12 * index;
+
+    return (char const *)embedded_data_files + unpackValueUint32(entry);
+}
+
+// Index of the first entry with a name not less than the given one.
+static uint32_t findEmbeddedDataFileIndex(char const *name) {
+    uint32_t low = 0;
+    uint32_t high = embedded_data_files_count;
+
+    while (low < high) {
+        uint32_t middle = low + (high - low) / 2;
+
+        unsigned char const *entry;
+        if (strcmp(getEmbeddedDataFileEntryName(middle, &entry), name) < 0) {
+            low = middle + 1;
+        } else {
+            high = middle;
+        }
+    }
+
+    return low;
+}
+
+// Get the name of a path inside the embedded data files, these are relative to
+// the distribution folder. Returns NULL for other paths, without an exception.
+static char const *getEmbeddedDataFileName(PyThreadState *tstate, PyObject *path, char *buffer, size_t buffer_size) {
+    if (!PyUnicode_Check(path)) {
+        return NULL;
+    }
+
+    initEmbeddedDataFiles();
+
+    if (embedded_data_files_count == 0) {
+        return NULL;
+    }
+
+    static PyObject *prefix = NULL;
+
+    if (prefix == NULL) {
+        prefix = PyUnicode_Concat(getPythonProgramDirectoryObject(true), getPathSeparatorStringObject());
+    }
+
+    Py_ssize_t prefix_length = PyUnicode_GET_LENGTH(prefix);
+
+    if (PyUnicode_GET_LENGTH(path) <= prefix_length || PyUnicode_Tailmatch(path, prefix, 0, prefix_length, -1) != 1) {
+        return NULL;
+    }
+
+    PyObject *name_obj = PyUnicode_Substring(path, prefix_length, PyUnicode_GET_LENGTH(path));
+    char const *name = PyUnicode_AsUTF8(name_obj);
+
+    if (unlikely(name == NULL)) {
+        DROP_ERROR_OCCURRED(tstate);
+        Py_DECREF(name_obj);
+
+        return NULL;
+    }
+
+    copyStringSafe(buffer, name, buffer_size);
+    Py_DECREF(name_obj);
+
+#if defined(_WIN32)
+    for (char *w = buffer; *w != 0; w++) {
+        if (*w == '\\') {
+            *w = '/';
+        }
+    }
+#endif
+
+    // Trailing separators do not matter for directories.
+    size_t length = strlen(buffer);
+    while (length > 0 && buffer[length - 1] == '/') {
+        buffer[--length] = 0;
+    }
+
+    return buffer;
+}
+
+// Find the entry of an embedded data file, NULL if the path is not one.
+static unsigned char const *findEmbeddedDataFile(PyThreadState *tstate, PyObject *path) {
+    char buffer[MAXPATHLEN + 1];
+
+    char const *name = getEmbeddedDataFileName(tstate, path, buffer, sizeof(buffer));
+
+    if (name == NULL) {
+        return NULL;
+    }
+
+    uint32_t index = findEmbeddedDataFileIndex(name);
+
+    if (index >= embedded_data_files_count) {
+        return NULL;
+    }
+
+    unsigned char const *entry;
+    if (strcmp(getEmbeddedDataFileEntryName(index, &entry), name) != 0) {
+        return NULL;
+    }
+
+    return entry;
+}
+
+static bool isEmbeddedDataFile(PyThreadState *tstate, PyObject *path) {
+    return findEmbeddedDataFile(tstate, path) != NULL;
+}
+
+// Get the contents of an embedded data file as bytes, NULL if the path is not
+// one, without an exception.
+static PyObject *getEmbeddedDataFileBytes(PyThreadState *tstate, PyObject *path) {
+    unsigned char const *entry = findEmbeddedDataFile(tstate, path);
+
+    if (entry == NULL) {
+        return NULL;
+    }
+
+    uint32_t offset = unpackValueUint32(&entry);
+    uint32_t size = unpackValueUint32(&entry);
+
+    return PyBytes_FromStringAndSize((char const *)embedded_data_files + offset, size);
+}
+
+// Get the names of embedded data files and directories directly contained in a
+// directory, NULL if there are none, without an exception.
+static PyObject *getEmbeddedDataDirectoryNames(PyThreadState *tstate, PyObject *path) {
+    char buffer[MAXPATHLEN + 1];
+
+    char const *name = getEmbeddedDataFileName(tstate, path, buffer, sizeof(buffer));
+
+    if (name == NULL) {
+        return NULL;
+    }
+
+    appendCharSafe(buffer, '/', sizeof(buffer));
+    size_t prefix_length = strlen(buffer);
+
+    PyObject *result = NULL;
+    char const *last = NULL;
+    size_t last_length = 0;
+
+    // All names in the directory follow each other when sorted, and so do the
+    // ones of sub-directories, so comparing with the last one is enough to
+    // avoid duplicates.
+    for (uint32_t index = findEmbeddedDataFileIndex(buffer); index < embedded_data_files_count; index++) {
+        unsigned char const *entry;
+        char const *entry_name = getEmbeddedDataFileEntryName(index, &entry);
+
+        if (strncmp(entry_name, buffer, prefix_length) != 0) {
+            break;
+        }
+
+        char const *child = entry_name + prefix_length;
+        char const *sep = strchr(child, '/');
+        size_t child_length = sep != NULL ? (size_t)(sep - child) : strlen(child);
+
+        if (last != NULL && last_length == child_length && strncmp(last, child, child_length) == 0) {
+            continue;
+        }
+
+        if (result == NULL) {
+            result = MAKE_LIST_EMPTY(tstate, 0);
+        }
+
+        PyObject *child_name = PyUnicode_DecodeUTF8(child, child_length, NULL);
+        LIST_APPEND1(result, child_name);
+
+        last = child;
+        last_length = child_length;
+    }
+
+    return result;
+}
+
+static bool isEmbeddedDataDirectory(PyThreadState *tstate, PyObject *path) {
+    PyObject *names = getEmbeddedDataDirectoryNames(tstate, path);
+
+    if (names == NULL) {
+        return false;
+    }
+
+    Py_DECREF(names);
+    return true;
+}
+
+// Open an embedded data file for reading, using the bytes of it, which are
+// shared with the returned file object.
+static PyObject *openEmbeddedDataFile(PyThreadState *tstate, PyObject *data, PyObject *mode, PyObject *encoding,
+                                      PyObject *errors, PyObject *newline) {
+    bool binary = false;
+
+    if (mode != NULL) {
+        char const *mode_str = PyUnicode_AsUTF8(mode);
+
+        if (unlikely(mode_str == NULL)) {
+            return NULL;
+        }
+
+        if (strpbrk(mode_str, "wax+") != NULL) {
+            SET_CURRENT_EXCEPTION_TYPE0_STR(tstate, PyExc_ValueError, "embedded data files can only be read");
+            return NULL;
+        }
+
+        binary = strchr(mode_str, 'b') != NULL;
+    }
+
+    static PyObject *bytes_io_type = NULL;
+    if (bytes_io_type == NULL) {
+        bytes_io_type = PyObject_GetAttrString(IMPORT_HARD__IO(), "BytesIO");
+        CHECK_OBJECT(bytes_io_type);
+    }
+
+    PyObject *result = CALL_FUNCTION_WITH_SINGLE_ARG(tstate, bytes_io_type, data);
+
+    if (binary || unlikely(result == NULL)) {
+        return result;
+    }
+
+    static PyObject *text_io_wrapper_type = NULL;
+    if (text_io_wrapper_type == NULL) {
+        text_io_wrapper_type = PyObject_GetAttrString(IMPORT_HARD__IO(), "TextIOWrapper");
+        CHECK_OBJECT(text_io_wrapper_type);
+    }
+
+    PyObject *args[] = {result, encoding != NULL ? encoding : Py_None, errors != NULL ? errors : Py_None,
+                        newline != NULL ? newline : Py_None};
+
+    PyObject *text_result = CALL_FUNCTION_WITH_ARGS4(tstate, text_io_wrapper_type, args);
+    Py_DECREF(result);
+
+    return text_result;
+}
+
+//     Part of "Nuitka", an optimizing Python compiler that is compatible and
+//     integrates with CPython, but also works on its own.
+//
+//     Licensed under the GNU Affero General Public License, Version 3 (the "License");
+//     you may not use this file except in compliance with the License.
+//     You may obtain a copy of the License at
+//
+//        http://www.gnu.org/licenses/agpl.txt
+//
+//     Unless required by applicable law or agreed to in writing, software
+//     distributed under the License is distributed on an "AS IS" BASIS,
+//     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+//     See the License for the specific language governing permissions and
+//     limitations under the License.
@@ -0,0 +1,156 @@
+//     Copyright 2026, Kay Hayen, mailto:kay.hayen@gmail.com find license text at end of file
+
+// This implements an import time report for the modules loaded by our loader,
+// enabled at run time by setting "NUITKA_IMPORT_TIME" to "1" for output to
+// "stderr", or to the name of a file to append to. Like "-X importtime" of
+// CPython, a line is written when a module import finishes, with the self and
+// cumulative time in microseconds, and the module name indented by the nesting
+// of imports, so nested imports are listed before the importing module. Extra
+// columns give the time spent in creating the module constants, and the kind
+// of module.
+
+// This file is included from another C file, help IDEs to still parse it on
+// its own.
+#ifdef __IDE_ONLY__
+#include "nuitka/prelude.h"
+#include "nuitka/unfreezing.h"
+#endif
+
+bool Nuitka_import_time_enabled = false;
+
+static FILE *import_time_file = NULL;
+
+// Imports nested deeper than this, are reported, but not accounted for in
+// their parents.
+#define IMPORT_TIME_MAX_DEPTH 256
+
+static int import_time_depth = 0;
+
+// Per nesting level, the time spent in nested imports, and in creating the
+// constants of the module itself.
+static uint64_t import_time_children[IMPORT_TIME_MAX_DEPTH];
+static uint64_t import_time_constants[IMPORT_TIME_MAX_DEPTH];
+
+uint64_t getImportTimeNow(void) {
+#if defined(_WIN32)
+    static LARGE_INTEGER frequency = {0};
+
+    if (frequency.QuadPart == 0) {
+        QueryPerformanceFrequency(&frequency);
+    }
+
+    LARGE_INTEGER counter;
+    QueryPerformanceCounter(&counter);
+
+    return (uint64_t)(counter.QuadPart / frequency.QuadPart) * 1000000 +
+           (uint64_t)(counter.QuadPart % frequency.QuadPart) * 1000000 / frequency.QuadPart;
+#else
+    struct timespec now;
+    clock_gettime(CLOCK_MONOTONIC, &now);
+
+    return (uint64_t)now.tv_sec * 1000000 + (uint64_t)now.tv_nsec / 1000;
+#endif
+}
+
+static void initImportTime(void) {
+    environment_char_t const *value = getEnvironmentVariable("NUITKA_IMPORT_TIME");
+
+    if (value == NULL || *value == 0) {
+        return;
+    }
+
+#if defined(_WIN32)
+    if (wcscmp(value, L"1") == 0) {
+        import_time_file = stderr;
+    } else {
+        import_time_file = _wfopen(value, L"a");
+    }
+#else
+    if (strcmp(value, "1") == 0) {
+        import_time_file = stderr;
+    } else {
+        import_time_file = fopen(value, "a");
+    }
+#endif
+
+    if (import_time_file == NULL) {
+        return;
+    }
+
+    Nuitka_import_time_enabled = true;
+
+    fprintf(import_time_file, "import time: self [us] | cumulative | constants | kind      | imported package\n");
+    fflush(import_time_file);
+}
+
+static uint64_t startImportTime(void) {
+    import_time_depth += 1;
+
+    if (import_time_depth < IMPORT_TIME_MAX_DEPTH) {
+        import_time_children[import_time_depth] = 0;
+        import_time_constants[import_time_depth] = 0;
+    }
+
+    return getImportTimeNow();
+}
+
+static void finishImportTime(char const *name, char const *kind, uint64_t start_time) {
+    uint64_t cumulative = getImportTimeNow() - start_time;
+    uint64_t children = 0;
+    uint64_t constants = 0;
+
+    if (import_time_depth < IMPORT_TIME_MAX_DEPTH) {
+        children = import_time_children[import_time_depth];
+        constants = import_time_constants[import_time_depth];
+    }
+
+    fprintf(import_time_file, "import time: %9llu | %10llu | %9llu | %-9s | %*s%s\n",
+            (unsigned long long)(cumulative - children), (unsigned long long)cumulative,
+            (unsigned long long)constants, kind, 2 * (import_time_depth - 1), "", name);
+    fflush(import_time_file);
+
+    import_time_depth -= 1;
+
+    if (import_time_depth > 0 && import_time_depth < IMPORT_TIME_MAX_DEPTH) {
+        import_time_children[import_time_depth] += cumulative;
+    }
+}
+
+void recordImportTimeConstants(uint64_t start_time) {
+    if (import_time_depth > 0 && import_time_depth < IMPORT_TIME_MAX_DEPTH) {
+        import_time_constants[import_time_depth] += getImportTimeNow() - start_time;
+    }
+}
+
+static char const *getImportTimeKind(struct Nuitka_MetaPathBasedLoaderEntry const *entry) {
+    if (entry == NULL) {
+        return "frozen";
+    }
+#ifdef NUITKA_EXCLUDED_MODULE_FLAG
+    else if ((entry->flags & NUITKA_EXCLUDED_MODULE_FLAG) != 0) {
+        return "excluded";
+    }
+#endif
+    else if ((entry->flags & NUITKA_EXTENSION_MODULE_FLAG) != 0) {
+        return "extension";
+    } else if ((entry->flags & NUITKA_BYTECODE_FLAG) != 0) {
+        return "bytecode";
+    } else {
+        return "compiled";
+    }
+}
+
+//     Part of "Nuitka", an optimizing Python compiler that is compatible and
+//     integrates with CPython, but also works on its own.
+//
+//     Licensed under the GNU Affero General Public License, Version 3 (the "License");
+//     you may not use this file except in compliance with the License.
+//     You may obtain a copy of the License at
+//
+//        http://www.gnu.org/licenses/agpl.txt
+//
+//     Unless required by applicable law or agreed to in writing, software
+//     distributed under the License is distributed on an "AS IS" BASIS,
+//     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+//     See the License for the specific language governing permissions and
+//     limitations under the License.
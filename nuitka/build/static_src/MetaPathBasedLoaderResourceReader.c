@@ -63,7 +63,24 @@ static PyObject *Nuitka_ResourceReader_resource_path(PyObject *reader_obj, PyObj
 
     PyThreadState *tstate = PyThreadState_GET();
 
-    return _Nuitka_ResourceReader_resource_path(tstate, reader, resource);
+    PyObject *filename = _Nuitka_ResourceReader_resource_path(tstate, reader, resource);
+
+#if _NUITKA_STANDALONE_MODE
+    // Embedded data files have no path, importlib then uses a temporary file
+    // with the contents from "open_resource" instead.
+    if (filename != NULL) {
+        PyObject *embedded_data = getEmbeddedDataFileBytes(tstate, filename);
+
+        if (embedded_data != NULL) {
+            Py_DECREF(embedded_data);
+
+            SET_CURRENT_EXCEPTION_TYPE0_VALUE1(tstate, PyExc_FileNotFoundError, filename);
+            return NULL;
+        }
+    }
+#endif
+
+    return filename;
 }
 
 static PyObject *Nuitka_ResourceReader_open_resource(PyObject *reader_obj, PyObject *args, PyObject *kwds) {
@@ -80,7 +97,27 @@ static PyObject *Nuitka_ResourceReader_open_resource(PyObject *reader_obj, PyObj
 
     PyObject *filename = _Nuitka_ResourceReader_resource_path(tstate, reader, resource);
 
-    return BUILTIN_OPEN_BINARY_READ_SIMPLE(tstate, filename);
+    if (unlikely(filename == NULL)) {
+        return NULL;
+    }
+
+#if _NUITKA_STANDALONE_MODE
+    PyObject *embedded_data = getEmbeddedDataFileBytes(tstate, filename);
+
+    if (embedded_data != NULL) {
+        Py_DECREF(filename);
+
+        PyObject *result = openEmbeddedDataFile(tstate, embedded_data, const_str_plain_rb, NULL, NULL, NULL);
+        Py_DECREF(embedded_data);
+
+        return result;
+    }
+#endif
+
+    PyObject *result = BUILTIN_OPEN_BINARY_READ_SIMPLE(tstate, filename);
+    Py_DECREF(filename);
+
+    return result;
 }
 
 #include "MetaPathBasedLoaderResourceReaderFiles.c"
@@ -102,7 +102,45 @@ static PyObject *Nuitka_ResourceReaderFiles_iterdir(PyObject *files_obj, PyObjec
     PyThreadState *tstate = PyThreadState_GET();
 
     PyObject *file_path = _Nuitka_ResourceReaderFiles_GetPath(tstate, files);
+
+#if _NUITKA_STANDALONE_MODE
+    PyObject *embedded_names = getEmbeddedDataDirectoryNames(tstate, file_path);
+
+    PyObject *file_names = NULL;
+
+    // Directories may only exist for embedded data files.
+    if (embedded_names != NULL) {
+        PyObject *is_dir = OS_PATH_FILE_ISDIR(tstate, file_path);
+
+        if (is_dir == Py_False) {
+            file_names = embedded_names;
+        }
+
+        Py_XDECREF(is_dir);
+    }
+
+    if (file_names == NULL) {
+        file_names = OS_LISTDIR(tstate, file_path);
+
+        // Names of embedded files are added, unless they are also on disk.
+        if (embedded_names != NULL) {
+            if (likely(file_names != NULL)) {
+                Py_ssize_t n = PyList_GET_SIZE(embedded_names);
+                for (Py_ssize_t i = 0; i < n; i++) {
+                    PyObject *embedded_name = PyList_GET_ITEM(embedded_names, i);
+
+                    if (PySequence_Contains(file_names, embedded_name) == 0) {
+                        LIST_APPEND0(file_names, embedded_name);
+                    }
+                }
+            }
+
+            Py_DECREF(embedded_names);
+        }
+    }
+#else
     PyObject *file_names = OS_LISTDIR(tstate, file_path);
+#endif
     Py_DECREF(file_path);
 
     // TODO: Actually we ought to behave like a generator and delay this error,
@@ -155,7 +193,19 @@ static PyObject *Nuitka_ResourceReaderFiles_read_bytes(PyObject *files_obj, PyOb
         return NULL;
     }
 
-    return GET_FILE_BYTES(tstate, file_name);
+#if _NUITKA_STANDALONE_MODE
+    PyObject *embedded_data = getEmbeddedDataFileBytes(tstate, file_name);
+
+    if (embedded_data != NULL) {
+        Py_DECREF(file_name);
+        return embedded_data;
+    }
+#endif
+
+    PyObject *result = GET_FILE_BYTES(tstate, file_name);
+    Py_DECREF(file_name);
+
+    return result;
 }
 
 //    def read_text(self, encoding=None, errors=None):
@@ -198,8 +248,19 @@ static PyObject *Nuitka_ResourceReaderFiles_read_text(PyObject *files_obj, PyObj
         return NULL;
     }
 
-    PyObject *file_object =
-        BUILTIN_OPEN(tstate, file_name, const_str_plain_r, Py_True, encoding, errors, NULL, NULL, NULL);
+    PyObject *file_object;
+
+#if _NUITKA_STANDALONE_MODE
+    PyObject *embedded_data = getEmbeddedDataFileBytes(tstate, file_name);
+
+    if (embedded_data != NULL) {
+        file_object = openEmbeddedDataFile(tstate, embedded_data, const_str_plain_r, encoding, errors, NULL);
+        Py_DECREF(embedded_data);
+    } else
+#endif
+    {
+        file_object = BUILTIN_OPEN(tstate, file_name, const_str_plain_r, Py_True, encoding, errors, NULL, NULL, NULL);
+    }
 
     Py_DECREF(file_name);
 
@@ -225,6 +286,16 @@ static PyObject *Nuitka_ResourceReaderFiles_exists(PyObject *files_obj, PyObject
     PyThreadState *tstate = PyThreadState_GET();
     PyObject *file_name = _Nuitka_ResourceReaderFiles_GetPath(tstate, files);
     PyObject *result = OS_PATH_FILE_EXISTS(tstate, file_name);
+
+#if _NUITKA_STANDALONE_MODE
+    if (result == Py_False &&
+        (isEmbeddedDataDirectory(tstate, file_name) || isEmbeddedDataFile(tstate, file_name))) {
+        Py_DECREF(result);
+        result = Py_True;
+        Py_INCREF_IMMORTAL(result);
+    }
+#endif
+
     Py_DECREF(file_name);
     return result;
 }
@@ -242,6 +313,15 @@ static PyObject *Nuitka_ResourceReaderFiles_is_dir(PyObject *files_obj, PyObject
     PyThreadState *tstate = PyThreadState_GET();
     PyObject *file_name = _Nuitka_ResourceReaderFiles_GetPath(tstate, files);
     PyObject *result = OS_PATH_FILE_ISDIR(tstate, file_name);
+
+#if _NUITKA_STANDALONE_MODE
+    if (result == Py_False && isEmbeddedDataDirectory(tstate, file_name)) {
+        Py_DECREF(result);
+        result = Py_True;
+        Py_INCREF_IMMORTAL(result);
+    }
+#endif
+
     Py_DECREF(file_name);
     return result;
 }
@@ -258,6 +338,15 @@ static PyObject *Nuitka_ResourceReaderFiles_is_file(PyObject *files_obj, PyObjec
 
     PyObject *file_name = _Nuitka_ResourceReaderFiles_GetPath(tstate, files);
     PyObject *result = OS_PATH_FILE_ISFILE(tstate, file_name);
+
+#if _NUITKA_STANDALONE_MODE
+    if (result == Py_False && isEmbeddedDataFile(tstate, file_name)) {
+        Py_DECREF(result);
+        result = Py_True;
+        Py_INCREF_IMMORTAL(result);
+    }
+#endif
+
     Py_DECREF(file_name);
     return result;
 }
@@ -412,13 +501,59 @@ static PyObject *Nuitka_ResourceReaderFiles_open(PyObject *files_obj, PyObject *
 
     PyObject *file_name = _Nuitka_ResourceReaderFiles_GetPath(tstate, files);
 
-    return BUILTIN_OPEN(tstate, file_name, mode, buffering, encoding, errors, newline, NULL, NULL);
+    if (unlikely(file_name == NULL)) {
+        return NULL;
+    }
+
+#if _NUITKA_STANDALONE_MODE
+    PyObject *embedded_data = getEmbeddedDataFileBytes(tstate, file_name);
+
+    if (embedded_data != NULL) {
+        Py_DECREF(file_name);
+
+        PyObject *result = openEmbeddedDataFile(tstate, embedded_data, mode, encoding, errors, newline);
+        Py_DECREF(embedded_data);
+
+        return result;
+    }
+#endif
+
+    PyObject *result = BUILTIN_OPEN(tstate, file_name, mode, buffering, encoding, errors, newline, NULL, NULL);
+    Py_DECREF(file_name);
+
+    return result;
 }
 
+#if _NUITKA_STANDALONE_MODE && PYTHON_VERSION >= 0x390
+// The generic "importlib.resources.as_file" implementation, that uses a
+// temporary file with the contents.
+static PyObject *resources_as_file_generic = NULL;
+#endif
+
 static PyObject *Nuitka_ResourceReaderFiles_as_file(PyObject *files_obj, PyObject *args) {
     CHECK_OBJECT(files_obj);
     struct Nuitka_ResourceReaderFilesObject *files = (struct Nuitka_ResourceReaderFilesObject *)files_obj;
 
+#if _NUITKA_STANDALONE_MODE && PYTHON_VERSION >= 0x390
+    // Embedded data files are not on disk, so they need a temporary file.
+    if (resources_as_file_generic != NULL) {
+        PyThreadState *tstate = PyThreadState_GET();
+
+        PyObject *file_name = _Nuitka_ResourceReaderFiles_GetPath(tstate, files);
+
+        if (unlikely(file_name == NULL)) {
+            return NULL;
+        }
+
+        bool is_embedded = isEmbeddedDataFile(tstate, file_name);
+        Py_DECREF(file_name);
+
+        if (is_embedded) {
+            return CALL_FUNCTION_WITH_SINGLE_ARG(tstate, resources_as_file_generic, files_obj);
+        }
+    }
+#endif
+
     Py_INCREF(files);
     return (PyObject *)files;
 }
@@ -750,6 +885,16 @@ static void registerResourceReaderFiles(PyThreadState *tstate, PyObject *resourc
             CLEAR_ERROR_OCCURRED(tstate);
         }
 
+#if _NUITKA_STANDALONE_MODE
+        if (resources_as_file_generic == NULL) {
+            resources_as_file_generic = PyObject_CallMethod(as_file, "dispatch", "O", (PyObject *)&PyBaseObject_Type);
+
+            if (unlikely(resources_as_file_generic == NULL)) {
+                CLEAR_ERROR_OCCURRED(tstate);
+            }
+        }
+#endif
+
         Py_DECREF(as_file);
         Py_DECREF(our_as_file);
     } else {
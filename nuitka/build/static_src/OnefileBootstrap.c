@@ -124,6 +124,7 @@
 #include "HelpersEnvironmentVariablesSystem.c"
 #include "HelpersFilesystemPaths.c"
 #include "HelpersSafeStrings.c"
+#include "HelpersStartupTrace.c"
 
 #if defined(_WIN32) && (defined(_NUITKA_ATTACH_CONSOLE_WINDOW) || defined(_NUITKA_HIDE_CONSOLE_WINDOW))
 #include "HelpersConsole.c"
@@ -132,6 +133,57 @@
 // For tracing outputs if enabled at compile time.
 #include "nuitka/tracing.h"
 
+// Extracted files are accounted for the startup trace by size class, these are
+// the upper bounds of the classes, with the last class taking the rest.
+static unsigned long long const startup_trace_size_limits[] = {4096, 65536, 1048576, 16777216};
+#define STARTUP_TRACE_SIZE_CLASSES (sizeof(startup_trace_size_limits) / sizeof(startup_trace_size_limits[0]) + 1)
+
+static struct {
+    unsigned long count;
+    unsigned long written;
+    unsigned long long bytes;
+    uint64_t check_time;
+    uint64_t write_time;
+} startup_trace_size_classes[STARTUP_TRACE_SIZE_CLASSES];
+
+NUITKA_MAY_BE_UNUSED static void traceStartupExtractedFile(unsigned long long file_size, bool written,
+                                                           uint64_t check_time, uint64_t write_time) {
+    size_t index = 0;
+    while (index < STARTUP_TRACE_SIZE_CLASSES - 1 && file_size > startup_trace_size_limits[index]) {
+        index++;
+    }
+
+    startup_trace_size_classes[index].count += 1;
+    startup_trace_size_classes[index].written += written ? 1 : 0;
+    startup_trace_size_classes[index].bytes += file_size;
+    startup_trace_size_classes[index].check_time += check_time;
+    startup_trace_size_classes[index].write_time += write_time;
+}
+
+NUITKA_MAY_BE_UNUSED static void traceStartupExtractedFiles(void) {
+    for (size_t index = 0; index < STARTUP_TRACE_SIZE_CLASSES; index++) {
+        if (startup_trace_size_classes[index].count == 0) {
+            continue;
+        }
+
+        char max_size[32] = "null";
+        if (index < STARTUP_TRACE_SIZE_CLASSES - 1) {
+            snprintf(max_size, sizeof(max_size), "%llu", startup_trace_size_limits[index]);
+        }
+
+        char details[512];
+        snprintf(details, sizeof(details),
+                 ", \"max_size\": %s, \"count\": %lu, \"written\": %lu, \"bytes\": %llu, \"check_ns\": %llu, "
+                 "\"write_ns\": %llu",
+                 max_size, startup_trace_size_classes[index].count, startup_trace_size_classes[index].written,
+                 startup_trace_size_classes[index].bytes,
+                 (unsigned long long)startup_trace_size_classes[index].check_time,
+                 (unsigned long long)startup_trace_size_classes[index].write_time);
+
+        traceStartupSummary("extracted_files", details);
+    }
+}
+
 static void fatalError(char const *message) {
     puts(message);
     exit(2);
@@ -249,6 +301,22 @@ static void readChunk(void *buffer, size_t size) {
     payload_current += size;
 }
 
+#if _NUITKA_ONEFILE_COMPRESSION_BOOL == 1 && _NUITKA_ONEFILE_ARCHIVE_BOOL == 1
+// Files compressed individually may use a dictionary trained on them, which
+// is stored with its size before the files.
+static void loadZSTDDictionary(void) {
+    uint32_t dictionary_size;
+    readChunk(&dictionary_size, sizeof(dictionary_size));
+
+    size_t const ret = ZSTD_DCtx_loadDictionary(dest_ctx, payload_current, dictionary_size);
+    if (ZSTD_isError(ret)) {
+        fatalErrorAttachedData();
+    }
+
+    payload_current += dictionary_size;
+}
+#endif
+
 static void readPayloadChunk(void *buffer, size_t size) {
 #if _NUITKA_ONEFILE_COMPRESSION_BOOL == 1 && _NUITKA_ONEFILE_ARCHIVE_BOOL == 0
     bool end_of_buffer = false;
@@ -1008,6 +1076,9 @@ int main(int argc, char **argv) {
 
     // NUITKA_ONEFILE_INIT_EARLY(argc, argv);
 
+    initStartupTrace("onefile");
+    traceStartupPhase("start");
+
     NUITKA_PRINT_TIMING("ONEFILE: Entered main().");
 
 #if _NUITKA_ONEFILE_DLL_MODE
@@ -1096,6 +1167,7 @@ int main(int argc, char **argv) {
 
 #if _NUITKA_ONEFILE_HAS_PAYLOAD_BOOL == 1
     NUITKA_PRINT_TIMING("ONEFILE: Unpacking payload.");
+    traceStartupPhase("payload_search");
     initPayloadData();
 #endif
 
@@ -1142,6 +1214,7 @@ int main(int argc, char **argv) {
 
 #if _NUITKA_ONEFILE_HAS_PAYLOAD_BOOL == 1
     NUITKA_PRINT_TIMING("ONEFILE: Checking header for compression.");
+    traceStartupPhase("payload_header");
 
     char header[3];
     readChunk(&header, sizeof(header));
@@ -1152,13 +1225,26 @@ int main(int argc, char **argv) {
 
     NUITKA_PRINT_TIMING("ONEFILE: Header is OK.");
 
-// The 'X' stands for no compression, 'Y' is compressed, handle that.
+// The 'X' stands for no compression, 'Y' is compressed, and 'Z' is compressed
+// with a dictionary, handle that.
 #if _NUITKA_ONEFILE_COMPRESSION_BOOL == 1
-    if (header[2] != 'Y') {
+#if _NUITKA_ONEFILE_ARCHIVE_BOOL == 1
+    bool const has_dictionary = header[2] == 'Z';
+#else
+    bool const has_dictionary = false;
+#endif
+
+    if (header[2] != 'Y' && has_dictionary == false) {
         fatalErrorHeaderAttachedData();
     }
     initZSTD();
 
+#if _NUITKA_ONEFILE_ARCHIVE_BOOL == 1
+    if (has_dictionary) {
+        loadZSTDDictionary();
+    }
+#endif
+
     input.src = payload_current;
     input.pos = 0;
 
@@ -1173,6 +1259,7 @@ int main(int argc, char **argv) {
 #endif
 
     NUITKA_PRINT_TIMING("ONEFILE: Entering decompression.");
+    traceStartupPhase("extraction");
 
 #if _NUITKA_ONEFILE_TEMP_BOOL
     payload_created = true;
@@ -1226,12 +1313,38 @@ int main(int argc, char **argv) {
 
             continue;
         }
+
+        // Same contents as a file unpacked before, link to it, or copy if hard
+        // links are not supported by the file system.
+        if (file_flags & 4) {
+            filename_char_t *original_filename = readPayloadFilename();
+
+            static filename_char_t original_path[4096] = {0};
+            original_path[0] = 0;
+
+            appendStringSafeFilename(original_path, payload_path, sizeof(original_path) / sizeof(filename_char_t));
+            appendCharSafeFilename(original_path, FILENAME_SEP_CHAR, sizeof(original_path) / sizeof(filename_char_t));
+            appendStringSafeFilename(original_path, original_filename, sizeof(original_path) / sizeof(filename_char_t));
+
+            createContainingDirectory(target_path);
+
+            unlink(target_path);
+            if (link(original_path, target_path) != 0) {
+                if (copyFile(original_path, target_path, getFileMode(original_path)) == false) {
+                    fatalErrorTempFileCreate(target_path);
+                }
+            }
+
+            continue;
+        }
 #endif
         // _putws(target_path);
         unsigned long long file_size = readPayloadSizeValue();
 
         bool needs_write = true;
 
+        uint64_t trace_start_time = isStartupTraceEnabled() ? getStartupTraceTime() : 0;
+
 #if _NUITKA_ONEFILE_TEMP_BOOL == 0
         uint32_t contained_file_checksum = readPayloadChecksumValue();
         uint32_t existing_file_checksum = getFileCRC32(target_path);
@@ -1249,6 +1362,8 @@ int main(int argc, char **argv) {
         }
 #endif
 
+        uint64_t trace_check_time = isStartupTraceEnabled() ? getStartupTraceTime() : 0;
+
 #if _NUITKA_ONEFILE_ARCHIVE_BOOL == 1
 #if _NUITKA_ONEFILE_COMPRESSION_BOOL == 1
         uint32_t contained_archive_file_size = readArchiveFileSizeValue();
@@ -1308,9 +1423,15 @@ int main(int argc, char **argv) {
                 fatalErrorTempFiles();
             }
         }
+
+        if (isStartupTraceEnabled()) {
+            traceStartupExtractedFile(file_size, needs_write, trace_check_time - trace_start_time,
+                                      getStartupTraceTime() - trace_check_time);
+        }
     }
 
     NUITKA_PRINT_TIMING("ONEFILE: Finishing decompression, cleanup payload.");
+    traceStartupExtractedFiles();
 
     closePayloadData();
 #endif
@@ -1333,6 +1454,7 @@ int main(int argc, char **argv) {
     setEnvironmentVariable("NUITKA_ORIGINAL_ARGV0", argv[0]);
 
     NUITKA_PRINT_TIMING("ONEFILE: Preparing forking of slave process.");
+    traceStartupPhase("spawn");
 
 #if _NUITKA_ONEFILE_DLL_MODE
     filename_char_t const *fork_binary = getBinaryPath();
@@ -1367,6 +1489,7 @@ int main(int argc, char **argv) {
                               NULL, NULL, &si, &pi);
 
     NUITKA_PRINT_TIMING("ONEFILE: Started slave process.");
+    traceStartupPhase("child_running");
 
     if (bool_res == false) {
         fatalErrorChild("Error, couldn't launch child", GetLastError());
@@ -1448,6 +1571,8 @@ int main(int argc, char **argv) {
         // Onefile bootstrap process
         handle_process = pid;
 
+        traceStartupPhase("child_running");
+
         int status;
         int res = waitpid_retried(handle_process, &status, false);
 
@@ -1475,6 +1600,7 @@ int main(int argc, char **argv) {
 #endif
 
     NUITKA_PRINT_TIMING("ONEFILE: Exiting.");
+    traceStartupPhase("exit");
 
     return exit_code;
 }
@@ -18,6 +18,7 @@ from .CodeHelpers import (
     withObjectCodeTemporaryAssignment,
 )
 from .ErrorCodes import getErrorExitCode
+from .FunctionCodes import getGuardedDirectFunctionCallCode
 from .LineNumberCodes import emitLineNumberUpdateCode
 from .templates.CodeTemplatesModules import (
     template_header_guard,
@@ -36,6 +37,11 @@ def _generateCallCodePosOnly(
 
     call_args = expression.subnode_args
 
+    if called_attribute_name is None:
+        function_body = expression.getGuardedDirectCallFunctionBody()
+    else:
+        function_body = None
+
     if call_args is None or call_args.isExpressionConstantRef():
         context.setCurrentSourceCodeReference(expression.getCompatibleSourceReference())
 
@@ -62,7 +68,18 @@ def _generateCallCodePosOnly(
 
                 call_arg_names.append(call_arg_name)
 
-            if called_attribute_name is None:
+            if function_body is not None:
+                _getCallCodeGuardedDirect(
+                    to_name=to_name,
+                    called_name=called_name,
+                    function_body=function_body,
+                    arg_names=call_arg_names,
+                    release_names=call_arg_names,
+                    expression=expression,
+                    emit=emit,
+                    context=context,
+                )
+            elif called_attribute_name is None:
                 getCallCodePosArgsQuick(
                     to_name=to_name,
                     called_name=called_name,
@@ -82,7 +99,23 @@ def _generateCallCodePosOnly(
                     context=context,
                 )
         elif call_args_value:
-            if called_attribute_name is None:
+            if function_body is not None:
+                args_tuple = context.getConstantCode(constant=call_args_value)
+
+                _getCallCodeGuardedDirect(
+                    to_name=to_name,
+                    called_name=called_name,
+                    function_body=function_body,
+                    arg_names=[
+                        "PyTuple_GET_ITEM(%s, %d)" % (args_tuple, count)
+                        for count in range(len(call_args_value))
+                    ],
+                    release_names=(),
+                    expression=expression,
+                    emit=emit,
+                    context=context,
+                )
+            elif called_attribute_name is None:
                 _getCallCodeFromTuple(
                     to_name=to_name,
                     called_name=called_name,
@@ -103,7 +136,18 @@ def _generateCallCodePosOnly(
                     context=context,
                 )
         else:
-            if called_attribute_name is None:
+            if function_body is not None:
+                _getCallCodeGuardedDirect(
+                    to_name=to_name,
+                    called_name=called_name,
+                    function_body=function_body,
+                    arg_names=(),
+                    release_names=(),
+                    expression=expression,
+                    emit=emit,
+                    context=context,
+                )
+            elif called_attribute_name is None:
                 getCallCodeNoArgs(
                     to_name=to_name,
                     called_name=called_name,
@@ -133,7 +177,18 @@ def _generateCallCodePosOnly(
 
             call_arg_names.append(call_arg_name)
 
-        if called_attribute_name is None:
+        if function_body is not None:
+            _getCallCodeGuardedDirect(
+                to_name=to_name,
+                called_name=called_name,
+                function_body=function_body,
+                arg_names=call_arg_names,
+                release_names=call_arg_names,
+                expression=expression,
+                emit=emit,
+                context=context,
+            )
+        elif called_attribute_name is None:
             getCallCodePosArgsQuick(
                 to_name=to_name,
                 called_name=called_name,
@@ -674,6 +729,60 @@ def getCallCodePosArgsQuick(to_name, called_name, arg_names, expression, emit, c
     context.addCleanupTempName(to_name)
 
 
+def _getCallCodeGuardedDirect(
+    to_name,
+    called_name,
+    function_body,
+    arg_names,
+    release_names,
+    expression,
+    emit,
+    context,
+):
+    arg_size = len(arg_names)
+
+    emitLineNumberUpdateCode(expression, emit, context)
+
+    if arg_size == 0:
+        fallback_code = "%s = CALL_FUNCTION_NO_ARGS(tstate, %s);" % (
+            to_name,
+            called_name,
+        )
+    elif arg_size == 1:
+        fallback_code = "%s = CALL_FUNCTION_WITH_SINGLE_ARG(tstate, %s, %s);" % (
+            to_name,
+            called_name,
+            arg_names[0],
+        )
+    else:
+        quick_calls_used.add(arg_size)
+
+        fallback_code = "%s = CALL_FUNCTION_WITH_ARGS%d(tstate, %s, call_args);" % (
+            to_name,
+            arg_size,
+            called_name,
+        )
+
+    getGuardedDirectFunctionCallCode(
+        to_name=to_name,
+        called_name=called_name,
+        function_body=function_body,
+        arg_names=arg_names,
+        fallback_code=fallback_code,
+        emit=emit,
+    )
+
+    getErrorExitCode(
+        check_name=to_name,
+        release_names=[called_name] + list(release_names),
+        needs_check=expression.mayRaiseExceptionOperation(),
+        emit=emit,
+        context=context,
+    )
+
+    context.addCleanupTempName(to_name)
+
+
 def _getInstanceCallCodeFromTuple(
     to_name,
     called_name,
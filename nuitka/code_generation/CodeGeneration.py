@@ -146,6 +146,7 @@ from .DictCodes import (
     generateDictOperationViewitemsCode,
     generateDictOperationViewkeysCode,
     generateDictOperationViewvaluesCode,
+    generateMakeDictForIteratorCode,
 )
 from .EvalCodes import (
     generateBuiltinCompileCode,
@@ -178,6 +179,7 @@ from .FunctionCodes import (
     getExportScopeCode,
     getFunctionCode,
     getFunctionDirectDecl,
+    getFunctionImplDecl,
 )
 from .GeneratorCodes import (
     generateMakeGeneratorObjectCode,
@@ -241,6 +243,7 @@ from .ListCodes import (
     generateListOperationSort1Code,
     generateListOperationSort2Code,
     generateListOperationSort3Code,
+    generateMakeListForIteratorCode,
 )
 from .LocalsDictCodes import (
     generateLocalsDictDelCode,
@@ -522,6 +525,8 @@ def generateFunctionBodyCode(function_body, context):
                 ),
                 context=function_context,
             )
+        elif function_body.needsGuardedDirectCall() and function_body.needsCreation():
+            function_decl = getFunctionImplDecl(function_identifier=function_identifier)
         else:
             function_decl = None
 
@@ -860,6 +865,8 @@ addExpressionDispatchDict(
         "EXPRESSION_MAKE_TUPLE": generateTupleCreationCode,
         "EXPRESSION_MAKE_LIST": generateListCreationCode,
         "EXPRESSION_MAKE_DICT": generateDictionaryCreationCode,
+        "EXPRESSION_MAKE_LIST_FOR_ITERATOR": generateMakeListForIteratorCode,
+        "EXPRESSION_MAKE_DICT_FOR_ITERATOR": generateMakeDictForIteratorCode,
         "EXPRESSION_OPERATION_BINARY_ADD": generateOperationBinaryCode,
         "EXPRESSION_OPERATION_BINARY_SUB": generateOperationBinaryCode,
         "EXPRESSION_OPERATION_BINARY_MULT": generateOperationBinaryCode,
@@ -604,12 +604,18 @@ class FrameDeclarationsMixin(object):
         # Currently active frame stack inside the context.
         self.frame_stack = [None]
 
+        # Frames of the stack, that are only created for exceptions.
+        self.frame_lazy_stack = [False]
+
         self.locals_dict_names = None
 
     def getFrameHandle(self):
         return self.frame_stack[-1]
 
-    def pushFrameHandle(self, frame_code_name, is_light):
+    def isFrameLazy(self):
+        return self.frame_lazy_stack[-1]
+
+    def pushFrameHandle(self, frame_code_name, is_light, is_lazy):
         self.frames_used += 1
 
         if is_light:
@@ -637,11 +643,13 @@ class FrameDeclarationsMixin(object):
         )
 
         self.frame_stack.append(frame_identifier)
+        self.frame_lazy_stack.append(is_lazy)
         return frame_identifier
 
     def popFrameHandle(self):
         result = self.frame_stack[-1]
         del self.frame_stack[-1]
+        del self.frame_lazy_stack[-1]
 
         return result
 
@@ -795,6 +803,7 @@ class PythonModuleContext(
         "frame_variable_types",
         "frames_used",
         "frame_stack",
+        "frame_lazy_stack",
         "locals_dict_names",
         # TempMixin:
         "tmp_names",
@@ -971,6 +980,7 @@ class PythonFunctionContext(
         "frame_variable_types",
         "frames_used",
         "frame_stack",
+        "frame_lazy_stack",
         "locals_dict_names",
         # TempMixin:
         "tmp_names",
@@ -1209,8 +1219,11 @@ class PythonFunctionOutlineContext(
     def getFrameHandle(self):
         return self.parent.getFrameHandle()
 
-    def pushFrameHandle(self, code_object_access_code, is_light):
-        return self.parent.pushFrameHandle(code_object_access_code, is_light)
+    def isFrameLazy(self):
+        return self.parent.isFrameLazy()
+
+    def pushFrameHandle(self, code_object_access_code, is_light, is_lazy):
+        return self.parent.pushFrameHandle(code_object_access_code, is_light, is_lazy)
 
     def popFrameHandle(self):
         return self.parent.popFrameHandle()
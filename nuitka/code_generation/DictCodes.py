@@ -337,6 +337,20 @@ if (%(value_name)s == NULL && !HAS_ERROR_OCCURRED(tstate)) {
         context.addCleanupTempName(value_name)
 
 
+def generateMakeDictForIteratorCode(to_name, expression, emit, context):
+    generateCAPIObjectCode(
+        to_name=to_name,
+        capi="MAKE_DICT_FOR_ITERATOR",
+        tstate=True,
+        arg_desc=(("dict_iterator", expression.subnode_value),),
+        may_raise=expression.mayRaiseException(BaseException),
+        conversion_check=decideConversionCheckNeeded(to_name, expression),
+        source_ref=expression.getCompatibleSourceReference(),
+        emit=emit,
+        context=context,
+    )
+
+
 def generateDictOperationSetdefault2Code(to_name, expression, emit, context):
     generateCAPIObjectCode(
         to_name=to_name,
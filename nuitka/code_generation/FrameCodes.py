@@ -7,7 +7,27 @@ This is about frame stacks and their management. There are different kinds
 of frames for different uses.
 """
 
+from nuitka.nodes.shapes.BuiltinTypeShapes import (
+    tshape_bool,
+    tshape_bytearray,
+    tshape_bytes,
+    tshape_complex,
+    tshape_dict,
+    tshape_float,
+    tshape_frozenset,
+    tshape_int,
+    tshape_int_or_long,
+    tshape_list,
+    tshape_long,
+    tshape_none,
+    tshape_set,
+    tshape_str,
+    tshape_tuple,
+    tshape_unicode,
+)
+from nuitka.options.Options import shallUseLazyFrames
 from nuitka.PythonVersions import python_version
+from nuitka.tree.Operations import VisitorNoopMixin, visitTree
 from nuitka.utils.Jinja2 import renderTemplateFromString
 
 from .CodeHelpers import _generateStatementSequenceCode
@@ -81,15 +101,21 @@ def generateStatementsFrameCode(statement_sequence, emit, context):
         real_parent_exception_exit = parent_exception_exit
         parent_exception_exit = context.allocateLabel("nested_frame_exit")
 
+    needs_preserve = statement_sequence.needsFrameExceptionPreserving()
+
+    lazy_frame = _isLazyFrame(
+        frame_node=statement_sequence, needs_preserve=needs_preserve
+    )
+
     # Allow stacking of frame handles.
     context.pushFrameHandle(
-        statement_sequence.getFrameCodeName(), statement_sequence.hasStructureMember()
+        statement_sequence.getFrameCodeName(),
+        statement_sequence.hasStructureMember(),
+        lazy_frame,
     )
 
     context.setExceptionEscape(context.allocateLabel("frame_exception_exit"))
 
-    needs_preserve = statement_sequence.needsFrameExceptionPreserving()
-
     if statement_sequence.mayReturn():
         parent_return_exit = context.getReturnTarget()
 
@@ -156,6 +182,7 @@ def generateStatementsFrameCode(statement_sequence, emit, context):
             frame_return_exit=frame_return_exit,
             codes=local_emit,
             needs_preserve=needs_preserve,
+            lazy_frame=lazy_frame,
             emit=emit,
             context=context,
         )
@@ -208,6 +235,204 @@ def getFrameAttachLocalsCode(context, frame_identifier):
     }
 
 
+# Values of these types have no user code for attribute lookups.
+_lazy_frame_attribute_shapes = frozenset(
+    shape
+    for shape in (
+        tshape_none,
+        tshape_bool,
+        tshape_int,
+        tshape_long,
+        tshape_int_or_long,
+        tshape_float,
+        tshape_complex,
+        tshape_str,
+        tshape_unicode,
+        tshape_bytes,
+        tshape_bytearray,
+        tshape_tuple,
+        tshape_list,
+        tshape_dict,
+        tshape_set,
+        tshape_frozenset,
+    )
+    if shape is not None
+)
+
+# Sequences of these types have no user code for subscripts with an integer
+# index, dictionaries are not included, as keys compared may be user objects.
+_lazy_frame_subscript_shapes = frozenset(
+    shape
+    for shape in (
+        tshape_str,
+        tshape_unicode,
+        tshape_bytes,
+        tshape_bytearray,
+        tshape_tuple,
+        tshape_list,
+    )
+    if shape is not None
+)
+
+_lazy_frame_index_shapes = frozenset(
+    shape
+    for shape in (tshape_bool, tshape_int, tshape_long, tshape_int_or_long)
+    if shape is not None
+)
+
+
+class LazyFrameBlockerFinder(VisitorNoopMixin):
+    """Find code in a frame body, that may look at the frame.
+
+    Expressions that may run user code, e.g. calls, imports, operator
+    overloads, properties, or "__getitem__", can look at the frame stack.
+    Every expression is checked for its own operation only, as its children
+    are visited too. Of statements, only the ones known to not run user code
+    or use the frame themselves are allowed, e.g. exception handlers that
+    publish the exception need the frame for its traceback.
+    """
+
+    __slots__ = ("found",)
+
+    def __init__(self):
+        self.found = False
+
+    @staticmethod
+    def _isAllowedStatement(node):
+        if node.isStatementRaiseException():
+            # Only raising built-in exceptions does not run user code.
+            return (
+                node.subnode_exception_type.isExpressionBuiltinMakeException()
+                and node.subnode_exception_value is None
+                and node.subnode_exception_trace is None
+                and node.subnode_exception_cause is None
+            )
+
+        return (
+            node.isStatementsFrameFunction()
+            or node.isStatementsSequence()
+            or node.isStatementAssignmentVariable()
+            or node.isStatementDelVariable()
+            or node.isStatementReleaseVariable()
+            or node.isStatementReturn()
+            or node.isStatementExpressionOnly()
+            or node.isStatementConditional()
+            or node.isStatementLoop()
+            or node.isStatementLoopBreak()
+            or node.isStatementLoopContinue()
+            or node.isStatementTry()
+        )
+
+    @staticmethod
+    def _mayRunUserCode(node):
+        # return driven, pylint: disable=too-many-return-statements
+
+        # User code might raise, so what cannot raise, does not run any.
+        if not node.mayHaveSideEffects() or not node.mayRaiseException(BaseException):
+            return False
+
+        # These only may raise for their children, or like variable references
+        # for unassigned values, or only pass on values.
+        if (
+            node.isExpressionVariableRefOrTempVariableRef()
+            or node.isExpressionMakeTuple()
+            or node.isExpressionMakeList()
+            or node.isExpressionComparisonIs()
+            or node.isExpressionComparisonIsNot()
+            or node.isExpressionConditional()
+            or node.isExpressionConditionalAnd()
+            or node.isExpressionConditionalOr()
+            or node.isExpressionOperationNot()
+            or node.isExpressionBuiltinMakeException()
+        ):
+            return False
+
+        # Operations know from the shapes of their arguments, if they may
+        # escape control flow to overloads, or only raise, e.g. for division
+        # by zero or unsupported types.
+        if node.isExpressionOperationBinary() or node.isExpressionComparison():
+            escape_desc = getattr(node, "escape_desc", None)
+
+            return escape_desc is None or escape_desc.isControlFlowEscape()
+
+        if node.kind.startswith("EXPRESSION_ATTRIBUTE_LOOKUP"):
+            return (
+                node.subnode_expression.getTypeShape()
+                not in _lazy_frame_attribute_shapes
+            )
+
+        if node.kind.startswith("EXPRESSION_SUBSCRIPT_LOOKUP"):
+            return (
+                node.subnode_expression.getTypeShape()
+                not in _lazy_frame_subscript_shapes
+                or node.subnode_subscript.getTypeShape() not in _lazy_frame_index_shapes
+            )
+
+        return True
+
+    @staticmethod
+    def _getTruthCheckedChild(node):
+        if node.isStatementConditional() or node.isExpressionConditional():
+            return node.subnode_condition
+        elif node.isExpressionConditionalAnd() or node.isExpressionConditionalOr():
+            return node.subnode_left
+        elif node.isExpressionOperationNot():
+            return node.subnode_operand
+        else:
+            return None
+
+    def onEnterNode(self, node):
+        if self.found:
+            return
+
+        if node.kind.startswith("EXPRESSION"):
+            if self._mayRunUserCode(node):
+                self.found = True
+        elif not self._isAllowedStatement(node):
+            self.found = True
+
+        # Checking the truth value may call "__bool__" or "__len__" too.
+        truth_checked = self._getTruthCheckedChild(node)
+
+        if (
+            truth_checked is not None
+            and truth_checked.mayHaveSideEffectsBool()
+            and truth_checked.mayRaiseExceptionBool(BaseException)
+        ):
+            self.found = True
+
+
+def _isLazyFrame(frame_node, needs_preserve):
+    """Decide if the frame of a function can be created on exceptions only.
+
+    Without code that may run user code, e.g. calls, imports, or operations
+    that may dispatch to overloads, nothing can look at the frame, but an
+    exception traceback. Code that uses the frame in any other way, e.g.
+    exception handlers that make their own tracebacks, needs it to exist all
+    along.
+    """
+    if not shallUseLazyFrames():
+        return False
+
+    if not frame_node.isStatementsFrameFunction():
+        return False
+
+    # The frame is created from the cache, on the exception exit.
+    if frame_node.getGuardMode() != "full":
+        return False
+
+    if not frame_node.mayRaiseException(BaseException):
+        return False
+
+    if needs_preserve:
+        return False
+
+    visitor = LazyFrameBlockerFinder()
+    visitTree(frame_node, visitor)
+
+    return not visitor.found
+
+
 def getFrameGuardHeavyCode(
     frame_node,
     code_identifier,
@@ -217,6 +442,7 @@ def getFrameGuardHeavyCode(
     frame_exception_exit,
     frame_return_exit,
     needs_preserve,
+    lazy_frame,
     emit,
     context,
 ):
@@ -303,6 +529,10 @@ Py_CLEAR(%(frame_identifier)s->m_frame.f_locals);
 
     context_identifier = frame_node.getStructureMember()
 
+    assert not lazy_frame or (
+        frame_cache_identifier is not None and frame_exception_exit is not None
+    )
+
     emit(
         renderTemplateFromString(
             template_frame_guard_normal_main_block,
@@ -316,6 +546,7 @@ Py_CLEAR(%(frame_identifier)s->m_frame.f_locals);
             frame_exit_code=frame_exit_code,
             context_identifier=context_identifier,
             is_python3=python_version >= 0x300,
+            lazy_frame=lazy_frame,
         )
     )
 
@@ -328,6 +559,7 @@ Py_CLEAR(%(frame_identifier)s->m_frame.f_locals);
                 frame_return_exit=frame_return_exit,
                 needs_preserve=needs_preserve,
                 frame_exit_code=frame_exit_code,
+                lazy_frame=lazy_frame,
             )
         )
 
@@ -352,6 +584,8 @@ Py_CLEAR(%(frame_identifier)s->m_frame.f_locals);
                 needs_preserve=needs_preserve,
                 exception_state_name=exception_state_name,
                 exception_lineno=exception_lineno,
+                make_frame_code=make_frame_code,
+                lazy_frame=lazy_frame,
             )
         )
 
@@ -414,6 +648,7 @@ def getFrameGuardGeneratorCode(
             frame_exit_code=frame_exit_code,
             is_generator=is_generator,
             is_python3=python_version >= 0x300,
+            lazy_frame=False,
         )
     )
 
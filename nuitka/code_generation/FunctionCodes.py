@@ -31,6 +31,7 @@ from .templates.CodeTemplatesFunction import (
     template_function_body,
     template_function_direct_declaration,
     template_function_exception_exit,
+    template_function_impl_declaration,
     template_function_make_declaration,
     template_function_return_exit,
     template_make_function,
@@ -489,6 +490,17 @@ def getFunctionDirectDecl(function_identifier, closure_variables, file_scope, co
     return result
 
 
+def getFunctionImplDecl(function_identifier):
+    """Declaration of the implementation of a function created as an object.
+
+    This is needed for calls that check the called object to be created from
+    this function and then call its implementation directly.
+    """
+    return template_function_impl_declaration % {
+        "function_identifier": function_identifier,
+    }
+
+
 def setupFunctionLocalVariables(
     context, parameters, closure_variables, user_variables, temp_variables
 ):
@@ -721,6 +733,46 @@ def getExportScopeCode(cross_module):
         return "NUITKA_LOCAL_MODULE"
 
 
+def getGuardedDirectFunctionCallCode(
+    to_name, called_name, function_body, arg_names, fallback_code, emit
+):
+    """Call the implementation of a function directly, if the called object
+    is still created from that function body, otherwise use fallback code.
+
+    The fallback code sees the arguments as "call_args" array, if any.
+    """
+    function_impl_identifier = _getFunctionEntryPointIdentifier(
+        function_identifier=function_body.getCodeName()
+    )
+
+    code = """\
+if (Nuitka_Function_CheckImpl(%(called_name)s, %(function_impl_identifier)s)) {
+    %(to_name)s = Nuitka_CallFunctionImpl(tstate, %(function_impl_identifier)s, %(called_name)s, %(call_args)s, %(arg_count)d);
+} else {
+    %(fallback_code)s
+}""" % {
+        "called_name": called_name,
+        "function_impl_identifier": function_impl_identifier,
+        "to_name": to_name,
+        "call_args": "call_args" if arg_names else "NULL",
+        "arg_count": len(arg_names),
+        "fallback_code": fallback_code,
+    }
+
+    if arg_names:
+        code = """\
+{
+    PyObject *call_args[] = {%s};
+
+%s
+}""" % (
+            ", ".join(str(arg_name) for arg_name in arg_names),
+            indented(code),
+        )
+
+    emit(code)
+
+
 def generateFunctionCallCode(to_name, expression, emit, context):
     assert expression.subnode_function.isExpressionFunctionCreation()
 
@@ -19,6 +19,10 @@ def getCurrentLineNumberCode(context):
 
 
 def getLineNumberUpdateCode(context):
+    # Lazy frames do not exist yet, tracebacks use the exception line number.
+    if context.isFrameLazy():
+        return ""
+
     lineno_value = getCurrentLineNumberCode(context)
 
     if lineno_value:
@@ -74,6 +74,20 @@ def generateListCreationCode(to_name, expression, emit, context):
                 )
 
 
+def generateMakeListForIteratorCode(to_name, expression, emit, context):
+    generateCAPIObjectCode(
+        to_name=to_name,
+        capi="MAKE_LIST_FOR_ITERATOR",
+        tstate=True,
+        arg_desc=(("list_iterator", expression.subnode_value),),
+        may_raise=expression.mayRaiseException(BaseException),
+        conversion_check=decideConversionCheckNeeded(to_name, expression),
+        source_ref=expression.getCompatibleSourceReference(),
+        emit=emit,
+        context=context,
+    )
+
+
 def generateListOperationAppendCode(statement, emit, context):
     list_arg_name = context.allocateTempName("append_list")
     generateExpressionCode(
@@ -142,27 +142,32 @@ def generateBuiltinOrdCode(to_name, expression, emit, context):
 
 
 def generateStringConcatenationCode(to_name, expression, emit, context):
-    values = expression.subnode_values
+    (value_names,) = generateChildExpressionsCode(
+        expression=expression, emit=emit, context=context
+    )
 
     with withObjectCodeTemporaryAssignment(
         to_name, "string_concat_result", expression, emit, context
     ) as value_name:
-        tuple_temp_name = context.allocateTempName("string_concat_values")
-
-        # TODO: Consider using _PyUnicode_JoinArray which avoids the tuple,
-        # but got all to be able to release arrays.
-        getTupleCreationCode(
-            to_name=tuple_temp_name, elements=values, emit=emit, context=context
-        )
-
+        # Join values from an array, sized and allocated only once, avoiding
+        # the tuple and intermediate strings.
         emit(
-            "%s = PyUnicode_Join(%s, %s);"
-            % (value_name, context.getConstantCode(""), tuple_temp_name)
+            """\
+{
+    PyObject *string_concat_values[] = {%s};
+    %s = UNICODE_JOIN_ARRAY(tstate, string_concat_values, %d);
+}
+"""
+            % (
+                ", ".join(str(name) for name in value_names),
+                value_name,
+                len(value_names),
+            )
         )
 
         getErrorExitCode(
             check_name=value_name,
-            release_name=tuple_temp_name,
+            release_names=value_names,
             needs_check=expression.mayRaiseExceptionOperation(),
             emit=emit,
             context=context,
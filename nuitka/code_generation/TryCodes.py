@@ -8,10 +8,16 @@ finally block gets duplicated into handlers. So this is a common low level
 structure used, where exception handling and everything is made explicit.
 """
 
+from nuitka.PythonVersions import python_version
 from nuitka.States import states
-
-from .CodeHelpers import generateExpressionCode, generateStatementSequenceCode
-from .ErrorCodes import getMustNotGetHereCode
+from nuitka.tree.Operations import VisitorNoopMixin, visitTree
+
+from .CodeHelpers import (
+    generateChildExpressionCode,
+    generateExpressionCode,
+    generateStatementSequenceCode,
+)
+from .ErrorCodes import getErrorExitBoolCode, getMustNotGetHereCode
 from .ExceptionCodes import getExceptionUnpublishedReleaseCode
 from .IteratorCodes import getBuiltinLoopBreakNextCode
 from .LabelCodes import getGotoCode, getLabelCode
@@ -27,6 +33,9 @@ def generateTryCode(statement, emit, context):
     if generateTryNextExceptStopIterationCode(statement, emit, context):
         return
 
+    if generateTrySubscriptExceptKeyErrorCode(statement, emit, context):
+        return
+
     # Get the statement sequences involved. All except the tried block can be
     # None. For the tried block it would be a missed optimization. Also not all
     # the handlers must be None, then it's also a missed optimization.
@@ -310,6 +319,242 @@ def generateTryNextExceptStopIterationCode(statement, emit, context):
     return True
 
 
+def _isKeyErrorExceptionMatch(condition, match):
+    if match:
+        if not condition.isExpressionComparisonExceptionMatch():
+            return False
+    else:
+        if not condition.isExpressionComparisonExceptionMismatch():
+            return False
+
+    if not condition.subnode_left.isExpressionCaughtExceptionTypeRef():
+        return False
+
+    right = condition.subnode_right
+
+    return (
+        right.isExpressionBuiltinExceptionRef()
+        and right.getExceptionName() == "KeyError"
+    )
+
+
+def _isReraiseOnly(statement_sequence):
+    return (
+        statement_sequence is not None
+        and len(statement_sequence.subnode_statements) == 1
+        and statement_sequence.subnode_statements[0].isStatementReraiseException()
+    )
+
+
+class CaughtExceptionReferenceFinder(VisitorNoopMixin):
+    """Find references to the caught exception, e.g. by "except ... as e"."""
+
+    __slots__ = ("found",)
+
+    def __init__(self):
+        self.found = False
+
+    def onEnterNode(self, node):
+        if (
+            node.isExpressionCaughtExceptionTypeRef()
+            or node.isExpressionCaughtExceptionValueRef()
+            or node.isExpressionCaughtExceptionTracebackRef()
+        ):
+            self.found = True
+
+
+def _hasCaughtExceptionReference(statement_sequence):
+    visitor = CaughtExceptionReferenceFinder()
+    visitTree(statement_sequence, visitor)
+
+    return visitor.found
+
+
+def _getKeyErrorOnlyHandler(except_handler):
+    """Get handling statements for handler that only catches "KeyError".
+
+    Returns tuple of bool if it matched, and the handling statements
+    sequence, which can be None if the exception is ignored.
+    """
+    # This checks the exact shape of re-formulated "except KeyError:" handlers
+    # and returns each time it differs, pylint: disable=too-many-return-statements
+
+    handling_statements = except_handler.subnode_statements
+
+    # The restoring of the frame exception after the handler is absent if
+    # the handler aborts.
+    if len(handling_statements) == 4:
+        if not handling_statements[3].isStatementRestoreFrameException():
+            return False, None
+    elif len(handling_statements) != 3:
+        return False, None
+
+    if (
+        not handling_statements[0].isStatementPreserveFrameException()
+        or not handling_statements[1].isStatementPublishException()
+        or not handling_statements[2].isStatementTry()
+    ):
+        return False, None
+
+    inner_try = handling_statements[2]
+
+    # The inner handlers only restore the frame exception before leaving.
+    for handler in (
+        inner_try.subnode_except_handler,
+        inner_try.subnode_break_handler,
+        inner_try.subnode_continue_handler,
+        inner_try.subnode_return_handler,
+    ):
+        if (
+            handler is not None
+            and not handler.subnode_statements[0].isStatementRestoreFrameException()
+        ):
+            return False, None
+
+    inner_statements = inner_try.subnode_tried.subnode_statements
+
+    if len(inner_statements) != 1 or not inner_statements[0].isStatementConditional():
+        return False, None
+
+    conditional = inner_statements[0]
+    condition = conditional.subnode_condition
+
+    if _isKeyErrorExceptionMatch(condition, match=True) and _isReraiseOnly(
+        conditional.subnode_no_branch
+    ):
+        handler_body = conditional.subnode_yes_branch
+    elif _isKeyErrorExceptionMatch(condition, match=False) and _isReraiseOnly(
+        conditional.subnode_yes_branch
+    ):
+        handler_body = conditional.subnode_no_branch
+    else:
+        return False, None
+
+    # The handler must not be able to observe the exception, which would be
+    # through raising an exception that gets it as context, calling code
+    # that looks at it, or referencing it directly, e.g. with "as e".
+    if handler_body is not None and (
+        handler_body.mayRaiseException(BaseException)
+        or _hasCaughtExceptionReference(handler_body)
+    ):
+        return False, None
+
+    return True, handler_body
+
+
+def generateTrySubscriptExceptKeyErrorCode(statement, emit, context):
+    """Generate code for "try: v = x[k]" with "except KeyError:" handler.
+
+    The "KeyError" of the lookup is not raised at all, and for dictionaries
+    not even created, and then handled without attaching tracebacks and
+    publishing it. Only when the handler cannot observe the exception.
+    """
+
+    # This has many branches which mean this optimized code generation is not
+    # applicable, we return each time. pylint: disable=too-many-return-statements
+
+    # Python2 keeps the exception published after the handler, so it could
+    # be observed later on.
+    if python_version < 0x300:
+        return False
+
+    except_handler = statement.subnode_except_handler
+
+    if except_handler is None:
+        return False
+
+    if statement.subnode_break_handler is not None:
+        return False
+
+    if statement.subnode_continue_handler is not None:
+        return False
+
+    if statement.subnode_return_handler is not None:
+        return False
+
+    tried_statements = statement.subnode_tried.subnode_statements
+
+    if len(tried_statements) != 1:
+        return False
+
+    tried_statement = tried_statements[0]
+
+    if not tried_statement.isStatementAssignmentVariable():
+        return False
+
+    assign_source = tried_statement.subnode_source
+
+    if not assign_source.isExpressionSubscriptLookup():
+        return False
+
+    matched, handler_body = _getKeyErrorOnlyHandler(except_handler)
+
+    if not matched:
+        return False
+
+    emit("// Tried code, with 'KeyError' handled without raising it:")
+
+    with context.withCurrentSourceCodeReference(assign_source.getSourceReference()):
+        subscribed_name = generateChildExpressionCode(
+            expression=assign_source.subnode_expression, emit=emit, context=context
+        )
+
+        subscript_name = generateChildExpressionCode(
+            expression=assign_source.subnode_subscript, emit=emit, context=context
+        )
+
+        value_name = context.allocateTempName("subscript_result")
+
+        emit(
+            "%s = LOOKUP_SUBSCRIPT_NO_KEY_ERROR(tstate, %s, %s);"
+            % (value_name, subscribed_name, subscript_name)
+        )
+
+        getErrorExitBoolCode(
+            condition="%s == NULL && HAS_ERROR_OCCURRED(tstate)" % value_name,
+            release_names=(subscribed_name, subscript_name),
+            emit=emit,
+            context=context,
+        )
+
+    key_error_handler_label = context.allocateLabel("try_key_error_handler")
+
+    emit("if (%s == NULL) {" % value_name)
+    getGotoCode(key_error_handler_label, emit)
+    emit("}")
+
+    context.addCleanupTempName(value_name)
+
+    with context.withCurrentSourceCodeReference(tried_statement.getSourceReference()):
+        getVariableAssignmentCode(
+            tmp_name=value_name,
+            variable=tried_statement.getVariable(),
+            variable_trace=tried_statement.getVariableTrace(),
+            needs_release=None,
+            inplace=False,
+            emit=emit,
+            context=context,
+        )
+
+    if context.needsCleanup(value_name):
+        context.removeCleanupTempName(value_name)
+
+    post_label = context.allocateLabel("try_end")
+    getGotoCode(post_label, emit)
+
+    emit("// 'KeyError' handler code:")
+    getLabelCode(key_error_handler_label, emit)
+
+    generateStatementSequenceCode(
+        statement_sequence=handler_body, emit=emit, allow_none=True, context=context
+    )
+
+    emit("// End of try:")
+    getLabelCode(post_label, emit)
+
+    return True
+
+
 #     Part of "Nuitka", an optimizing Python compiler that is compatible and
 #     integrates with CPython, but also works on its own.
 #
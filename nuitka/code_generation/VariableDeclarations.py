@@ -178,7 +178,9 @@ class VariableStorage(object):
 
     def addFrameCacheDeclaration(self, frame_identifier):
         return self.addVariableDeclarationFunction(
-            "static struct Nuitka_FrameObject *", "cache_%s" % frame_identifier, "NULL"
+            "NUITKA_THREAD_CACHE_STORAGE struct Nuitka_FrameObject *",
+            "cache_%s" % frame_identifier,
+            "NULL",
         )
 
     def makeCStructLevelDeclarations(self):
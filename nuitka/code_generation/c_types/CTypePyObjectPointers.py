@@ -37,6 +37,7 @@ from nuitka.code_generation.templates.CodeTemplatesVariables import (
     template_write_shared_unclear_ref1,
 )
 from nuitka.Constants import getConstantValueGuide, isMutable
+from nuitka.PythonVersions import python_version
 
 from .CTypeBases import CTypeBase
 
@@ -193,7 +194,13 @@ class CPythonPyObjectPtrBase(CTypeBase):
                 else:
                     needs_deep = False
 
-                if needs_deep:
+                if needs_deep and python_version >= 0x360:
+                    code = 'DEEP_COPY_DICT_GUIDED(tstate, %s, "%s")' % (
+                        context.getConstantCode(constant, deep_check=False),
+                        getConstantValueGuide(constant, elements_only=True),
+                    )
+                    ref_count = 1
+                elif needs_deep:
                     code = "DEEP_COPY_DICT(tstate, %s)" % context.getConstantCode(
                         constant, deep_check=False
                     )
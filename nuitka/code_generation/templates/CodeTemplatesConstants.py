@@ -135,6 +135,7 @@ static void _createGlobalConstants(PyThreadState *tstate) {
         {(char *)"module", (char *)"boolean indicating --module usage"},
         {(char *)"main", (char *)"name of main module at runtime"},
         {(char *)"original_argv0", (char *)"original argv[0] as received by the onefile binary, None otherwise"},
+        {(char *)"free_list_stats", (char *)"function returning usage statistics of free lists for compiled objects"},
         {0}
     };
 
@@ -233,6 +234,8 @@ static void _createGlobalConstants(PyThreadState *tstate) {
 # endif
     PyStructSequence_SET_ITEM(Nuitka_dunder_compiled_value, 13, original_argv0);
 
+    PyStructSequence_SET_ITEM(Nuitka_dunder_compiled_value, 14, Nuitka_MakeFreeListStatisticsFunction());
+
     // Prevent users from creating the Nuitka version type object.
     Nuitka_VersionInfoType.tp_init = NULL;
     Nuitka_VersionInfoType.tp_new = NULL;
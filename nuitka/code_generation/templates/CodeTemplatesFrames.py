@@ -6,6 +6,9 @@
 # This uses STORE_GENERATOR_EXCEPTION,STORE_COROUTINE_EXCEPTION,STORE_ASYNCGEN_EXCEPTION
 
 template_frame_guard_normal_main_block = """\
+{% if lazy_frame %}
+// Frame is only created when an exception needs it for the traceback.
+{% else %}
 {% if frame_cache_identifier %}
 if (isFrameUnusable({{frame_cache_identifier}})) {
     Py_XDECREF({{frame_cache_identifier}});
@@ -19,6 +22,9 @@ if (isFrameUnusable({{frame_cache_identifier}})) {
     count_allocated_frame_cache_instances += 1;
 #endif
     {{frame_cache_identifier}} = {{make_frame_code}};
+#ifdef Py_GIL_DISABLED
+    Nuitka_ThreadCachesRegisterFrameCache(&{{frame_cache_identifier}});
+#endif
 #if _DEBUG_REFCOUNTS
 } else {
     count_hit_frame_cache_instances += 1;
@@ -55,6 +61,7 @@ pushFrameStackGeneratorCompiledFrame(tstate, {{frame_identifier}});
 pushFrameStackCompiledFrame(tstate, {{frame_identifier}});
 {% endif %}
 assert(Py_REFCNT({{frame_identifier}}) == 2);
+{% endif %}
 
 {% if context_identifier and is_python3 %}
 // Store currently existing exception as the one to publish again when we
@@ -75,7 +82,7 @@ DROP_{{context_identifier.upper()}}_EXCEPTION({{context_identifier}});
 RESTORE_FRAME_EXCEPTION(tstate, {{frame_identifier}});
 {% endif %}
 
-{% if not context_identifier %}
+{% if not context_identifier and not lazy_frame %}
 // Put the previous frame back on top.
 popFrameStack(tstate);
 {% endif %}
@@ -92,8 +99,10 @@ template_frame_guard_normal_return_handler = """\
 RESTORE_FRAME_EXCEPTION(tstate, {{frame_identifier}});
 {% endif %}
 
+{% if not lazy_frame %}
 // Put the previous frame back on top.
 popFrameStack(tstate);
+{% endif %}
 {% if frame_exit_code %}
 {{frame_exit_code}}s
 {% endif %}
@@ -111,6 +120,36 @@ Nuitka_Frame_AttachLocals(
 template_frame_guard_normal_exception_handler = """\
 {{frame_exception_exit}}:
 
+{% if lazy_frame %}
+// Create the frame only now, it was not needed before.
+if (isFrameUnusable({{frame_cache_identifier}})) {
+    Py_XDECREF({{frame_cache_identifier}});
+
+#if _DEBUG_REFCOUNTS
+    if ({{frame_cache_identifier}} == NULL) {
+        count_active_frame_cache_instances += 1;
+    } else {
+        count_released_frame_cache_instances += 1;
+    }
+    count_allocated_frame_cache_instances += 1;
+#endif
+    {{frame_cache_identifier}} = {{make_frame_code}};
+#ifdef Py_GIL_DISABLED
+    Nuitka_ThreadCachesRegisterFrameCache(&{{frame_cache_identifier}});
+#endif
+#if _DEBUG_REFCOUNTS
+} else {
+    count_hit_frame_cache_instances += 1;
+#endif
+}
+
+assert({{frame_cache_identifier}}->m_type_description == NULL);
+{{frame_identifier}} = {{frame_cache_identifier}};
+
+pushFrameStackCompiledFrame(tstate, {{frame_identifier}});
+assert(Py_REFCNT({{frame_identifier}}) == 2);
+
+{% endif %}
 {% if needs_preserve %}
 RESTORE_FRAME_EXCEPTION(tstate, {{frame_identifier}});
 {% endif %}
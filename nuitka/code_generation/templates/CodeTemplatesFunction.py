@@ -11,6 +11,10 @@ template_function_direct_declaration = """\
 %(file_scope)s PyObject *impl_%(function_identifier)s(PyThreadState *tstate, %(direct_call_arg_spec)s);
 """
 
+template_function_impl_declaration = """\
+static PyObject *impl_%(function_identifier)s(PyThreadState *tstate, struct Nuitka_FunctionObject const *self, PyObject **python_pars);
+"""
+
 template_maker_function_body = """
 static PyObject *%(function_maker_identifier)s(%(function_creation_args)s) {
     struct Nuitka_FunctionObject *result = Nuitka_Function_New(
@@ -291,7 +291,11 @@ PyObject *module_code_%(module_identifier)s(PyThreadState *tstate, PyObject *mod
 
         /* The constants only used by this module are created now. */
         NUITKA_PRINT_TRACE("%(module_identifier)s: Calling createModuleConstants().\n");
+        uint64_t constants_start_time = Nuitka_import_time_enabled ? getImportTimeNow() : 0;
         createModuleConstants(tstate);
+        if (unlikely(Nuitka_import_time_enabled)) {
+            recordImportTimeConstants(constants_start_time);
+        }
 
 #if !defined(_NUITKA_EXPERIMENTAL_NEW_CODE_OBJECTS)
         createModuleCodeObjects();
@@ -40,6 +40,8 @@ from nuitka.__past__ import MutableSet
 
 
 class OrderedSet(MutableSet):
+    __slots__ = ("end", "map")
+
     def __init__(self, iterable=()):
         self.end = end = []
         end += (None, end, end)  # sentinel node for doubly linked list
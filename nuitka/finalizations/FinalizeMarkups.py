@@ -15,6 +15,9 @@ Set a flag on return statements and functions that require the use of
 Set a flag on re-raises of exceptions if they can be simple throws or if they
 are in another context.
 
+Set a flag on module level functions, if calls to them check the called object
+and then use the implementation directly.
+
 """
 
 from nuitka import Tracing
@@ -62,6 +65,12 @@ class FinalizeMarkups(VisitorNoopMixin):
         if node.isExpressionFunctionCall():
             node.subnode_function.subnode_function_ref.getFunctionBody().markAsDirectlyCalled()
 
+        if node.isExpressionCall():
+            function_body = node.getGuardedDirectCallFunctionBody()
+
+            if function_body is not None:
+                function_body.markAsGuardedDirectlyCalled()
+
         if node.isExpressionFunctionRef():
             function_body = node.getFunctionBody()
             parent_module = function_body.getParentModule()
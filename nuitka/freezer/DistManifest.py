@@ -0,0 +1,284 @@
+#     Copyright 2026, Kay Hayen, mailto:kay.hayen@gmail.com find license text at end of file
+
+
+"""Manifest of the standalone distribution folder for incremental updates.
+
+With "--incremental-dist" the dist folder of a previous build is kept. For
+every file put there, the manifest records a description of its source and
+treatment, and the size and modification time of the result. Files with an
+unchanged description, that were not modified in the dist folder since, are
+then not copied and patched again. Files of the previous build that are no
+longer produced are removed. Content hashes of files, as used for the
+deduplication of the dist folder, are recorded too, so unchanged files need
+not be read again.
+"""
+
+import os
+
+from nuitka.options.Options import (
+    getMacOSTargetArch,
+    isUnstripped,
+    shallCreateAppBundle,
+    shallUpdateDistIncrementally,
+)
+from nuitka.OutputDirectories import (
+    getSourceDirectoryPath,
+    needsStandaloneDirectoryWorkaround,
+)
+from nuitka.PythonVersions import python_version_full_str
+from nuitka.Tracing import general
+from nuitka.utils.FileOperations import (
+    deleteFile,
+    getFileContentsHash,
+    getNormalizedPathJoin,
+    makePath,
+)
+from nuitka.utils.Hashing import getHashFromValues
+from nuitka.utils.Json import loadJsonFromFilename, writeJsonToFilename
+from nuitka.utils.Utils import isMacOS
+from nuitka.Version import version_string
+
+# Bump this if format is changed or enhanced implementation might different ones.
+_manifest_format_version = 2
+
+# Entries of the previous build, values are lists of description, size,
+# modification time, and content hash or None.
+_previous_entries = {}
+
+# Descriptions of the entries produced by this build.
+_current_entries = {}
+
+# Entries found unchanged from the previous build.
+_unchanged_entries = set()
+
+# Content hashes of entries of this build, where computed or reused.
+_current_hashes = {}
+
+# Count of entries that were found unchanged and not written again.
+_unchanged_count = 0
+
+_incremental = False
+
+
+def _getManifestFilename():
+    # The build directory is cleaned of generated files by extension, so use a
+    # sub-folder of its own.
+    return getNormalizedPathJoin(
+        getSourceDirectoryPath(onefile=False, create=False),
+        "incremental",
+        "dist-manifest.json",
+    )
+
+
+def _getTreatmentDescription():
+    # Things that change how all files are treated, plugins can modify DLLs
+    # after copying them.
+
+    # Cyclic dependency, plugins use data files, pylint: disable=cyclic-import
+    from nuitka.plugins.Plugins import getActivePlugins
+
+    return getHashFromValues(
+        version_string,
+        python_version_full_str,
+        str(isUnstripped()),
+        getMacOSTargetArch() if isMacOS() else None,
+        *sorted(plugin.plugin_name for plugin in getActivePlugins())
+    )
+
+
+def loadDistManifest():
+    """Load the manifest of the previous build, if incremental.
+
+    Returns:
+        bool: True if the dist folder is to be kept and updated, False if it
+        needs to be reset.
+    """
+    global _incremental  # singleton, pylint: disable=global-statement
+
+    if (
+        not shallUpdateDistIncrementally()
+        or shallCreateAppBundle()
+        or needsStandaloneDirectoryWorkaround()
+    ):
+        return False
+
+    # From here on, the manifest is written at the end, even if there is no
+    # previous one.
+    _incremental = True
+
+    manifest_filename = _getManifestFilename()
+
+    if not os.path.exists(manifest_filename):
+        return False
+
+    data = loadJsonFromFilename(manifest_filename)
+
+    if (
+        data is None
+        or data.get("file_format_version") != _manifest_format_version
+        or data.get("treatment") != _getTreatmentDescription()
+    ):
+        return False
+
+    _previous_entries.update(data["entries"])
+
+    return True
+
+
+def isDistEntryUnchanged(dist_dir, dest_path, description):
+    """Record an entry of the dist folder, and check if it needs no update.
+
+    Args:
+        dist_dir: The dist folder.
+        dest_path: Path of the entry relative to the dist folder.
+        description: Hash of source and treatment of the entry.
+
+    Returns:
+        bool: True if the entry from the previous build can be used as is.
+    """
+    global _unchanged_count  # singleton, pylint: disable=global-statement
+
+    if not _incremental:
+        return False
+
+    _current_entries[dest_path] = description
+
+    previous = _previous_entries.get(dest_path)
+
+    if previous is None or previous[0] != description:
+        return False
+
+    try:
+        stat_result = os.stat(os.path.join(dist_dir, dest_path))
+    except OSError:
+        return False
+
+    if [stat_result.st_size, stat_result.st_mtime] != previous[1:3]:
+        return False
+
+    _unchanged_count += 1
+    _unchanged_entries.add(dest_path)
+    return True
+
+
+def getDistEntryContentHash(dist_dir, dest_path):
+    """Content hash of an entry of the dist folder.
+
+    Args:
+        dist_dir: The dist folder.
+        dest_path: Path of the entry relative to the dist folder.
+
+    Returns:
+        str: Hash of the contents, from the previous build if the entry is
+        unchanged.
+    """
+    if dest_path in _current_hashes:
+        return _current_hashes[dest_path]
+
+    if dest_path in _unchanged_entries and _previous_entries[dest_path][3]:
+        result = _previous_entries[dest_path][3]
+    else:
+        result = getFileContentsHash(os.path.join(dist_dir, dest_path))
+
+    if _incremental:
+        _current_hashes[dest_path] = result
+
+    return result
+
+
+def getFileSourceDescription(source_path, *treatment):
+    """Description of a file copied to the dist folder, for the manifest."""
+    stat_result = os.stat(source_path)
+
+    return getHashFromValues(
+        os.path.abspath(source_path),
+        stat_result.st_size,
+        repr(stat_result.st_mtime),
+        *treatment
+    )
+
+
+def _removeEmptyParentDirectories(dist_dir, dest_path):
+    dirname = os.path.dirname(dest_path)
+
+    while dirname:
+        path = os.path.join(dist_dir, dirname)
+
+        if not os.path.isdir(path) or os.listdir(path):
+            break
+
+        os.rmdir(path)
+        dirname = os.path.dirname(dirname)
+
+
+def finishDistManifest(dist_dir):
+    """Remove entries no longer produced and write the manifest."""
+
+    if not _incremental:
+        return
+
+    removed_count = 0
+
+    for dest_path in _previous_entries:
+        if dest_path not in _current_entries:
+            full_path = os.path.join(dist_dir, dest_path)
+
+            if os.path.isfile(full_path):
+                deleteFile(full_path, must_exist=True)
+                _removeEmptyParentDirectories(dist_dir, dest_path)
+
+                removed_count += 1
+
+    entries = {}
+
+    for dest_path, description in _current_entries.items():
+        try:
+            stat_result = os.stat(os.path.join(dist_dir, dest_path))
+        except OSError:
+            continue
+
+        entries[dest_path] = [
+            description,
+            stat_result.st_size,
+            stat_result.st_mtime,
+            _current_hashes.get(dest_path),
+        ]
+
+    manifest_filename = _getManifestFilename()
+    makePath(os.path.dirname(manifest_filename))
+
+    writeJsonToFilename(
+        filename=manifest_filename,
+        contents={
+            "file_format_version": _manifest_format_version,
+            "treatment": _getTreatmentDescription(),
+            "entries": entries,
+        },
+        indent=None,
+    )
+
+    if _previous_entries:
+        general.info(
+            "Incremental dist folder update kept %d files, updated %d files, and removed %d files."
+            % (
+                _unchanged_count,
+                len(_current_entries) - _unchanged_count,
+                removed_count,
+            )
+        )
+
+
+#     Part of "Nuitka", an optimizing Python compiler that is compatible and
+#     integrates with CPython, but also works on its own.
+#
+#     Licensed under the GNU Affero General Public License, Version 3 (the "License");
+#     you may not use this file except in compliance with the License.
+#     You may obtain a copy of the License at
+#
+#        http://www.gnu.org/licenses/agpl.txt
+#
+#     Unless required by applicable law or agreed to in writing, software
+#     distributed under the License is distributed on an "AS IS" BASIS,
+#     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#     See the License for the specific language governing permissions and
+#     limitations under the License.
@@ -23,6 +23,7 @@ from nuitka.PythonFlavors import isAnacondaPython
 from nuitka.PythonVersions import getSystemPrefixPath
 from nuitka.Tracing import inclusion_logger
 from nuitka.utils.AppDirs import getCacheDir
+from nuitka.utils.CacheUsage import countCacheHit, countCacheMiss
 from nuitka.utils.Execution import executeToolChecked
 from nuitka.utils.FileOperations import (
     areSamePaths,
@@ -310,6 +311,7 @@ def detectBinaryPathDLLsWin32(
             with withFileLock():
                 if not os.path.exists(cache_filename):
                     use_cache = False
+                    countCacheMiss("dll-dependencies")
 
                     if isShowProgress():
                         inclusion_logger.info(
@@ -331,10 +333,13 @@ def detectBinaryPathDLLsWin32(
                             % (binary_filename, filename)
                         )
 
+                    countCacheMiss("dll-dependencies")
                     break
 
                 result.add(line)
             else:
+                countCacheHit("dll-dependencies", cache_filename)
+
                 return result
 
     if isShowProgress():
@@ -20,6 +20,7 @@ from nuitka.options.Options import (
     getOutputPath,
     getShallIncludeDataDirs,
     getShallIncludeDataFiles,
+    getShallIncludeEmbeddedDataFilePatterns,
     getShallIncludeExternallyDataFilePatterns,
     getShallIncludePackageData,
     getShallIncludeRawDirs,
@@ -41,6 +42,7 @@ from nuitka.utils.FileOperations import (
     areSamePaths,
     containsPathElements,
     copyFileWithPermissions,
+    deleteFile,
     getFileContents,
     getFileList,
     getFilenameExtension,
@@ -54,9 +56,12 @@ from nuitka.utils.FileOperations import (
     relpath,
     resolveShellPatternToFilenames,
 )
+from nuitka.utils.Hashing import getHashFromValues
 from nuitka.utils.Importing import getExtensionModuleSuffixes
 from nuitka.utils.Utils import getArchitecture, isAIX, isMacOS
 
+from .DistManifest import getFileSourceDescription, isDistEntryUnchanged
+
 data_file_tags = []
 
 
@@ -505,6 +510,21 @@ def addIncludedDataFile(included_datafile):
 Error, when asking to copy files external data, you cannot output to\
 same directory and need to use '--output-dir' option.""")
 
+        # Only files, generated data files are not considered for embedding.
+        if (
+            included_datafile.kind == "data_file"
+            and "external" not in included_datafile.tags
+        ):
+            for embedded_datafile_pattern in getShallIncludeEmbeddedDataFilePatterns():
+                if fnmatch.fnmatch(
+                    included_datafile.dest_path, embedded_datafile_pattern
+                ) or isFilenameBelowPath(
+                    path=embedded_datafile_pattern,
+                    filename=included_datafile.dest_path,
+                ):
+                    included_datafile.tags.add("embedded")
+                    break
+
     _included_data_files.append(included_datafile)
 
 
@@ -517,6 +537,23 @@ def getIncludedDataFiles():
     return _included_data_files
 
 
+def getEmbeddedDataFiles():
+    """Get the data files to be embedded into the binary.
+
+    Returns:
+        list: Tuples of destination path, using "/" as separator, and source
+        path of the data files.
+    """
+    if not isStandaloneMode():
+        return []
+
+    return [
+        (included_datafile.dest_path.replace("\\", "/"), included_datafile.source_path)
+        for included_datafile in getIncludedDataFiles()
+        if included_datafile.needsCopy() and "embedded" in included_datafile.tags
+    ]
+
+
 def getIncludedFrameworkDistPathFromSourcePath(source_path):
     """Get destination path of an included framework file from source path.
 
@@ -909,6 +946,17 @@ Error, data file to be placed in distribution as '%s' conflicts with %s '%s'."""
         dest_path = os.path.dirname(dest_path)
 
 
+def _getDataFileDescription(included_datafile):
+    if included_datafile.kind == "data_blob":
+        return getHashFromValues(
+            "data_blob",
+            included_datafile.data,
+            str("script" in included_datafile.tags),
+        )
+    else:
+        return getFileSourceDescription(included_datafile.source_path, "data_file")
+
+
 def _handleDataFile(included_datafile, standalone_entry_points):
     """Handle a single data file, writing or copying it.
 
@@ -945,6 +993,18 @@ def _handleDataFile(included_datafile, standalone_entry_points):
         dest_path = os.path.join(dist_dir, included_datafile.dest_path)
         external = False
 
+    # Unchanged from the previous build, only with "--incremental-dist".
+    if not external and isDistEntryUnchanged(
+        dist_dir=dist_dir,
+        dest_path=included_datafile.dest_path,
+        description=_getDataFileDescription(included_datafile),
+    ):
+        return external, dest_path
+
+    # Files of previous builds may be hard links or symbolic links, that must
+    # not be written through.
+    deleteFile(dest_path, must_exist=False)
+
     if included_datafile.kind == "data_blob":
         makePath(os.path.dirname(dest_path))
 
@@ -984,10 +1044,16 @@ def copyDataFiles(standalone_entry_points):
     """
 
     data_file_paths = []
+    embedded_count = 0
 
     for included_datafile in getIncludedDataFiles():
         # TODO: directories should be resolved to files.
         if included_datafile.needsCopy():
+            # These were put into the constants blob already.
+            if "embedded" in included_datafile.tags and isStandaloneMode():
+                embedded_count += 1
+                continue
+
             if shallMakeModule():
                 options_logger.sysexit("""\
 Error, data files for modules must be done via wheels, or commercial plugins \
@@ -1007,6 +1073,12 @@ plugins '--embed-*' options. Not done for '%s'.""" % included_datafile.dest_path
 
     _reportDataFiles()
 
+    if embedded_count:
+        inclusion_logger.info(
+            "Embedded %d data files into the binary rather than copying them."
+            % embedded_count
+        )
+
     return data_file_paths
 
 
@@ -17,6 +17,7 @@ from nuitka.build.SconsInterface import (
 from nuitka.build.SconsUtils import getSconsReportValue
 from nuitka.options.Options import (
     getJobLimit,
+    getOnefileCompressionLevel,
     getOnefileTempDirSpec,
     getProgressBar,
     getWindowsSplashScreen,
@@ -27,6 +28,7 @@ from nuitka.options.Options import (
     shallNotCompressOnefile,
     shallOnefileAsArchive,
     shallTraceExecution,
+    shallUseOnefileCompressionDictionary,
 )
 from nuitka.OutputDirectories import getResultFullpath, getSourceDirectoryPath
 from nuitka.plugins.Hooks import (
@@ -43,6 +45,7 @@ from nuitka.PythonVersions import (
 )
 from nuitka.States import states
 from nuitka.Tracing import onefile_logger, postprocessing_logger
+from nuitka.utils.CacheUsage import mergeCacheUsageStatistics
 from nuitka.utils.Execution import withEnvironmentVarsOverridden
 from nuitka.utils.FileOperations import (
     areSamePaths,
@@ -52,7 +55,7 @@ from nuitka.utils.FileOperations import (
     removeDirectory,
 )
 from nuitka.utils.InstalledPythons import findInstalledPython
-from nuitka.utils.Json import writeJsonToFilename
+from nuitka.utils.Json import loadJsonFromFilename, writeJsonToFilename
 from nuitka.utils.SharedLibraries import cleanupHeaderForAndroid
 from nuitka.utils.Signing import addMacOSCodeSignature
 from nuitka.utils.Utils import (
@@ -195,10 +198,12 @@ def runOnefileCompressor(
             include_start_binary=hasOnefilePayloadMainEntry(),
             expect_compression=compressor_python is not None,
             as_archive=shallOnefileAsArchive(),
+            use_dictionary=shallUseOnefileCompressionDictionary(),
             use_compression_cache=not shallDisableCompressionCacheUsage(),
             file_checksums=file_checksums,
             win_path_sep=win_path_sep,
             low_memory=isLowMemory(),
+            compression_level=getOnefileCompressionLevel(),
             job_limit=getJobLimit(),
             expected_files=expected_files,
         )
@@ -208,6 +213,10 @@ def runOnefileCompressor(
         )
         writeJsonToFilename(expected_files_filename, expected_files)
 
+        cache_usage_filename = os.path.join(
+            getSourceDirectoryPath(onefile=True, create=False), "cache_usage.json"
+        )
+
         onefile_compressor_path = os.path.normpath(
             os.path.join(os.path.dirname(__file__), "..", "tools", "onefile_compressor")
         )
@@ -241,10 +250,17 @@ def runOnefileCompressor(
                     str(not shallDisableCompressionCacheUsage()),
                     str(getJobLimit()),
                     expected_files_filename,
+                    str(shallUseOnefileCompressionDictionary()),
+                    str(getOnefileCompressionLevel()),
+                    cache_usage_filename,
                 ],
                 shell=False,
             )
 
+        cache_usage_stats = loadJsonFromFilename(cache_usage_filename)
+        if cache_usage_stats is not None:
+            mergeCacheUsageStatistics(cache_usage_stats)
+
 
 def packDistFolderToOnefileBootstrap(onefile_output_filename, dist_dir, start_binary):
     onefile_logger.info("Creating single file from dist folder, this may take a while.")
@@ -18,6 +18,8 @@ from nuitka.importing.Importing import (
 )
 from nuitka.importing.StandardLibrary import isStandardLibraryPath
 from nuitka.options.Options import (
+    getJobLimit,
+    isOnefileMode,
     isShowProgress,
     shallCreateAppBundle,
     shallNotStoreDependsExeCachedResults,
@@ -30,6 +32,7 @@ from nuitka.plugins.Hooks import (
 )
 from nuitka.Progress import (
     closeProgressBar,
+    enableThreading,
     reportProgressBar,
     setupProgressBar,
 )
@@ -48,16 +51,21 @@ from nuitka.Tracing import general, inclusion_logger
 from nuitka.utils.Execution import executeToolChecked
 from nuitka.utils.FileOperations import (
     areInSamePaths,
+    deleteFile,
     getFileList,
+    getFileSize,
+    getIdenticalFiles,
     getNormalizedPathJoin,
     getSubDirectories,
     isFilenameBelowPath,
+    isSharedLibraryFilename,
     makePath,
     relpath,
     withMadeWritableFileMode,
 )
 from nuitka.utils.SharedLibraries import copyDllFile, setSharedLibraryRPATH
 from nuitka.utils.Signing import addMacOSCodeSignature
+from nuitka.utils.ThreadedExecutor import iterateThreaded
 from nuitka.utils.Timing import TimerReport
 from nuitka.utils.Utils import (
     getOS,
@@ -68,6 +76,11 @@ from nuitka.utils.Utils import (
     isWin32Windows,
 )
 
+from .DistManifest import (
+    getDistEntryContentHash,
+    getFileSourceDescription,
+    isDistEntryUnchanged,
+)
 from .DllDependenciesMacOS import (
     detectBinaryPathDLLsMacOS,
     fixupBinaryDLLPathsMacOS,
@@ -224,15 +237,43 @@ def copyDllsUsed(dist_dir, standalone_entry_points):
             "$ORIGIN",
         )
 
+    # For incremental updates, the RPATH values given depend on where other
+    # DLLs are located, and on macOS, the DLL paths are fixed up for all others.
+    if isMacOS():
+        dll_treatment = sorted(
+            standalone_entry_point.dest_path
+            for standalone_entry_point in standalone_entry_points
+        )
+    else:
+        dll_treatment = sorted(
+            set(
+                os.path.dirname(standalone_entry_point.dest_path)
+                for standalone_entry_point in copy_standalone_entry_points
+            )
+        )
+
+    changed_standalone_entry_points = [
+        standalone_entry_point
+        for standalone_entry_point in copy_standalone_entry_points
+        if not isDistEntryUnchanged(
+            dist_dir=dist_dir,
+            dest_path=standalone_entry_point.dest_path,
+            description=getFileSourceDescription(
+                standalone_entry_point.source_path,
+                "dll",
+                str(standalone_entry_point.executable),
+                dll_treatment,
+            ),
+        )
+    ]
+
     setupProgressBar(
         stage="Copying used DLLs",
         unit="DLL",
-        total=len(copy_standalone_entry_points),
+        total=len(changed_standalone_entry_points),
     )
 
-    for standalone_entry_point in copy_standalone_entry_points:
-        reportProgressBar(standalone_entry_point.dest_path)
-
+    def copyDll(standalone_entry_point):
         copyDllFile(
             source_path=standalone_entry_point.source_path,
             dist_dir=dist_dir,
@@ -251,16 +292,89 @@ def copyDllsUsed(dist_dir, standalone_entry_points):
                 standalone_entry_points=standalone_entry_points,
             )
 
+    # The DLLs are independent of one another, and the time is spent in file
+    # copies and external tools for RPATH changes, so use threads for them.
+    job_limit = getJobLimit()
+
+    if job_limit > 1:
+        enableThreading()
+
+    for standalone_entry_point, _result in iterateThreaded(
+        function=copyDll,
+        items=changed_standalone_entry_points,
+        max_workers=job_limit,
+    ):
+        reportProgressBar(standalone_entry_point.dest_path)
+
     closeProgressBar()
 
+    # Only DLLs that were copied are new to plugins.
     onCopiedDLLs(
         dist_dir=dist_dir,
-        standalone_entry_points=copy_standalone_entry_points,
+        standalone_entry_points=changed_standalone_entry_points,
     )
 
     return main_standalone_entry_point, copy_standalone_entry_points
 
 
+def deduplicateDistFiles(dist_dir, data_file_paths):
+    """Replace data files with identical contents in the dist folder by hard links.
+
+    Packages often contain the same files more than once, e.g. license files.
+    DLLs and extension modules are not considered, since loaders identify
+    them by device and inode, and would load hard linked copies only once.
+
+    Args:
+        dist_dir: The dist folder.
+        data_file_paths: Paths of the data files relative to the dist folder.
+    """
+
+    # Code signing on macOS changes files in place, and for onefile, the
+    # payload does its own deduplication.
+    if isMacOS() or isOnefileMode() or not hasattr(os, "link"):
+        return
+
+    dest_paths = dict(
+        (os.path.join(dist_dir, dest_path), dest_path)
+        for dest_path in data_file_paths
+        if not isSharedLibraryFilename(dest_path)
+    )
+
+    def getHash(filename):
+        return getDistEntryContentHash(
+            dist_dir=dist_dir, dest_path=dest_paths[filename]
+        )
+
+    count = 0
+    saved_size = 0
+
+    for filename, first_filename in sorted(
+        getIdenticalFiles(filenames=dest_paths, get_hash=getHash).items()
+    ):
+        if os.path.samefile(filename, first_filename):
+            continue
+
+        temp_filename = filename + ".tmp"
+
+        try:
+            os.link(first_filename, temp_filename)
+        except OSError:
+            # File system without hard links, then keep the copies.
+            break
+
+        deleteFile(filename, must_exist=True)
+        os.rename(temp_filename, filename)
+
+        count += 1
+        saved_size += getFileSize(filename)
+
+    if count:
+        general.info(
+            "Replaced %d files in dist folder with identical contents by hard links, saving %d bytes."
+            % (count, saved_size)
+        )
+
+
 def signDistributionMacOS(
     dist_dir, data_file_paths, main_standalone_entry_point, copy_standalone_entry_points
 ):
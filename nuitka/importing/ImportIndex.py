@@ -0,0 +1,271 @@
+#     Copyright 2026, Kay Hayen, mailto:kay.hayen@gmail.com find license text at end of file
+
+
+"""Persistent index of the directories used to locate modules.
+
+Module finding asks the file system the same questions over and over, does
+"x/__init__.py" exist, is "x" a directory, is there "x.so" or "x.py" in a
+given search path entry. For large environments, these are many thousands of
+"stat" calls, and they are repeated by every compiler process.
+
+This keeps a listing of files and sub-directories per directory that has been
+looked at, and stores it in the "import-index" cache. Entries are validated
+with a single "stat" of the directory itself, comparing its modification time,
+which changes whenever entries are added, removed, or renamed in it. Module
+kinds, package directories and namespace packages are then derived from these
+listings with in-memory lookups only.
+"""
+
+import os
+import stat
+import sys
+import time
+
+from nuitka.Tracing import recursion_logger
+from nuitka.utils.AppDirs import getCacheDir
+from nuitka.utils.CacheUsage import countCacheHit, countCacheMiss
+from nuitka.utils.FileOperations import getNormalizedPathJoin
+from nuitka.utils.Hashing import getHashFromValues
+from nuitka.utils.Json import loadJsonFromFilename, writeJsonToFilenameAtomic
+from nuitka.utils.Utils import isMacOS, isWin32OrPosixWindows
+from nuitka.Version import version_string
+
+# Bump this if format is changed or enhanced implementation might different ones.
+_index_format_version = 1
+
+# Directories modified this recently are not stored persistently, as another
+# change within the resolution of the file system timestamps could go unseen.
+_racy_mtime_seconds = 2
+
+# Some platforms are case insensitive, lookups there must be too.
+_case_sensitive = not isMacOS() and not isWin32OrPosixWindows()
+
+# Persistent directory listings, loaded on first use, values are tuples of
+# modification time, file names, and directory names.
+_index = None
+_index_changed = False
+
+# Directory listings validated in this process, values are tuples of file and
+# directory names for lookups, or None for non-directories.
+_validated = {}
+
+_index_enabled = True
+
+
+def _normcase(name):
+    if _case_sensitive:
+        return name
+    else:
+        # Not using "os.path.normcase", it does nothing on macOS.
+        return name.lower()
+
+
+def _getIndexFilename():
+    # Index per Python installation, so different environments do not compete
+    # for the same file.
+    return getNormalizedPathJoin(
+        getCacheDir("import-index", create=True),
+        "%s.json"
+        % getHashFromValues(sys.prefix, sys.executable, sys.version, version_string),
+    )
+
+
+def _loadIndexFile(filename):
+    if not os.path.exists(filename):
+        return {}
+
+    data = loadJsonFromFilename(filename)
+
+    if data is None or data.get("file_format_version") != _index_format_version:
+        return {}
+
+    return data["directories"]
+
+
+def _getIndex():
+    global _index  # singleton, pylint: disable=global-statement
+
+    if _index is None:
+        if _index_enabled:
+            index_filename = _getIndexFilename()
+            _index = _loadIndexFile(index_filename)
+
+            if _index:
+                countCacheHit("import-index", index_filename)
+            else:
+                countCacheMiss("import-index")
+        else:
+            _index = {}
+
+    return _index
+
+
+def _scanDirectory(dirname):
+    filenames = []
+    dirnames = []
+
+    if hasattr(os, "scandir"):
+        for entry in os.scandir(dirname):
+            try:
+                is_dir = entry.is_dir()
+            except OSError:
+                continue
+
+            (dirnames if is_dir else filenames).append(entry.name)
+    else:
+        for name in os.listdir(dirname):
+            path = os.path.join(dirname, name)
+
+            if os.path.isdir(path):
+                dirnames.append(name)
+            elif os.path.exists(path):
+                filenames.append(name)
+
+    return sorted(filenames), sorted(dirnames)
+
+
+def _getDirectoryListing(dirname):
+    """Get file and directory names of a directory, None if not a directory."""
+    global _index_changed  # singleton, pylint: disable=global-statement
+
+    dirname = os.path.abspath(dirname)
+
+    if dirname in _validated:
+        return _validated[dirname]
+
+    try:
+        dir_stat = os.stat(dirname)
+    except OSError:
+        dir_stat = None
+
+    if dir_stat is None or not stat.S_ISDIR(dir_stat.st_mode):
+        result = None
+    else:
+        index = _getIndex()
+        mtime = dir_stat.st_mtime
+
+        entry = index.get(dirname)
+
+        if entry is None or entry[0] != mtime:
+            try:
+                filenames, dirnames = _scanDirectory(dirname)
+            except OSError:
+                filenames, dirnames = (), ()
+            else:
+                if mtime < time.time() - _racy_mtime_seconds:
+                    index[dirname] = (mtime, filenames, dirnames)
+                    _index_changed = True
+                elif dirname in index:
+                    del index[dirname]
+                    _index_changed = True
+        else:
+            filenames, dirnames = entry[1], entry[2]
+
+        result = (
+            frozenset(_normcase(name) for name in filenames),
+            frozenset(_normcase(name) for name in dirnames),
+        )
+
+    _validated[dirname] = result
+    return result
+
+
+def _splitPath(path):
+    dirname, basename = os.path.split(path)
+
+    if not basename or basename in (".", ".."):
+        return None, None
+
+    return dirname or ".", _normcase(basename)
+
+
+def isIndexedFile(path):
+    """Check if a path is a file, like "os.path.isfile" does."""
+    dirname, basename = _splitPath(path)
+
+    if dirname is None:
+        return os.path.isfile(path)
+
+    listing = _getDirectoryListing(dirname)
+
+    return listing is not None and basename in listing[0]
+
+
+def isIndexedDirectory(path):
+    """Check if a path is a directory, like "os.path.isdir" does."""
+    dirname, basename = _splitPath(path)
+
+    if dirname is None:
+        return os.path.isdir(path)
+
+    listing = _getDirectoryListing(dirname)
+
+    return listing is not None and basename in listing[1]
+
+
+def isIndexedPath(path):
+    """Check if a path exists, like "os.path.exists" does."""
+    dirname, basename = _splitPath(path)
+
+    if dirname is None:
+        return os.path.exists(path)
+
+    listing = _getDirectoryListing(dirname)
+
+    return listing is not None and (basename in listing[0] or basename in listing[1])
+
+
+def flushImportIndex():
+    """Forget what was validated in this process, files may have changed."""
+    _validated.clear()
+
+
+def setupImportIndex(enabled):
+    """Decide if the persistent index is to be used, from options."""
+    global _index_enabled  # singleton, pylint: disable=global-statement
+    _index_enabled = enabled
+
+
+def saveImportIndex():
+    """Store the index for use by the next compilation, if anything changed."""
+    global _index_changed  # singleton, pylint: disable=global-statement
+
+    if not _index_enabled or not _index_changed:
+        return
+
+    filename = _getIndexFilename()
+
+    # Merge with what concurrent compilations may have written meanwhile, our
+    # entries were validated most recently, so they win.
+    directories = _loadIndexFile(filename)
+    directories.update(_index)
+
+    data = {
+        "file_format_version": _index_format_version,
+        "directories": directories,
+    }
+
+    try:
+        writeJsonToFilenameAtomic(filename=filename, contents=data, indent=None)
+    except (IOError, OSError) as e:
+        recursion_logger.warning(
+            "Failed to write import index '%s' due to '%s'." % (filename, e)
+        )
+    else:
+        _index_changed = False
+
+
+#     Part of "Nuitka", an optimizing Python compiler that is compatible and
+#     integrates with CPython, but also works on its own.
+#
+#     Licensed under the GNU Affero General Public License, Version 3 (the "License");
+#     you may not use this file except in compliance with the License.
+#     You may obtain a copy of the License at
+#
+#        http://www.gnu.org/licenses/agpl.txt
+#
+#     Unless required by applicable law or agreed to in writing, software
+#     distributed under the License is distributed on an "AS IS" BASIS,
+#     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#     See the License for the specific language governing permissions and
+#     limitations under the License.
@@ -34,6 +34,7 @@ from nuitka.options.Options import (
     getMainEntryPointFilenames,
     getOutputFolderName,
     hasPythonFlagNoCurrentDirectoryInPath,
+    shallDisableCacheUsage,
     shallExplainImports,
 )
 from nuitka.OutputDirectories import getSourceDirectoryPath
@@ -75,6 +76,13 @@ from nuitka.utils.Utils import (
 )
 
 from .IgnoreListing import isIgnoreListedNotExistingModule
+from .ImportIndex import (
+    flushImportIndex,
+    isIndexedDirectory,
+    isIndexedFile,
+    isIndexedPath,
+    setupImportIndex,
+)
 from .PreloadedPackages import getPreloadedPackagePath, isPreloadedPackagePath
 from .StandardLibrary import isStandardLibraryPath
 
@@ -96,6 +104,8 @@ def setupImportingFromOptions():
     global _safe_path
     _safe_path = hasPythonFlagNoCurrentDirectoryInPath()
 
+    setupImportIndex(enabled=not shallDisableCacheUsage("import-index"))
+
     # Lets try and have this complete, please report failures.
     if states.is_debug and not isMonolithPy():
         _checkRaisingBuiltinComplete()
@@ -228,7 +238,7 @@ def isPackageDir(dirname):
 
     return (
         "." not in os.path.basename(dirname)
-        and os.path.isdir(dirname)
+        and isIndexedDirectory(dirname)
         and (
             python_version >= 0x300
             or isPreloadedPackagePath(dirname)
@@ -536,6 +546,7 @@ def flushImportCache():
     """
     _list_dir_cache.clear()
     module_search_cache.clear()
+    flushImportIndex()
 
 
 def _findModuleInPath3(
@@ -556,7 +567,7 @@ def _findModuleInPath3(
         "C_EXTENSION": 1,
     }
 
-    if os.path.isdir(package_directory):
+    if isIndexedDirectory(package_directory):
         found = False
 
         for suffix, module_type in getModuleFilenameSuffixes():
@@ -564,7 +575,7 @@ def _findModuleInPath3(
 
             file_path = getNormalizedPathJoin(package_directory, package_file_name)
 
-            if os.path.isfile(file_path):
+            if isIndexedFile(file_path):
                 yield (
                     ImportScanFinding(
                         found_as=ModuleName.makeModuleNameInPackage(
@@ -603,7 +614,7 @@ def _findModuleInPath3(
 
             full_path = getNormalizedPathJoin(search_path_entry, module_name + suffix)
 
-            if os.path.isfile(full_path):
+            if isIndexedFile(full_path):
                 yield (
                     ImportScanFinding(
                         found_as=ModuleName.makeModuleNameInPackage(
@@ -862,7 +873,7 @@ def getPackageSearchPath(package_name):
                     result.append(package_dir)
 
     return OrderedSet(
-        element for element in OrderedSet(result) if os.path.exists(element)
+        element for element in OrderedSet(result) if isIndexedPath(element)
     )
 
 
@@ -32,6 +32,63 @@ class ExpressionCallMixin(object):
     def mayRaiseExceptionOperation():
         return True
 
+    def getGuardedDirectCallFunctionBody(self):
+        """Function body a call to a module variable is expected to go to.
+
+        Module level functions are typically never assigned again, but other
+        code can still do that, so calls to this function body need to check
+        at run time, if the called object is still created from it. Only
+        positional calls that provide exactly the arguments of functions
+        without star or keyword only parameters are considered.
+        """
+        call_kw = self.subnode_kwargs
+
+        if call_kw is not None and not call_kw.isExpressionConstantDictEmptyRef():
+            return None
+
+        call_args = self.subnode_args
+
+        if call_args is None:
+            arg_count = 0
+        elif call_args.isExpressionConstantRef():
+            arg_count = len(call_args.getCompileTimeConstant())
+        elif call_args.isExpressionMakeTuple():
+            arg_count = len(call_args.subnode_elements)
+        else:
+            return None
+
+        called = self.subnode_called
+
+        if not called.isExpressionVariableRef():
+            return None
+
+        variable = called.getVariable()
+
+        if not variable.isModuleVariable():
+            return None
+
+        source = variable.getSingleModuleAssignSource()
+
+        if source is None or not source.isExpressionFunctionCreation():
+            return None
+
+        function_body = source.subnode_function_ref.getFunctionBody()
+
+        if function_body.getConstantReturnValue()[0]:
+            return None
+
+        parameters = function_body.getParameters()
+
+        if (
+            parameters.getListStarArgVariable() is not None
+            or parameters.getDictStarArgVariable() is not None
+            or parameters.getKwOnlyParameterCount() != 0
+            or parameters.getArgumentCount() != arg_count
+        ):
+            return None
+
+        return function_body
+
 
 class ExpressionCall(ExpressionCallMixin, ChildrenExpressionCallMixin, ExpressionBase):
     kind = "EXPRESSION_CALL"
@@ -22230,6 +22230,8 @@ class ChildHavingValueMixin(object):
     #   ExpressionBuiltinType1
     #   ExpressionFunctionErrorStr
     #   ExpressionKeyValuePairConstantKey
+    #   ExpressionMakeDictForIterator
+    #   ExpressionMakeListForIterator
     #   ExpressionMatchTypeCheckMapping
     #   ExpressionMatchTypeCheckSequence
     #   ExpressionSpecialUnpack
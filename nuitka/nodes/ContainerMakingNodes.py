@@ -8,7 +8,10 @@ from abc import abstractmethod
 
 from nuitka.PythonVersions import needsSetLiteralReverseInsertion
 
-from .ChildrenHavingMixins import ChildHavingElementsTupleMixin
+from .ChildrenHavingMixins import (
+    ChildHavingElementsTupleMixin,
+    ChildHavingValueMixin,
+)
 from .ConstantRefNodes import (
     ExpressionConstantListEmptyRef,
     ExpressionConstantSetEmptyRef,
@@ -17,6 +20,7 @@ from .ConstantRefNodes import (
 )
 from .ExpressionBases import ExpressionBase
 from .ExpressionShapeMixins import (
+    ExpressionDictShapeExactMixin,
     ExpressionListShapeExactMixin,
     ExpressionSetShapeExactMixin,
     ExpressionTupleShapeExactMixin,
@@ -389,6 +393,42 @@ class ExpressionMakeSetLiteral(ExpressionMakeSet):
         return reversed_set
 
 
+class ExpressionMakeContainerForIteratorBase(
+    SideEffectsFromChildrenMixin, ChildHavingValueMixin, ExpressionBase
+):
+    """Empty container with space for what is left in an iterator.
+
+    Used for contractions, which fill their container from the iterator. The
+    length is only a hint taken from built-in iterators that know it, so no
+    user code is run, and other iterators give normal empty containers.
+    """
+
+    named_children = ("value",)
+
+    def __init__(self, value, source_ref):
+        ChildHavingValueMixin.__init__(self, value=value)
+
+        ExpressionBase.__init__(self, source_ref)
+
+    def computeExpression(self, trace_collection):
+        return self, None, None
+
+    def mayRaiseException(self, exception_type):
+        return self.subnode_value.mayRaiseException(exception_type)
+
+
+class ExpressionMakeListForIterator(
+    ExpressionListShapeExactMixin, ExpressionMakeContainerForIteratorBase
+):
+    kind = "EXPRESSION_MAKE_LIST_FOR_ITERATOR"
+
+
+class ExpressionMakeDictForIterator(
+    ExpressionDictShapeExactMixin, ExpressionMakeContainerForIteratorBase
+):
+    kind = "EXPRESSION_MAKE_DICT_FOR_ITERATOR"
+
+
 #     Part of "Nuitka", an optimizing Python compiler that is compatible and
 #     integrates with CPython, but also works on its own.
 #
@@ -597,6 +597,7 @@ class ExpressionFunctionBody(
         "return_exception",
         "needs_creation",
         "needs_direct",
+        "needs_guarded_direct",
         "cross_module_use",
         "parameters",
     )
@@ -640,6 +641,9 @@ class ExpressionFunctionBody(
         # Indicator if the function is called directly.
         self.needs_direct = False
 
+        # Indicator if the function object is called directly after a check.
+        self.needs_guarded_direct = False
+
         # Indicator if the function is used outside of where it's defined.
         self.cross_module_use = False
 
@@ -739,6 +743,12 @@ class ExpressionFunctionBody(
     def markAsDirectlyCalled(self):
         self.needs_direct = True
 
+    def needsGuardedDirectCall(self):
+        return self.needs_guarded_direct
+
+    def markAsGuardedDirectlyCalled(self):
+        self.needs_guarded_direct = True
+
     def isCrossModuleUsed(self):
         return self.cross_module_use
 
@@ -12,6 +12,7 @@ from nuitka.importing.ImportCache import (
     isImportedModuleByName,
     replaceImportedModule,
 )
+from nuitka.importing.StandardLibrary import isStandardLibraryPath
 from nuitka.ModuleRegistry import replaceRootModule
 from nuitka.nodes.ModuleNodes import makeUncompiledPythonModule
 from nuitka.options.Options import isShowProgress, isStandaloneMode
@@ -81,6 +82,7 @@ def demoteCompiledModuleToBytecode(module):
         source_code=source_code,
         used_modules=used_modules,
         distribution_names=distribution_names,
+        is_stdlib=isStandardLibraryPath(filename),
     )
 
 
@@ -47,9 +47,10 @@ from nuitka.utils.InstanceCounters import (
     counted_init,
     isCountingInstances,
 )
+from nuitka.utils.SlotMetaClasses import getMetaClassBase
 
 
-class ValueTraceBase(object):
+class ValueTraceBase(getMetaClassBase("ValueTrace", require_slots=True)):
     # We are going to have many instance attributes, but should strive to minimize, as
     # there is going to be a lot of fluctuation in these objects.
 
@@ -445,6 +446,8 @@ class ValueTraceStartInit(ValueTraceStartMixin, ValueTraceBase):
 
 
 class ValueTraceStartInitStarArgs(ValueTraceStartInit):
+    __slots__ = ()
+
     @staticmethod
     def getTypeShape():
         return tshape_tuple
@@ -459,6 +462,8 @@ class ValueTraceStartInitStarArgs(ValueTraceStartInit):
 
 
 class ValueTraceStartInitStarDict(ValueTraceStartInit):
+    __slots__ = ()
+
     @staticmethod
     def getTypeShape():
         return tshape_dict
@@ -473,6 +478,7 @@ class ValueTraceStartInitStarDict(ValueTraceStartInit):
 
 
 class ValueTraceUnknownBase(ValueTraceBase):
+    __slots__ = ()
 
     @staticmethod
     def getTypeShape():
@@ -784,12 +790,16 @@ class ValueTraceAssign(ValueTraceBase):
 
 
 class ValueTraceAssignUnescapable(ValueTraceAssign):
+    __slots__ = ()
+
     @staticmethod
     def isTraceThatNeedsEscape():
         return False
 
 
 class ValueTraceAssignVeryTrusted(ValueTraceAssignUnescapable):
+    __slots__ = ()
+
     @staticmethod
     def isAssignTraceVeryTrusted():
         return True
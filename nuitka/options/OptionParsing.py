@@ -544,6 +544,31 @@ with "nuitka-onefile-unpack" rather than a stream that only the onefile
 program itself unpacks. Default is off.""",
 )
 
+onefile_group.add_option(
+    "--onefile-compression-dictionary",
+    action="store_true",
+    dest="onefile_compression_dictionary",
+    default=False,
+    help="""\
+When creating the onefile, train a compression dictionary on the files
+of the distribution and compress every file on its own with it. Small
+files then compress much better than on their own. This implies the
+archive format of '--onefile-as-archive'. Default is off.""",
+)
+
+onefile_group.add_option(
+    "--onefile-compression-level",
+    action="store",
+    dest="onefile_compression_level",
+    metavar="LEVEL",
+    default=None,
+    help="""When creating the onefile, the zstd compression level to use, from 1 to
+22. The special values 'size' and 'startup' benchmark compression and
+decompression of a sample of the files at several levels, report the
+results, and select the level for the smallest payload or the fastest
+unpacking at startup. Default is 22, or 3 with '--low-memory'.""",
+)
+
 onefile_group.add_option(
     "--onefile-no-dll",
     action="store_true",
@@ -639,6 +664,21 @@ paths inside the distribution that are then put external to it.
 Default empty.""",
 )
 
+data_group.add_option(
+    "--include-data-files-embedded",
+    action="append",
+    dest="data_files_embedded",
+    metavar="PATTERN",
+    default=[],
+    help="""\
+Embed the specified data file patterns into the binary, rather than putting
+them into the distribution folder. These are then not files on disk, and can
+only be accessed through the loader with 'importlib.resources' and 'get_data'
+of the package loader, but that needs no disk access or unpacking. First files
+have to be specified as included with other `--include-*data*` options, and then
+this refers to target paths inside the distribution. Default empty.""",
+)
+
 data_group.add_option(
     "--list-package-data",
     action="store",
@@ -892,6 +932,47 @@ deduce the value of "__package__", to be fully compatible. The value "original"
 is incompatible for modules that normally can be loaded into any package.""",
 )
 
+compilation_group.add_option(
+    "--free-list-size",
+    action="append",
+    dest="free_list_sizes",
+    metavar="KIND=COUNT",
+    default=[],
+    help="""\
+Number of objects to keep for reuse after release, for compiled objects of a
+kind, one of "function", "method", "generator", "coroutine", "asyncgen",
+"frame", "cell", "traceback", "loader", or "all". Workloads that create many
+short lived closures or generators at once, benefit from larger values. For
+generators, coroutines, asyncgens, and frames, the count applies to each of
+their size classes. Can be given multiple times. Defaults to 1000 for cells
+and tracebacks, 10 for loaders, and 100 for all others.""",
+)
+
+compilation_group.add_option(
+    "--free-list-adaptive",
+    action="store_true",
+    dest="free_list_adaptive",
+    default=False,
+    help="""\
+Let free lists of compiled objects grow at runtime, when they were found empty
+while being too small to hold all released objects, up to 16 times their size.
+Grown free lists are trimmed again, when not found empty for a while. The usage
+can be checked at runtime with "__compiled__.free_list_stats()". Defaults to
+off.""",
+)
+
+compilation_group.add_option(
+    "--lazy-frames",
+    action="store_true",
+    dest="lazy_frames",
+    default=False,
+    help="""\
+Create frames of compiled functions only when an exception passes through
+them, for functions that cannot run any other code, e.g. through calls,
+imports, or operations that may use overloads. Leaf functions then avoid
+frame stack handling entirely. Defaults to off.""",
+)
+
 
 del compilation_group
 
@@ -948,6 +1029,19 @@ Removes the build directory after producing the module or exe file.
 Defaults to off.""",
 )
 
+output_group.add_option(
+    "--incremental-dist",
+    action="store_true",
+    dest="incremental_dist",
+    default=False,
+    help="""\
+Update the standalone distribution folder of a previous build in place, rather
+than throwing it away. Only files whose source or treatment changed are copied
+and patched again, and files no longer needed are removed. This uses a manifest
+kept in the build directory, so it has no effect with '--remove-output'.
+Defaults to off.""",
+)
+
 output_group.add_option(
     "--no-pyi-file",
     action="store_false",
@@ -1412,7 +1506,7 @@ del c_compiler_group
 
 caching_group = parser.add_option_group("Cache Control")
 
-_cache_names = ("all", "ccache", "bytecode", "compression")
+_cache_names = ("all", "ccache", "bytecode", "compression", "import-index")
 
 if isWin32Windows():
     _cache_names += ("dll-dependencies",)
@@ -1467,6 +1561,79 @@ caching_group.add_option(
     help=SUPPRESS_HELP,
 )
 
+caching_group.add_option(
+    "--shared-bytecode-cache-dir",
+    action="store",
+    dest="shared_bytecode_cache_dir",
+    metavar="DIRECTORY",
+    default=None,
+    help="""\
+Directory with a bytecode module cache that is shared between compilations
+of different projects and machines, e.g. on a network drive. Standard library
+modules are looked up there when not found in the local cache. It is only read
+from, unless "--shared-bytecode-cache-update" is given. Default not used.""",
+)
+
+caching_group.add_option(
+    "--shared-bytecode-cache-update",
+    action="store_true",
+    dest="update_shared_bytecode_cache",
+    default=False,
+    help="""\
+Populate the directory given with "--shared-bytecode-cache-dir" with results
+for standard library modules. Entries are written atomically, so concurrent
+compilations can safely do this. Defaults to off.""",
+)
+
+caching_group.add_option(
+    "--cache-size-limit",
+    action="append",
+    dest="cache_size_limits",
+    metavar="CACHE_NAME=SIZE",
+    default=[],
+    help="""\
+Limit the size of a cache, e.g. "bytecode=500M". After compilation, the least
+recently used entries are removed until it fits. Cache names allowed are
+"bytecode", "compression", "dll-dependencies", "downloads", "import-index",
+and "all" for each of them. Sizes in bytes, or with "K", "M", "G" suffix. Can
+be given multiple times. Default no limit.""",
+)
+
+caching_group.add_option(
+    "--cache-age-limit",
+    action="append",
+    dest="cache_age_limits",
+    metavar="CACHE_NAME=DAYS",
+    default=[],
+    help="""\
+Remove entries of a cache that were not used for the given number of days,
+e.g. "downloads=90". Cache names are the same as for "--cache-size-limit".
+Can be given multiple times. Default no limit.""",
+)
+
+caching_group.add_option(
+    "--remote-cache",
+    action="store",
+    dest="remote_cache",
+    metavar="URL",
+    default=None,
+    help="""\
+Use a cache shared between machines for the bytecode module cache and, with
+ccache, for C compilation results. This can be a directory, e.g. on a network
+drive, or an "http://" or "https://" URL of a server that supports "GET" and
+"PUT" of entries below it. Default not used.""",
+)
+
+caching_group.add_option(
+    "--remote-cache-read-only",
+    action="store_true",
+    dest="remote_cache_read_only",
+    default=False,
+    help="""\
+Only read from the cache given with "--remote-cache" and do not store new
+results there. Defaults to off.""",
+)
+
 if isWin32Windows():
     caching_group.add_option(
         "--force-dll-dependency-cache-update",
@@ -329,6 +329,20 @@ def parseArgs():
     if getattr(options, "disable_dll_dependency_cache", False):
         options.disabled_caches.append("dll-dependencies")
 
+    # Check these early, rather than after compilation.
+    getCacheSizeLimits()
+    getCacheAgeLimits()
+
+    if options.remote_cache_read_only and not options.remote_cache:
+        options_logger.sysexit(
+            "Error, '--remote-cache-read-only' needs '--remote-cache' to be given too."
+        )
+
+    if options.update_shared_bytecode_cache and not options.shared_bytecode_cache_dir:
+        options_logger.sysexit(
+            "Error, '--shared-bytecode-cache-update' needs '--shared-bytecode-cache-dir' to be given too."
+        )
+
     states.report_missing_code_helpers = options.report_missing_code_helpers
 
     if options.output_folder_name is not None:
@@ -1197,6 +1211,45 @@ make sure that is intended."""
             "Providing PGO arguments without enabling PGO mode has no effect."
         )
 
+    if options.incremental_dist:
+        if not isStandaloneMode():
+            options_logger.warning(
+                "The '--incremental-dist' option has no effect outside of standalone mode."
+            )
+        elif isRemoveBuildDir():
+            options_logger.warning(
+                "The '--incremental-dist' option has no effect with '--remove-output'."
+            )
+
+    if options.onefile_compression_dictionary and options.onefile_no_compression:
+        options_logger.warning(
+            "The '--onefile-compression-dictionary' option has no effect with '--onefile-no-compression'."
+        )
+
+    if options.onefile_compression_level is not None:
+        if options.onefile_compression_level not in ("size", "startup") and not (
+            options.onefile_compression_level.isdigit()
+            and 1 <= int(options.onefile_compression_level) <= 22
+        ):
+            return options_logger.sysexit("""\
+Error, the value given for '--onefile-compression-level' must be an integer \
+from 1 to 22 or one of 'size' or 'startup'.""")
+
+        if options.onefile_no_compression:
+            options_logger.warning(
+                "The '--onefile-compression-level' option has no effect with '--onefile-no-compression'."
+            )
+
+    if options.data_files_embedded:
+        if not isStandaloneMode():
+            options_logger.warning(
+                "The '--include-data-files-embedded' option has no effect outside of standalone mode."
+            )
+        elif python_version < 0x300:
+            options_logger.sysexit(
+                "Error, the '--include-data-files-embedded' option is not supported for Python2."
+            )
+
     if isCPgoMode():
         if isStandaloneMode():
             optimization_logger.warning("""\
@@ -1620,6 +1673,12 @@ def getShallIncludeExternallyDataFilePatterns():
     return options.data_files_external
 
 
+def getShallIncludeEmbeddedDataFilePatterns():
+    """*list*, items of ``--include-data-files-embedded=``"""
+
+    return options.data_files_embedded
+
+
 def getShallNotIncludeDllFilePatterns():
     """*list*, items of ``--noinclude-dlls=``"""
 
@@ -2089,6 +2148,150 @@ def shallDisableCompressionCacheUsage():
     return shallDisableCacheUsage("compression")
 
 
+def getSharedBytecodeCacheDir():
+    """:returns: str or None derived from ``--shared-bytecode-cache-dir``"""
+    if options is None or not options.shared_bytecode_cache_dir:
+        return None
+
+    return getUserInputNormalizedPath(options.shared_bytecode_cache_dir)
+
+
+def shallUpdateSharedBytecodeCache():
+    """:returns: bool derived from ``--shared-bytecode-cache-update``"""
+    return (
+        getSharedBytecodeCacheDir() is not None and options.update_shared_bytecode_cache
+    )
+
+
+_cache_limit_names = (
+    "all",
+    "bytecode",
+    "compression",
+    "dll-dependencies",
+    "downloads",
+    "import-index",
+)
+
+
+def _parseCacheLimitValues(option_name, values, parse_value):
+    result = {}
+
+    for value in values:
+        if "=" not in value:
+            options_logger.sysexit(
+                "Error, '%s' needs 'CACHE_NAME=VALUE' argument, not '%s'."
+                % (option_name, value)
+            )
+
+        cache_name, limit = value.split("=", 1)
+
+        if cache_name not in _cache_limit_names:
+            options_logger.sysexit(
+                "Error, '%s' needs cache name from %s, not '%s'."
+                % (
+                    option_name,
+                    ",".join('"%s"' % name for name in _cache_limit_names),
+                    cache_name,
+                )
+            )
+
+        try:
+            result[cache_name] = parse_value(limit)
+        except ValueError:
+            options_logger.sysexit(
+                "Error, '%s' got illegal value '%s' for cache '%s'."
+                % (option_name, limit, cache_name)
+            )
+
+    return result
+
+
+def _parseCacheSize(value):
+    value = value.strip().upper()
+
+    for suffix, factor in (("K", 1024), ("M", 1024**2), ("G", 1024**3)):
+        if value.endswith(suffix):
+            return int(float(value[:-1]) * factor)
+
+    return int(value)
+
+
+def getCacheSizeLimits():
+    """:returns: dict of cache name to bytes derived from ``--cache-size-limit``"""
+    return _parseCacheLimitValues(
+        "--cache-size-limit", options.cache_size_limits, _parseCacheSize
+    )
+
+
+def getCacheAgeLimits():
+    """:returns: dict of cache name to days derived from ``--cache-age-limit``"""
+    return _parseCacheLimitValues("--cache-age-limit", options.cache_age_limits, float)
+
+
+_free_list_kinds = (
+    "function",
+    "method",
+    "generator",
+    "coroutine",
+    "asyncgen",
+    "frame",
+    "cell",
+    "traceback",
+    "loader",
+)
+
+
+def getFreeListSizes():
+    """:returns: dict of free list kind to count derived from ``--free-list-size``"""
+    result = {}
+
+    for value in options.free_list_sizes:
+        kind, _, count = value.partition("=")
+
+        if kind != "all" and kind not in _free_list_kinds:
+            options_logger.sysexit(
+                "Error, '--free-list-size' needs kind from %s, not '%s'."
+                % (
+                    ",".join('"%s"' % name for name in _free_list_kinds + ("all",)),
+                    kind,
+                )
+            )
+
+        if not count.isdigit():
+            options_logger.sysexit(
+                "Error, '--free-list-size' needs 'KIND=COUNT' argument with count as non-negative integer, not '%s'."
+                % value
+            )
+
+        for free_list_kind in _free_list_kinds if kind == "all" else (kind,):
+            result[free_list_kind] = int(count)
+
+    return result
+
+
+def isFreeListAdaptive():
+    """:returns: bool derived from ``--free-list-adaptive``"""
+    return options.free_list_adaptive
+
+
+def shallUseLazyFrames():
+    """:returns: bool derived from ``--lazy-frames``"""
+    return options.lazy_frames
+
+
+def getRemoteCacheUrl():
+    """:returns: str or None derived from ``--remote-cache``"""
+    if options is None or not options.remote_cache:
+        return None
+
+    return options.remote_cache
+
+
+def isRemoteCacheReadOnly():
+    """:returns: bool derived from ``--remote-cache-read-only``"""
+    return options.remote_cache_read_only
+
+
 def getWindowsConsoleMode():
     """:returns: str from ``--windows-console-mode``"""
     if options.disable_console is True:
@@ -2138,6 +2341,11 @@ def isRemoveBuildDir():
     return options.remove_build and not options.generate_c_only
 
 
+def shallUpdateDistIncrementally():
+    """:returns: bool derived from ``--incremental-dist``"""
+    return options.incremental_dist and not isRemoveBuildDir()
+
+
 def isDeploymentMode():
     """:returns: bool derived from ``--deployment``"""
     return options.is_deployment
@@ -2370,8 +2578,22 @@ def shallNotCompressOnefile():
 
 
 def shallOnefileAsArchive():
-    """*bool* = ``--onefile-as-archive``"""
-    return options.onefile_as_archive
+    """*bool* = ``--onefile-as-archive`` or ``--onefile-compression-dictionary``"""
+    return options.onefile_as_archive or options.onefile_compression_dictionary
+
+
+def shallUseOnefileCompressionDictionary():
+    """*bool* = ``--onefile-compression-dictionary``"""
+    return options.onefile_compression_dictionary and not shallNotCompressOnefile()
+
+
+def getOnefileCompressionLevel():
+    """*str* = ``--onefile-compression-level``, a level or "size" or "startup"
+
+    Notes:
+        Returns None, if the default level is to be used.
+    """
+    return options.onefile_compression_level
 
 
 def _checkedIconPaths(icon_paths):
@@ -66,6 +66,7 @@ from nuitka.PythonVersions import (
 )
 from nuitka.Tracing import ReportingSystemExit, reports_logger
 from nuitka.TreeXML import Element, appendTreeElement, convertXmlToString
+from nuitka.utils.CacheUsage import getCacheUsageStatistics
 from nuitka.utils.Distributions import (
     getDistributionInstallerName,
     getDistributionLicense,
@@ -83,6 +84,7 @@ from nuitka.utils.FileOperations import (
 )
 from nuitka.utils.Jinja2 import getTemplate
 from nuitka.utils.MemoryUsage import getMemoryInfos
+from nuitka.utils.RemoteCaching import getRemoteCache
 from nuitka.utils.Utils import (
     getArchitecture,
     getLinuxDistribution,
@@ -357,6 +359,13 @@ def _getReportInputData(aborted):
 
     module_object_sizes = getSconsObjectSizes(source_dir) if source_dir else {}
 
+    remote_cache = getRemoteCache()
+    remote_cache_url = remote_cache.url if remote_cache is not None else None
+    remote_cache_stats = remote_cache.stats if remote_cache is not None else {}
+    del remote_cache
+
+    cache_usage_stats = getCacheUsageStatistics()
+
     del source_dir
 
     compilation_mode = getCompilationMode()
@@ -1091,6 +1100,40 @@ def writeCompilationReport(report_filename, report_input_data, diffable):
                 performance_totals["code_generation"]["cpu_cycles"]
             )
 
+    if report_input_data["remote_cache_url"] is not None:
+        remote_cache_xml_node = appendTreeElement(
+            root,
+            "remote-cache",
+            url=report_input_data["remote_cache_url"],
+        )
+
+        for kind, kind_stats in sorted(report_input_data["remote_cache_stats"].items()):
+            appendTreeElement(
+                remote_cache_xml_node,
+                "remote-cache-kind",
+                name=kind,
+                hits=str(kind_stats["hit"]),
+                misses=str(kind_stats["miss"]),
+                stores=str(kind_stats["store"]),
+                errors=str(kind_stats["error"]),
+            )
+
+    if report_input_data["cache_usage_stats"]:
+        caches_xml_node = appendTreeElement(root, "caches")
+
+        for cache_name, cache_stats in sorted(
+            report_input_data["cache_usage_stats"].items()
+        ):
+            appendTreeElement(
+                caches_xml_node,
+                "cache",
+                name=cache_name,
+                hits=str(cache_stats["hits"]),
+                misses=str(cache_stats["misses"]),
+                evictions=str(cache_stats["evictions"]),
+                evicted_size=str(cache_stats["evicted_size"]),
+            )
+
     if report_input_data["backend_executable"] != "failed too early":
         python_binary_xml_node = appendTreeElement(
             root,
@@ -11,7 +11,10 @@ import sys
 from math import copysign, isinf, isnan
 
 from nuitka.__past__ import BytesIO, long, to_byte, unicode, xrange
-from nuitka.build.DataComposerInterface import deriveModuleConstantsBlobName
+from nuitka.build.DataComposerInterface import (
+    deriveModuleConstantsBlobName,
+    getEmbeddedDataFilesListFilename,
+)
 from nuitka.Builtins import builtin_exception_values_list, builtin_named_values
 from nuitka.containers.OrderedDicts import OrderedDict
 from nuitka.nodes.CodeObjectSpecs import CodeObjectSpec
@@ -25,8 +28,13 @@ from nuitka.Serialization import (
     ConstantStreamReader,
 )
 from nuitka.Tracing import data_composer_logger
-from nuitka.utils.FileOperations import getFileSize, listDir, syncFileOutput
-from nuitka.utils.Json import writeJsonToFilename
+from nuitka.utils.FileOperations import (
+    getFileContents,
+    getFileSize,
+    listDir,
+    syncFileOutput,
+)
+from nuitka.utils.Json import loadJsonFromFilename, writeJsonToFilename
 
 _max_uint64_t_value = 2**64 - 1
 _max_uint31_t_value = 2**31 - 1
@@ -468,41 +476,97 @@ def _writeConstantStream(constants_reader):
     return count, struct.pack("H", count) + result.getvalue()
 
 
-crc32 = 0
+def _getSectionNameHash(name):
+    """FNV-1a hash of a section name, must match "_hashBlobSectionName" in C."""
+    result = 2166136261
+
+    for c in bytearray(name):
+        result ^= c
+        result = (result * 16777619) & 0xFFFFFFFF
+
+    return result
+
+
+def _getCRC32(data):
+    # Python2 is doing signed CRC32, but we want unsigned.
+    return binascii.crc32(data) & 0xFFFFFFFF
+
+
+def _makeEmbeddedDataSection(embedded_data_files):
+    # The loader finds files with a binary search, so the entries are sorted by
+    # name, with offsets of name and data, and the data size.
+    entries = sorted(
+        (name.encode("utf8"), source_path) for name, source_path in embedded_data_files
+    )
+
+    index = BytesIO()
+    contents = BytesIO()
+
+    offset = 4 + 12 * len(entries)
+
+    for name, source_path in entries:
+        data = getFileContents(source_path, mode="rb")
+
+        index.write(
+            struct.pack(
+                "III",
+                offset + contents.tell(),
+                offset + contents.tell() + len(name) + 1,
+                len(data),
+            )
+        )
+
+        contents.write(name + b"\0")
+        contents.write(data)
+
+        data_composer_logger.info(
+            "Embedding data file %r with size %d." % (name, len(data))
+        )
+
+    return struct.pack("I", len(entries)) + index.getvalue() + contents.getvalue()
 
 
 def _writeConstantsBlob(output_filename, desc):
-    global crc32  # singleton, pylint: disable=global-statement
+    # The blob starts with a directory of the sections, sorted by the hash of
+    # their names, so the loader can find sections with a binary search. Each
+    # entry gives name hash, offset, and CRC32 of the section, which is checked
+    # only when the section is loaded. The directory itself is protected by a
+    # CRC32 up front.
+
+    directory_size = 8 + 12 * len(desc)
 
-    with open(output_filename, "w+b") as output:
-        output.write(b"\0" * 8)
+    sections = []
+    entries = []
 
-        def write(data):
-            global crc32  # singleton, pylint: disable=global-statement
+    offset = directory_size
+    for name, part in desc:
+        section = name + b"\0" + struct.pack("I", len(part)) + part
 
-            output.write(data)
-            crc32 = binascii.crc32(data, crc32)
+        entries.append((_getSectionNameHash(name), offset, _getCRC32(section)))
+        sections.append(section)
 
-        for name, part in desc:
-            write(name + b"\0")
-            write(struct.pack("I", len(part)))
-            write(part)
+        offset += len(section)
 
-        data_size = output.tell() - 8
+    entries.sort()
 
-        if str is bytes:
-            # Python2 is doing signed CRC32, but we want unsigned.
-            crc32 %= 1 << 32
+    directory = struct.pack("I", len(entries)) + b"".join(
+        struct.pack("III", *entry) for entry in entries
+    )
+
+    with open(output_filename, "wb") as output:
+        output.write(struct.pack("I", _getCRC32(directory)))
+        output.write(directory)
 
-        output.seek(0)
-        output.write(struct.pack("II", crc32, data_size))
+        assert output.tell() == directory_size
 
-        assert output.tell() == 8
+        for section in sections:
+            output.write(section)
+
+        data_size = output.tell()
 
         data_composer_logger.info(
-            "Total constants blob size without header %d." % data_size
+            "Total constants blob size %d with %d sections." % (data_size, len(entries))
         )
-        data_composer_logger.info("Total constants blob CRC32 is %d." % crc32)
 
         syncFileOutput(output)
 
@@ -570,6 +634,16 @@ def main():
 
     data_composer_logger.info("Total amount of constants is %d." % total)
 
+    # Always present, even if empty, for standalone mode loader to look at.
+    embedded_data_files_list_filename = getEmbeddedDataFilesListFilename(build_dir)
+
+    if os.path.exists(embedded_data_files_list_filename):
+        embedded_data_files = loadJsonFromFilename(embedded_data_files_list_filename)
+    else:
+        embedded_data_files = ()
+
+    desc.append((b".embedded_data", _makeEmbeddedDataSection(embedded_data_files)))
+
     _writeConstantsBlob(output_filename=output_filename, desc=desc)
 
     writeJsonToFilename(stats_filename, contents=stats)
@@ -0,0 +1,234 @@
+#     Copyright 2026, Kay Hayen, mailto:kay.hayen@gmail.com find license text at end of file
+
+
+"""Benchmark of compression levels for the onefile payload.
+
+For "--onefile-compression-level=size|startup", a sample of the payload files
+is compressed at several levels, in the same way the payload will be, i.e.
+as a single stream or as one frame per file. Decompression is measured with
+streaming decompression like the bootstrap does. The results are reported
+with estimates for the whole payload, and a level is selected for the target.
+"""
+
+from nuitka.__past__ import perf_counter
+from nuitka.Tracing import onefile_logger
+from nuitka.utils.FileOperations import getFileSize
+
+# Levels to try, the ones above 19 need a lot more memory for compression and
+# for decompression, so they are not used in low memory mode.
+_benchmark_levels = (1, 3, 6, 9, 12, 15, 19, 22)
+_benchmark_levels_low_memory = (1, 3, 6, 9, 12, 15, 19)
+
+# Limits for the sample, to bound the time the benchmark takes.
+_sample_file_size = 1024 * 1024
+_sample_total_size = 8 * 1024 * 1024
+
+# Decompression is fast, repeat it to reduce the noise in measurements.
+_decompression_repeats = 3
+
+# Levels within these margins of the best one, are considered as good, then
+# the other criterion decides.
+_size_margin = 0.005
+_decompression_time_margin = 0.05
+
+
+def _getSampleData(filenames, as_archive):
+    filenames = sorted(filenames, key=getFileSize)
+
+    # Spread the sample over all file sizes, by taking every n-th file only.
+    total_size = sum(
+        min(getFileSize(filename), _sample_file_size) for filename in filenames
+    )
+    step = max(1, (total_size + _sample_total_size - 1) // _sample_total_size)
+
+    samples = []
+
+    for filename in filenames[::step]:
+        with open(filename, "rb") as input_file:
+            sample = input_file.read(_sample_file_size)
+
+        if sample:
+            samples.append(sample)
+
+    # The stream format compresses everything as one.
+    if not as_archive and samples:
+        samples = [b"".join(samples)]
+
+    return samples
+
+
+def _getCompressionFunctions(level, job_limit, dictionary):
+    try:
+        from compression import zstd
+
+        zstd_dict = zstd.ZstdDict(dictionary) if dictionary is not None else None
+
+        options = {
+            zstd.CompressionParameter.nb_workers: job_limit,
+            zstd.CompressionParameter.compression_level: level,
+        }
+
+        def compress(data):
+            compressor = zstd.ZstdCompressor(options=options, zstd_dict=zstd_dict)
+
+            return compressor.compress(data, mode=zstd.ZstdCompressor.FLUSH_FRAME)
+
+        def decompress(data):
+            return zstd.ZstdDecompressor(zstd_dict=zstd_dict).decompress(data)
+
+    except ImportError:
+        import zstandard  # pylint: disable=I0021,import-error
+
+        zstd_dict = (
+            zstandard.ZstdCompressionDict(dictionary)
+            if dictionary is not None
+            else None
+        )
+
+        compressor_context = zstandard.ZstdCompressor(
+            level=level, threads=job_limit, dict_data=zstd_dict
+        )
+        decompressor_context = zstandard.ZstdDecompressor(dict_data=zstd_dict)
+
+        def compress(data):
+            return compressor_context.compress(data)
+
+        def decompress(data):
+            return decompressor_context.decompressobj().decompress(data)
+
+    return compress, decompress
+
+
+def _benchmarkLevel(samples, level, job_limit, dictionary):
+    compress, decompress = _getCompressionFunctions(
+        level=level, job_limit=job_limit, dictionary=dictionary
+    )
+
+    start_time = perf_counter()
+    compressed_samples = [compress(sample) for sample in samples]
+    compression_time = perf_counter() - start_time
+
+    decompression_time = None
+
+    for _count in range(_decompression_repeats):
+        start_time = perf_counter()
+        for compressed_sample in compressed_samples:
+            decompress(compressed_sample)
+        delta = perf_counter() - start_time
+
+        if decompression_time is None or delta < decompression_time:
+            decompression_time = delta
+
+    return (
+        sum(len(compressed_sample) for compressed_sample in compressed_samples),
+        compression_time,
+        decompression_time,
+    )
+
+
+def _selectLevel(results, target):
+    if target == "size":
+        # Lowest level, that compresses about as well as the best one, to not
+        # waste build time on higher ones.
+        best_size = min(result[1] for result in results)
+
+        candidates = [
+            result for result in results if result[1] <= best_size * (1 + _size_margin)
+        ]
+
+        return min(candidates, key=lambda result: result[0])[0]
+    else:
+        assert target == "startup", target
+
+        # Smallest payload, of the levels that decompress about as fast as the
+        # best one, since that also needs to be read.
+        best_time = min(result[3] for result in results)
+
+        candidates = [
+            result
+            for result in results
+            if result[3] <= best_time * (1 + _decompression_time_margin)
+        ]
+
+        return min(candidates, key=lambda result: result[1])[0]
+
+
+def selectCompressionLevel(
+    target, filenames, payload_size, as_archive, low_memory, job_limit, dictionary
+):
+    """Benchmark compression levels on a sample of the payload and select one.
+
+    Args:
+        target: Either "size" or "startup", what to optimize for.
+        filenames: Files to take the sample from.
+        payload_size: Uncompressed size of the whole payload, for estimates.
+        as_archive: Files are compressed on their own, rather than as a stream.
+        low_memory: Avoid levels needing a lot of memory.
+        job_limit: Threads to use for compression.
+        dictionary: Trained compression dictionary or None.
+
+    Returns:
+        int: The selected compression level.
+    """
+    # Many details to report, pylint: disable=too-many-locals
+
+    levels = _benchmark_levels_low_memory if low_memory else _benchmark_levels
+
+    samples = _getSampleData(filenames=filenames, as_archive=as_archive)
+    sample_size = sum(len(sample) for sample in samples)
+
+    if sample_size == 0:
+        return levels[-1]
+
+    onefile_logger.info(
+        "Benchmarking compression levels %s on a sample of %d bytes for target '%s'."
+        % (", ".join(str(level) for level in levels), sample_size, target)
+    )
+
+    results = []
+
+    for level in levels:
+        compressed_size, compression_time, decompression_time = _benchmarkLevel(
+            samples=samples, level=level, job_limit=job_limit, dictionary=dictionary
+        )
+
+        results.append((level, compressed_size, compression_time, decompression_time))
+
+    # Scale the sample results to the whole payload.
+    scale = float(payload_size) / sample_size
+
+    for level, compressed_size, compression_time, decompression_time in results:
+        onefile_logger.info(
+            "Level %2d: ratio %6.2f%%, estimated payload %.1f MB, compression %.1fs, decompression %.3fs."
+            % (
+                level,
+                100.0 * compressed_size / sample_size,
+                compressed_size * scale / (1024 * 1024),
+                compression_time * scale,
+                decompression_time * scale,
+            )
+        )
+
+    level = _selectLevel(results=results, target=target)
+
+    onefile_logger.info(
+        "Selected compression level %d for target '%s'." % (level, target)
+    )
+
+    return level
+
+
+#     Part of "Nuitka", an optimizing Python compiler that is compatible and
+#     integrates with CPython, but also works on its own.
+#
+#     Licensed under the GNU Affero General Public License, Version 3 (the "License");
+#     you may not use this file except in compliance with the License.
+#     You may obtain a copy of the License at
+#
+#        http://www.gnu.org/licenses/agpl.txt
+#
+#     Unless required by applicable law or agreed to in writing, software
+#     distributed under the License is distributed on an "AS IS" BASIS,
+#     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#     See the License for the specific language governing permissions and
+#     limitations under the License.
@@ -18,9 +18,20 @@ from nuitka.Progress import (
 )
 from nuitka.Tracing import onefile_logger
 from nuitka.utils.AppDirs import getCacheDir
-from nuitka.utils.FileOperations import areSamePaths, getFileList, getFileSize
+from nuitka.utils.CacheUsage import (
+    countCacheHit,
+    countCacheMiss,
+    getCacheUsageStatistics,
+)
+from nuitka.utils.FileOperations import (
+    areSamePaths,
+    getFileList,
+    getFileSize,
+    getIdenticalFiles,
+    isSharedLibraryFilename,
+)
 from nuitka.utils.Hashing import Hash, HashCRC32
-from nuitka.utils.Json import loadJsonFromFilename
+from nuitka.utils.Json import loadJsonFromFilename, writeJsonToFilename
 from nuitka.utils.Utils import (
     decoratorRetries,
     isWin32OrPosixWindows,
@@ -28,39 +39,113 @@ from nuitka.utils.Utils import (
 )
 from nuitka.Version import version_string
 
+from .CompressionBenchmark import selectCompressionLevel
+
 
 def getCompressorLevel(low_memory):
     return 3 if low_memory else 22
 
 
-def getCompressorFunction(expect_compression, low_memory, job_limit):
+# Size of trained dictionaries, the default of zstd, and limits for the samples
+# to train on, taken from the start of files, to bound the training time.
+_dictionary_size = 112640
+_dictionary_sample_size = 131072
+_dictionary_samples_total_size = 32 * 1024 * 1024
+
+
+def _getCompressedFilenames(file_list, duplicate_files):
+    # The files, whose contents will actually be compressed.
+    return [
+        filename_full
+        for filename_full in file_list
+        if not os.path.islink(filename_full) and filename_full not in duplicate_files
+    ]
+
+
+def _trainCompressionDictionary(file_list, duplicate_files, job_limit):
+    # Smaller files benefit the most from the dictionary, prefer them.
+    filenames = sorted(
+        _getCompressedFilenames(file_list=file_list, duplicate_files=duplicate_files),
+        key=getFileSize,
+    )
+
+    samples = []
+    samples_size = 0
+
+    for filename_full in filenames:
+        with open(filename_full, "rb") as input_file:
+            sample = input_file.read(_dictionary_sample_size)
+
+        if not sample:
+            continue
+
+        if samples_size + len(sample) > _dictionary_samples_total_size:
+            break
+
+        samples.append(sample)
+        samples_size += len(sample)
+
+    try:
+        from compression import zstd
+
+        try:
+            return zstd.train_dict(samples, _dictionary_size).dict_content
+        except zstd.ZstdError as e:
+            error = e
+    except ImportError:
+        import zstandard  # pylint: disable=I0021,import-error
+
+        try:
+            return zstandard.train_dictionary(
+                _dictionary_size, samples, threads=job_limit
+            ).as_bytes()
+        except zstandard.ZstdError as e:
+            error = e
+
+    onefile_logger.warning(
+        "Failed to train compression dictionary on %d files due to '%s', not using one."
+        % (len(samples), error)
+    )
+
+    return None
+
+
+def getCompressorFunction(expect_compression, level, job_limit, dictionary=None):
     # spell-checker: ignore closefd
 
     if expect_compression:
         try:
             from compression import zstd
 
+            zstd_dict = zstd.ZstdDict(dictionary) if dictionary is not None else None
+
             @contextmanager
             def useCompressedFile(output_file):
                 options = {
                     zstd.CompressionParameter.nb_workers: job_limit,
-                    zstd.CompressionParameter.compression_level: getCompressorLevel(
-                        low_memory
-                    ),
+                    zstd.CompressionParameter.compression_level: level,
                 }
 
                 with zstd.open(
                     output_file,
                     mode="wb",
                     options=options,
+                    zstd_dict=zstd_dict,
                 ) as compressed_file:
                     yield compressed_file
 
         except ImportError:
-            from zstandard import ZstdCompressor  # pylint: disable=I0021,import-error
+            from zstandard import (  # pylint: disable=I0021,import-error
+                ZstdCompressionDict,
+                ZstdCompressor,
+            )
 
             compressor_context = ZstdCompressor(
-                level=getCompressorLevel(low_memory), threads=job_limit
+                level=level,
+                threads=job_limit,
+                dict_data=(
+                    ZstdCompressionDict(dictionary) if dictionary is not None else None
+                ),
             )
 
             @contextmanager
@@ -70,7 +155,15 @@ def getCompressorFunction(expect_compression, low_memory, job_limit):
                 ) as compressed_file:
                     yield compressed_file
 
-        onefile_logger.info("Using compression for onefile payload.")
+        if dictionary is not None:
+            onefile_logger.info(
+                "Using compression level %d with trained dictionary of size %d for onefile payload."
+                % (level, len(dictionary))
+            )
+
+            return b"Z", useCompressedFile
+
+        onefile_logger.info("Using compression level %d for onefile payload." % level)
 
         return b"Y", useCompressedFile
     else:
@@ -82,14 +175,26 @@ def getCompressorFunction(expect_compression, low_memory, job_limit):
         return b"X", useSameFile
 
 
+def _getPayloadFilename(filename_full, dist_dir, win_path_sep):
+    filename_relative = os.path.relpath(filename_full, dist_dir)
+
+    # Might be changing from POSIX to Win32 Python on Windows.
+    if win_path_sep:
+        return filename_relative.replace("/", "\\")
+    else:
+        return filename_relative.replace("\\", "/")
+
+
 def _attachOnefilePayloadFile(
     output_file,
     is_archive,
     is_compressing,
     use_compression_cache,
-    low_memory,
+    compression_level,
     file_compressor,
+    dictionary,
     filename_full,
+    duplicate_filename_full,
     count,
     dist_dir,
     filename_encoding,
@@ -103,19 +208,15 @@ def _attachOnefilePayloadFile(
 
     payload_item_size = 0
 
-    filename_relative = os.path.relpath(filename_full, dist_dir)
+    filename_relative = _getPayloadFilename(
+        filename_full=filename_full, dist_dir=dist_dir, win_path_sep=win_path_sep
+    )
 
     reportProgressBar(
         item=filename_relative,
         update=False,
     )
 
-    # Might be changing from POSIX to Win32 Python on Windows.
-    if win_path_sep:
-        filename_relative = filename_relative.replace("/", "\\")
-    else:
-        filename_relative = filename_relative.replace("\\", "/")
-
     filename_encoded = (filename_relative + "\0").encode(filename_encoding)
 
     output_file.write(filename_encoded)
@@ -135,6 +236,25 @@ def _attachOnefilePayloadFile(
 
         output_file.write(link_target_encoded)
         payload_item_size += len(link_target_encoded)
+    elif duplicate_filename_full is not None:
+        # Same contents as a file stored before, only name that one.
+        file_flags |= 4
+        file_header = to_byte(file_flags)
+
+        output_file.write(file_header)
+        payload_item_size += len(file_header)
+
+        duplicate_filename_encoded = (
+            _getPayloadFilename(
+                filename_full=duplicate_filename_full,
+                dist_dir=dist_dir,
+                win_path_sep=win_path_sep,
+            )
+            + "\0"
+        ).encode(filename_encoding)
+
+        output_file.write(duplicate_filename_encoded)
+        payload_item_size += len(duplicate_filename_encoded)
     else:
         # This flag is only relevant for non-links.
         if not isWin32OrPosixWindows() and os.access(filename_full, os.X_OK):
@@ -162,9 +282,17 @@ def _attachOnefilePayloadFile(
 
             if is_archive and is_compressing:
                 compression_cache_filename = _getCacheFilename(
-                    binary_filename=filename_full, low_memory=low_memory
+                    binary_filename=filename_full,
+                    compression_level=compression_level,
+                    dictionary=dictionary,
                 )
 
+                if use_compression_cache:
+                    if os.path.exists(compression_cache_filename):
+                        countCacheHit("compression", compression_cache_filename)
+                    else:
+                        countCacheMiss("compression")
+
                 if not os.path.exists(compression_cache_filename):
                     with open(compression_cache_filename, "wb") as archive_entry_file:
                         with file_compressor(
@@ -203,7 +331,7 @@ def _attachOnefilePayloadFile(
     return payload_item_size
 
 
-def _getCacheFilename(binary_filename, low_memory):
+def _getCacheFilename(binary_filename, compression_level, dictionary):
     hash_value = Hash()
 
     hash_value.updateFromFile(filename=binary_filename)
@@ -224,7 +352,11 @@ def _getCacheFilename(binary_filename, low_memory):
             __version__ as version,
         )  # pylint: disable=I0021,import-error
 
-    hash_value.updateFromValues(version, getCompressorLevel(low_memory))
+    hash_value.updateFromValues(version, compression_level)
+
+    # Compressed with a dictionary, the result depends on it.
+    if dictionary is not None:
+        hash_value.updateFromBytes(dictionary)
 
     cache_dir = getCacheDir("onefile-compression", create=True)
 
@@ -287,17 +419,72 @@ def attachOnefilePayload(  # pylint: disable=too-many-arguments
     include_start_binary,
     expect_compression,
     as_archive,
+    use_dictionary,
     use_compression_cache,
     file_checksums,
     win_path_sep,
     low_memory,
+    compression_level,
     job_limit,
     expected_files,
 ):
+    # Move the binary to start immediately to the start position
+    file_list = _getInputFileList(
+        dist_dir=dist_dir,
+        start_binary=start_binary,
+        include_start_binary=include_start_binary,
+        expected_files=expected_files,
+    )
+
+    # Files with identical contents are stored only once, but that
+    # needs the flags only present for non-Windows. These are hard linked
+    # when unpacking, which must not be done for shared libraries, since
+    # loaders identify them by device and inode, and would load hard linked
+    # copies only once.
+    if isWin32OrPosixWindows():
+        duplicate_files = {}
+    else:
+        duplicate_files = getIdenticalFiles(
+            filename for filename in file_list if not isSharedLibraryFilename(filename)
+        )
+
+    # Dictionaries are only useful with files compressed individually.
+    if use_dictionary and expect_compression and as_archive:
+        dictionary = _trainCompressionDictionary(
+            file_list=file_list, duplicate_files=duplicate_files, job_limit=job_limit
+        )
+    else:
+        dictionary = None
+
+    # The level can be given, or selected by benchmarking for a target.
+    if not expect_compression:
+        compression_level = None
+    elif compression_level in ("size", "startup"):
+        compressed_filenames = _getCompressedFilenames(
+            file_list=file_list, duplicate_files=duplicate_files
+        )
+
+        compression_level = selectCompressionLevel(
+            target=compression_level,
+            filenames=compressed_filenames,
+            payload_size=sum(
+                getFileSize(filename_full) for filename_full in compressed_filenames
+            ),
+            as_archive=as_archive,
+            low_memory=low_memory,
+            job_limit=job_limit,
+            dictionary=dictionary,
+        )
+    elif compression_level is not None:
+        compression_level = int(compression_level)
+    else:
+        compression_level = getCompressorLevel(low_memory)
+
     compression_indicator, compressor = getCompressorFunction(
         expect_compression=expect_compression,
-        low_memory=low_memory,
+        level=compression_level,
         job_limit=job_limit,
+        dictionary=dictionary,
     )
 
     @decoratorRetries(
@@ -313,13 +500,9 @@ def attachOnefilePayload(  # pylint: disable=too-many-arguments
             start_pos = output_file.tell()
             output_file.write(b"KA" + compression_indicator)
 
-            # Move the binary to start immediately to the start position
-            file_list = _getInputFileList(
-                dist_dir=dist_dir,
-                start_binary=start_binary,
-                include_start_binary=include_start_binary,
-                expected_files=expected_files,
-            )
+            if dictionary is not None:
+                output_file.write(struct.pack("I", len(dictionary)))
+                output_file.write(dictionary)
 
             if isWin32Windows():
                 filename_encoding = "utf-16le"
@@ -358,10 +541,12 @@ def attachOnefilePayload(  # pylint: disable=too-many-arguments
                         output_file=compressed_file,
                         is_archive=is_archive,
                         file_compressor=file_compressor,
-                        is_compressing=compression_indicator == b"Y",
+                        dictionary=dictionary,
+                        is_compressing=compression_indicator in (b"Y", b"Z"),
                         use_compression_cache=use_compression_cache,
-                        low_memory=low_memory,
+                        compression_level=compression_level,
                         filename_full=filename_full,
+                        duplicate_filename_full=duplicate_files.get(filename_full),
                         count=count,
                         dist_dir=dist_dir,
                         filename_encoding=filename_encoding,
@@ -388,7 +573,7 @@ def attachOnefilePayload(  # pylint: disable=too-many-arguments
 
             compressed_size = end_pos - start_pos
 
-            if compression_indicator == b"Y":
+            if compression_indicator in (b"Y", b"Z"):
                 onefile_logger.info(
                     "Onefile payload compression ratio (%.2f%%) size %d to %d."
                     % (
@@ -421,6 +606,9 @@ def main():
     use_compression_cache = sys.argv[9] == "True"
     job_limit = int(sys.argv[10])
     expected_files_filename = sys.argv[11]
+    use_dictionary = sys.argv[12] == "True"
+    compression_level = sys.argv[13] if sys.argv[13] != "None" else None
+    cache_usage_filename = sys.argv[14]
 
     expected_files = tuple(loadJsonFromFilename(expected_files_filename))
 
@@ -434,14 +622,19 @@ def main():
         # We wouldn't be here, if that was not the case.
         expect_compression=True,
         as_archive=as_archive,
+        use_dictionary=use_dictionary,
         use_compression_cache=use_compression_cache,
         file_checksums=file_checksums,
         win_path_sep=win_path_sep,
         low_memory=low_memory,
+        compression_level=compression_level,
         job_limit=job_limit,
         expected_files=expected_files,
     )
 
+    # Cache usage is counted per process, give it to the main Nuitka process.
+    writeJsonToFilename(cache_usage_filename, getCacheUsageStatistics())
+
     sys.exit(0)
 
 
@@ -22,6 +22,10 @@ from nuitka.nodes.BuiltinNextNodes import ExpressionBuiltinNext1
 from nuitka.nodes.CodeObjectSpecs import CodeObjectSpec
 from nuitka.nodes.ConditionalNodes import makeStatementConditional
 from nuitka.nodes.ConstantRefNodes import makeConstantRefNode
+from nuitka.nodes.ContainerMakingNodes import (
+    ExpressionMakeDictForIterator,
+    ExpressionMakeListForIterator,
+)
 from nuitka.nodes.ContainerOperationNodes import (
     StatementListOperationAppend,
     StatementSetOperationAdd,
@@ -115,6 +119,32 @@ def _getStopIterationName(qual):
         return "StopIteration"
 
 
+def _makeContainerCreation(node, start_value, iter_tmp, source_ref):
+    # With only one loop and no conditions, every value goes to the container,
+    # so lists and dictionaries can be sized for what is left in the iterator.
+    if (
+        len(node.generators) == 1
+        and not node.generators[0].ifs
+        and not getattr(node.generators[0], "is_async", 0)
+    ):
+        if type(start_value) is list:
+            return ExpressionMakeListForIterator(
+                value=ExpressionTempVariableRef(
+                    variable=iter_tmp, source_ref=source_ref
+                ),
+                source_ref=source_ref,
+            )
+        elif type(start_value) is dict:
+            return ExpressionMakeDictForIterator(
+                value=ExpressionTempVariableRef(
+                    variable=iter_tmp, source_ref=source_ref
+                ),
+                source_ref=source_ref,
+            )
+
+    return makeConstantRefNode(constant=start_value, source_ref=source_ref)
+
+
 def _buildPython2ListContraction(provider, node, source_ref):
     # The contraction nodes are reformulated to function bodies, with loops as
     # described in the Developer Manual. They use a lot of temporary names,
@@ -396,7 +426,12 @@ def _buildContractionBodyNode(
         statements.append(
             makeStatementAssignmentVariable(
                 variable=container_tmp,
-                source=makeConstantRefNode(constant=start_value, source_ref=source_ref),
+                source=_makeContainerCreation(
+                    node=node,
+                    start_value=start_value,
+                    iter_tmp=iter_tmp,
+                    source_ref=source_ref,
+                ),
                 source_ref=source_ref.atInternal(),
             )
         )
@@ -0,0 +1,87 @@
+#     Copyright 2026, Kay Hayen, mailto:kay.hayen@gmail.com find license text at end of file
+
+
+"""Tracking of cache usage.
+
+Caches live in directories per kind, see "getCacheDir", and this keeps count
+of hits, misses, and evictions per kind for reporting, using the cache names
+of "--cache-size-limit" rather than directory names. Entries that are hit get
+their modification time updated, since access times are unreliable on file
+systems mounted with "noatime" or "relatime". Cache entries are never
+modified after creation, so the modification time is the time of last use,
+which is what least recently used eviction of "CacheCleanup" is based on.
+"""
+
+import os
+
+_cache_usage_stats = {}
+
+
+def _getCacheUsageStats(cache_name):
+    if cache_name not in _cache_usage_stats:
+        _cache_usage_stats[cache_name] = {
+            "hits": 0,
+            "misses": 0,
+            "evictions": 0,
+            "evicted_size": 0,
+        }
+
+    return _cache_usage_stats[cache_name]
+
+
+def markCacheEntryUsed(path):
+    """Mark a cache entry as used now, for least recently used eviction."""
+    try:
+        os.utime(path, None)
+    except OSError:
+        # Read-only or concurrently removed entries are not a problem.
+        pass
+
+
+def countCacheHit(cache_name, path):
+    """Count a cache hit and mark the entry at path as used."""
+    _getCacheUsageStats(cache_name)["hits"] += 1
+
+    if path is not None:
+        markCacheEntryUsed(path)
+
+
+def countCacheMiss(cache_name):
+    _getCacheUsageStats(cache_name)["misses"] += 1
+
+
+def countCacheEvictions(cache_name, count, size):
+    cache_usage_stats = _getCacheUsageStats(cache_name)
+
+    cache_usage_stats["evictions"] += count
+    cache_usage_stats["evicted_size"] += size
+
+
+def getCacheUsageStatistics():
+    """Statistics per cache name, with hits, misses, and evictions."""
+    return _cache_usage_stats
+
+
+def mergeCacheUsageStatistics(cache_usage_stats):
+    """Add statistics from another process, e.g. the onefile compressor."""
+    for cache_name, values in cache_usage_stats.items():
+        own_cache_usage_stats = _getCacheUsageStats(cache_name)
+
+        for key, value in values.items():
+            own_cache_usage_stats[key] += value
+
+
+#     Part of "Nuitka", an optimizing Python compiler that is compatible and
+#     integrates with CPython, but also works on its own.
+#
+#     Licensed under the GNU Affero General Public License, Version 3 (the "License");
+#     you may not use this file except in compliance with the License.
+#     You may obtain a copy of the License at
+#
+#        http://www.gnu.org/licenses/agpl.txt
+#
+#     Unless required by applicable law or agreed to in writing, software
+#     distributed under the License is distributed on an "AS IS" BASIS,
+#     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#     See the License for the specific language governing permissions and
+#     limitations under the License.
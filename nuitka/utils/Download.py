@@ -15,6 +15,7 @@ from nuitka.Tracing import general
 from nuitka.Version import getNuitkaVersion
 
 from .AppDirs import getCacheDir
+from .CacheUsage import countCacheHit, countCacheMiss
 from .FileOperations import (
     addFileExecutablePermission,
     deleteFile,
@@ -192,6 +193,9 @@ def getCachedDownload(
         nuitka_download_dir, os.path.basename(binary).replace(".exe", "")
     )
 
+    # Cache eviction removes downloads per binary name as a whole.
+    cache_entry_dir = nuitka_download_dir
+
     if is_arch_specific:
         nuitka_download_dir = getNormalizedPathJoin(
             nuitka_download_dir, is_arch_specific
@@ -205,7 +209,11 @@ def getCachedDownload(
 
     makePath(nuitka_download_dir)
 
-    if not os.path.isfile(download_path) and not os.path.isfile(exe_path):
+    if os.path.isfile(download_path) or os.path.isfile(exe_path):
+        countCacheHit(getDownloadCacheName(), cache_entry_dir)
+    else:
+        countCacheMiss(getDownloadCacheName())
+
         if not shouldDownload(
             message=message,
             reject_message=reject,
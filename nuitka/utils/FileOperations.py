@@ -935,6 +935,20 @@ def hasFilenameExtension(path, extensions):
         return extension in extensions
 
 
+def isSharedLibraryFilename(path):
+    """Is a filename one of a shared library or extension module.
+
+    Note: This goes by the name only, including versioned names like
+    "libfoo.so.1" that have no extension as such.
+    """
+    basename = os.path.basename(path)
+
+    return (
+        hasFilenameExtension(basename, (".so", ".pyd", ".dll", ".dylib"))
+        or ".so." in basename
+    )
+
+
 def addFilenameExtension(path, extension):
     """Add an extension to a filename if it doesn't already have it.
 
@@ -1065,6 +1079,40 @@ def withTemporaryFilename(prefix="", suffix="", temp_path=None):
         yield filename
 
 
+@contextmanager
+def withTemporaryFilenameNextTo(filename):
+    """Provide a unique temporary filename in the directory of a file.
+
+    Args:
+        filename: File that will be replaced with the temporary file.
+
+    Yields:
+        str: The temporary filename, removed on exit unless it was renamed.
+
+    Notes:
+        The name is created exclusively with a random part, so it does not
+        collide with other processes, even from other hosts sharing the
+        directory. Unlike for "tempfile", the file gets the usual permissions
+        from the umask, as others may have to read it once renamed.
+    """
+    fd, temp_filename = tempfile.mkstemp(
+        prefix=os.path.basename(filename) + ".",
+        suffix=".tmp",
+        dir=os.path.dirname(filename) or ".",
+    )
+    os.close(fd)
+
+    umask = os.umask(0)
+    os.umask(umask)
+    os.chmod(temp_filename, 0o666 & ~umask)
+
+    try:
+        yield temp_filename
+    finally:
+        if os.path.exists(temp_filename):
+            deleteFile(temp_filename, must_exist=False)
+
+
 def getFileContentByLine(filename, mode="r", encoding=None, errors=None):
     """Get the contents of a file as lines.
 
@@ -1221,6 +1269,26 @@ def putBinaryFileContents(filename, contents):
             output_file.write(contents)
 
 
+def putBinaryFileContentsAtomic(filename, contents):
+    """Write a binary file such that readers never see partial contents.
+
+    Args:
+        filename: str with the file to be created
+        contents: bytes that should be written into the file
+
+    Returns:
+        None
+
+    Notes:
+        This writes to a temporary file in the same directory first, and
+        then renames it, so concurrent processes can populate shared files.
+    """
+
+    with withTemporaryFilenameNextTo(filename) as temp_filename:
+        putBinaryFileContents(temp_filename, contents)
+        replaceFileAtomic(temp_filename, filename)
+
+
 def changeTextFileContents(filename, contents, encoding=None, compare_only=False):
     """Write a text file from given contents.
 
@@ -1414,6 +1482,55 @@ def copyFileWithPermissions(source_path, dest_path, target_dir):
         os.chmod(dest_path, source_mode)
 
 
+# Linux allows to copy in the kernel, sharing extents on file systems that
+# support reflinks, disabled once it was found not to work.
+_use_copy_file_range = hasattr(os, "copy_file_range")
+
+
+def _copyFileContents(source_path, dest_path):
+    global _use_copy_file_range  # singleton, pylint: disable=global-statement
+
+    # Writing through a hard link would change the other files too.
+    if os.path.isfile(dest_path) and os.stat(dest_path).st_nlink > 1:
+        deleteFile(dest_path, must_exist=True)
+
+    size = os.path.getsize(source_path)
+
+    # Copying a file onto itself must be rejected by "shutil", not truncate it.
+    if (
+        _use_copy_file_range
+        and size > 0
+        and not (os.path.exists(dest_path) and os.path.samefile(source_path, dest_path))
+    ):
+        with open(source_path, "rb") as source_file:
+            with open(dest_path, "wb") as dest_file:
+                try:
+                    while size > 0:
+                        copied = os.copy_file_range(
+                            source_file.fileno(), dest_file.fileno(), size
+                        )
+
+                        if copied == 0:
+                            break
+
+                        size -= copied
+                except OSError as e:
+                    if e.errno not in (
+                        errno.EXDEV,
+                        errno.ENOSYS,
+                        errno.EINVAL,
+                        errno.EOPNOTSUPP,
+                    ):
+                        raise
+
+                    _use_copy_file_range = False
+                else:
+                    if size == 0:
+                        return
+
+    shutil.copyfile(source_path, dest_path)
+
+
 def copyFile(source_path, dest_path):
     """Improved version of 'shutil.copy'.
 
@@ -1427,7 +1544,7 @@ def copyFile(source_path, dest_path):
 
     while 1:
         try:
-            shutil.copyfile(source_path, dest_path)
+            _copyFileContents(source_path, dest_path)
         except PermissionError as e:
             if e.errno != errno.EACCES:
                 raise
@@ -2064,6 +2181,51 @@ def getFileContentsHash(filename, as_string=True, line_filter=None):
         return result.asDigest()
 
 
+def getIdenticalFiles(filenames, get_hash=getFileContentsHash):
+    """Find files with identical contents and permissions.
+
+    Only files of equal size are hashed. Symbolic links and empty files
+    are ignored.
+
+    Args:
+        filenames: Paths to files to check.
+        get_hash: Function to get the hash of a file's content.
+
+    Returns:
+        dict: Maps files to the first of the given files with identical
+        contents, for all but that first one.
+    """
+    candidates = {}
+
+    for filename in filenames:
+        if os.path.islink(filename):
+            continue
+
+        stat_result = os.stat(filename)
+
+        if stat_result.st_size == 0:
+            continue
+
+        key = stat_result.st_size, stat_result.st_mode
+        candidates.setdefault(key, []).append(filename)
+
+    result = {}
+
+    for same_size_filenames in candidates.values():
+        if len(same_size_filenames) < 2:
+            continue
+
+        first_filenames = {}
+
+        for filename in same_size_filenames:
+            first_filename = first_filenames.setdefault(get_hash(filename), filename)
+
+            if first_filename is not filename:
+                result[filename] = first_filename
+
+    return result
+
+
 def encodeToFilesystemEncoding(path):
     """Encode a path to filesystem encoding.
 
@@ -9,7 +9,13 @@ import json
 
 from nuitka.__past__ import unicode
 
-from .FileOperations import getFileContents, openTextFile, stripFileContentsBOM
+from .FileOperations import (
+    getFileContents,
+    openTextFile,
+    replaceFileAtomic,
+    stripFileContentsBOM,
+    withTemporaryFilenameNextTo,
+)
 
 
 def _convertJsonLoadedValues(value):
@@ -64,6 +70,17 @@ def writeJsonToFilename(filename, contents, indent=2):
         writeJsonToFile(output, contents, indent=indent)
 
 
+def writeJsonToFilenameAtomic(filename, contents, indent=2):
+    """Write a json file such that readers never see partial contents.
+
+    This writes to a temporary file in the same directory first, and then
+    renames it, so concurrent processes can safely populate shared files.
+    """
+    with withTemporaryFilenameNextTo(filename) as temp_filename:
+        writeJsonToFilename(filename=temp_filename, contents=contents, indent=indent)
+        replaceFileAtomic(temp_filename, filename)
+
+
 #     Part of "Nuitka", an optimizing Python compiler that is compatible and
 #     integrates with CPython, but also works on its own.
 #
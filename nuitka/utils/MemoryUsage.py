@@ -3,6 +3,8 @@
 
 """Tools for tracing memory usage at compiled time."""
 
+import sys
+
 from nuitka.containers.OrderedDicts import OrderedDict
 from nuitka.Tracing import memory_logger, printLine
 
@@ -147,6 +149,66 @@ def showMemoryTrace():
             printLine(stat)
 
 
+def showObjectMemoryUsage(limit=50):
+    """Show the memory used by instances of Nuitka classes, per class.
+
+    The sizes are shallow, i.e. what the instance itself and its "__dict__"
+    use, attribute values are counted for their own class. Instances with a
+    "__dict__" are pointed out, since classes with "__slots__" only avoid it.
+    """
+
+    import gc
+
+    counts = {}
+    sizes = {}
+    dict_counts = {}
+
+    for obj in gc.get_objects():
+        # Classes themselves are not what we are after.
+        if isinstance(obj, type):
+            continue
+
+        obj_type = type(obj)
+
+        if not obj_type.__module__.startswith("nuitka."):
+            continue
+
+        name = obj_type.__name__
+
+        size = sys.getsizeof(obj)
+
+        obj_dict = getattr(obj, "__dict__", None)
+        if obj_dict is not None:
+            size += sys.getsizeof(obj_dict)
+            dict_counts[name] = dict_counts.get(name, 0) + 1
+
+        counts[name] = counts.get(name, 0) + 1
+        sizes[name] = sizes.get(name, 0) + size
+
+    printLine(
+        "Memory usage of Nuitka objects, %d instances with total %s:"
+        % (sum(counts.values()), formatMemoryUsageValue(sum(sizes.values())))
+    )
+
+    for count, name in enumerate(sorted(sizes, key=sizes.get, reverse=True)):
+        if count == limit:
+            break
+
+        printLine(
+            "  %s: count=%d, size=%s%s"
+            % (
+                name,
+                counts[name],
+                formatMemoryUsageValue(sizes[name]),
+                (
+                    ", instances with __dict__=%d" % dict_counts[name]
+                    if name in dict_counts
+                    else ""
+                ),
+            )
+        )
+
+
 #     Part of "Nuitka", an optimizing Python compiler that is compatible and
 #     integrates with CPython, but also works on its own.
 #
@@ -53,6 +53,8 @@ ShellPatternMatchResult = makeNamedtupleClass(
 
 
 class ModuleName(str):
+    __slots__ = ()
+
     def __init__(self, value):
         assert checkModuleName(value), value
 
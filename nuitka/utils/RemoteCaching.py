@@ -0,0 +1,281 @@
+#     Copyright 2026, Kay Hayen, mailto:kay.hayen@gmail.com find license text at end of file
+
+
+"""Remote caches shared between machines.
+
+Nuitka caches live in per machine directories, which doesn't help ephemeral
+build machines that start cold every time. A remote cache is given with the
+"--remote-cache" option and used for the module cache from Nuitka and for
+object files from the C compiler via "ccache" remote storage.
+
+Supported are plain directories, e.g. on network drives, and a simple HTTP
+store protocol, which is also what "ccache" uses. Entries are addressed as
+"<url>/<kind>/<key>" where key is a content hash, "GET" is to return the
+entry or status 404 if it does not exist, and "PUT" is to store the request
+body. Any web server with WebDAV support or a small stand-in server can
+implement that.
+"""
+
+import os
+
+from nuitka.PythonVersions import python_version
+from nuitka.Tracing import cache_logger
+from nuitka.Version import getNuitkaVersion
+
+from .FileOperations import (
+    getFileContents,
+    getNormalizedPathJoin,
+    makePath,
+    putBinaryFileContentsAtomic,
+)
+
+
+class RemoteCacheBase(object):
+    __slots__ = ("url", "read_only", "stats", "failed")
+
+    def __init__(self, url, read_only):
+        self.url = url
+        self.read_only = read_only
+
+        # Per kind counts of "hit", "miss", "store", and "error".
+        self.stats = {}
+
+        # After an error, we do not try again, to avoid slow timeouts for each
+        # and every entry.
+        self.failed = False
+
+    def _countEvent(self, kind, event):
+        kind_stats = self.stats.setdefault(
+            kind, {"hit": 0, "miss": 0, "store": 0, "error": 0}
+        )
+        kind_stats[event] += 1
+
+    def _reportError(self, kind, operation, e):
+        self._countEvent(kind, "error")
+
+        if not self.failed:
+            cache_logger.warning(
+                "Remote cache '%s' failed to %s '%s' entry due to '%s', not using it anymore."
+                % (self.url, operation, kind, e)
+            )
+
+        self.failed = True
+
+    def getCacheEntry(self, kind, key):
+        """Get the contents of an entry as bytes, None if not available."""
+        if self.failed:
+            return None
+
+        try:
+            result = self._getCacheEntry(kind, key)
+        except Exception as e:  # Catch all the things, pylint: disable=broad-except
+            self._reportError(kind, "read", e)
+            return None
+
+        self._countEvent(kind, "miss" if result is None else "hit")
+
+        return result
+
+    def putCacheEntry(self, kind, key, contents):
+        """Store the contents of an entry, unless in read-only mode."""
+        if self.failed or self.read_only:
+            return
+
+        try:
+            self._putCacheEntry(kind, key, contents)
+        except Exception as e:  # Catch all the things, pylint: disable=broad-except
+            self._reportError(kind, "store", e)
+        else:
+            self._countEvent(kind, "store")
+
+    def getCcacheRemoteStorageValue(self):
+        """Value to use for "CCACHE_REMOTE_STORAGE" configuration."""
+        raise NotImplementedError(self)
+
+    def _getCacheEntry(self, kind, key):
+        raise NotImplementedError(self)
+
+    def _putCacheEntry(self, kind, key, contents):
+        raise NotImplementedError(self)
+
+
+class RemoteCacheDirectory(RemoteCacheBase):
+    __slots__ = ("path",)
+
+    def __init__(self, url, path, read_only):
+        RemoteCacheBase.__init__(self, url=url, read_only=read_only)
+
+        self.path = path
+
+    def _getEntryFilename(self, kind, key):
+        return getNormalizedPathJoin(self.path, kind, key)
+
+    def _getCacheEntry(self, kind, key):
+        filename = self._getEntryFilename(kind, key)
+
+        if not os.path.exists(filename):
+            return None
+
+        return getFileContents(filename, mode="rb")
+
+    def _putCacheEntry(self, kind, key, contents):
+        filename = self._getEntryFilename(kind, key)
+
+        if os.path.exists(filename):
+            return
+
+        makePath(os.path.dirname(filename))
+
+        # Other machines may be reading or writing the same entry, so only
+        # complete files must become visible.
+        putBinaryFileContentsAtomic(filename, contents)
+
+    def getCcacheRemoteStorageValue(self):
+        result = "file:%s" % getNormalizedPathJoin(os.path.abspath(self.path), "ccache")
+
+        if self.read_only:
+            result += "|read-only=true"
+
+        return result
+
+
+class RemoteCacheHttp(RemoteCacheBase):
+    __slots__ = ()
+
+    def _makeRequest(self, kind, key, method, contents):
+        if python_version < 0x300:
+            from urllib2 import Request  # pylint: disable=I0021,import-error
+        else:
+            from urllib.request import Request
+
+        request = Request(
+            "%s/%s/%s" % (self.url.rstrip("/"), kind, key),
+            data=contents,
+            headers={"User-Agent": "Nuitka Remote Cache/%s" % getNuitkaVersion()},
+        )
+        request.get_method = lambda: method
+
+        return request
+
+    def _getCacheEntry(self, kind, key):
+        if python_version < 0x300:
+            from urllib2 import (  # pylint: disable=I0021,import-error
+                HTTPError,
+                urlopen,
+            )
+        else:
+            from urllib.error import HTTPError
+            from urllib.request import urlopen
+
+        request = self._makeRequest(kind=kind, key=key, method="GET", contents=None)
+
+        try:
+            response = urlopen(request, timeout=30.0)
+        except HTTPError as e:
+            if e.code == 404:
+                return None
+
+            raise
+
+        try:
+            return response.read()
+        finally:
+            response.close()
+
+    def _putCacheEntry(self, kind, key, contents):
+        if python_version < 0x300:
+            from urllib2 import urlopen  # pylint: disable=I0021,import-error
+        else:
+            from urllib.request import urlopen
+
+        request = self._makeRequest(kind=kind, key=key, method="PUT", contents=contents)
+
+        urlopen(request, timeout=30.0).close()
+
+    def getCcacheRemoteStorageValue(self):
+        result = "%s/ccache" % self.url.rstrip("/")
+
+        if self.read_only:
+            result += "|read-only=true"
+
+        return result
+
+
+def makeRemoteCache(url, read_only):
+    """Create remote cache object for a URL or directory path."""
+
+    if url.startswith(("http://", "https://")):
+        return RemoteCacheHttp(url=url, read_only=read_only)
+
+    if url.startswith("file://"):
+        path = url[len("file://") :]
+    elif url.startswith("file:"):
+        path = url[len("file:") :]
+    else:
+        path = url
+
+    return RemoteCacheDirectory(url=url, path=path, read_only=read_only)
+
+
+_remote_cache = None
+
+
+def getRemoteCache():
+    """Remote cache configured via options, or None if not used."""
+
+    # singleton, pylint: disable=global-statement
+    global _remote_cache
+
+    if _remote_cache is None:
+        from nuitka.options.Options import (
+            getRemoteCacheUrl,
+            isRemoteCacheReadOnly,
+        )
+
+        url = getRemoteCacheUrl()
+
+        _remote_cache = (
+            makeRemoteCache(url=url, read_only=isRemoteCacheReadOnly())
+            if url is not None
+            else False
+        )
+
+    return _remote_cache or None
+
+
+def reportRemoteCacheStatistics():
+    remote_cache = getRemoteCache()
+
+    if remote_cache is None:
+        return
+
+    for kind, kind_stats in sorted(remote_cache.stats.items()):
+        lookups = kind_stats["hit"] + kind_stats["miss"]
+
+        cache_logger.info(
+            "Remote cache '%s' for '%s' had %d hits and %d misses (%.1f%% hit rate), %d stores."
+            % (
+                remote_cache.url,
+                kind,
+                kind_stats["hit"],
+                kind_stats["miss"],
+                (100.0 * kind_stats["hit"] / lookups) if lookups else 0.0,
+                kind_stats["store"],
+            )
+        )
+
+
+#     Part of "Nuitka", an optimizing Python compiler that is compatible and
+#     integrates with CPython, but also works on its own.
+#
+#     Licensed under the GNU Affero General Public License, Version 3 (the "License");
+#     you may not use this file except in compliance with the License.
+#     You may obtain a copy of the License at
+#
+#        http://www.gnu.org/licenses/agpl.txt
+#
+#     Unless required by applicable law or agreed to in writing, software
+#     distributed under the License is distributed on an "AS IS" BASIS,
+#     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#     See the License for the specific language governing permissions and
+#     limitations under the License.
@@ -64,6 +64,34 @@ if _use_threaded_executor:
         pass
 
 
+def iterateThreaded(function, items, max_workers):
+    """Call function for all items, yielding items and results as they complete.
+
+    Unlike the pool executor of this module, this really uses threads if
+    available, which is for work that spends its time in external tools and
+    file operations. Exceptions are raised in the calling thread.
+    """
+
+    try:
+        # pylint: disable=I0021,import-error,no-name-in-module
+        from concurrent.futures import ThreadPoolExecutor as RealThreadPoolExecutor
+        from concurrent.futures import as_completed
+    except ImportError:
+        max_workers = 1
+
+    if max_workers <= 1 or len(items) <= 1:
+        for item in items:
+            yield item, function(item)
+
+        return
+
+    with RealThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = dict((executor.submit(function, item), item) for item in items)
+
+        for future in as_completed(futures):
+            yield futures[future], future.result()
+
+
 def getThreadIdent():
     return current_thread()
 
@@ -88,6 +88,16 @@ def mutableConstantChanger():
     print("Changed to value:")
     print(d)
 
+    c = {"a": [1, 2], "b": {"c": [3, {"x": 1}], "d": "s"}, "e": (1, [2]), "f": 5}
+    print("Start out with value:")
+    print(c)
+
+    c["a"].append(3)
+    c["b"]["c"][1]["x"] = 2
+    c["e"][1].append(4)
+    print("Changed to value:")
+    print(c)
+
     spec = dict(qual=[], storage=set(), type=[], function=set(), q=1)
     spec["type"].insert(0, 2)
     spec["storage"].add(3)
@@ -0,0 +1,134 @@
+#     Copyright 2026, Kay Hayen, mailto:kay.hayen@gmail.com find license text at end of file
+
+
+"""Frames of functions with lazy frames, as seen by user code and tracebacks."""
+
+from __future__ import print_function
+
+import sys
+import traceback
+
+# nuitka-project: --lazy-frames
+
+
+class Watcher(object):
+    def __add__(self, other):
+        print("Operator called from", sys._getframe(1).f_code.co_name)
+        return other
+
+    def __getitem__(self, key):
+        print("Subscript called from", sys._getframe(1).f_code.co_name)
+        return key
+
+    def __bool__(self):
+        print("Truth check called from", sys._getframe(1).f_code.co_name)
+        return True
+
+    __nonzero__ = __bool__
+
+    @property
+    def value(self):
+        print("Property called from", sys._getframe(1).f_code.co_name)
+        return 42
+
+
+def viaop(a, b):
+    return a + b
+
+
+def attr(a):
+    return a.value
+
+
+def item(a, k):
+    return a[k]
+
+
+def truth(a):
+    if a:
+        return 1
+    return 0
+
+
+def leaf(x):
+    y = 2
+    if x is None:
+        y = 3
+    return y
+
+
+def leafRaising(x, y):
+    if x is not None:
+        raise ValueError("leaf raised")
+    return y
+
+
+def leafDivision(x, y):
+    return x / y
+
+
+def leafIntDivision(x):
+    divisor = 0 if x is None else 2
+    parts = [x, x, x, x]
+    return parts[7 // divisor]
+
+
+watcher = Watcher()
+
+print("Operator:", viaop(watcher, 1))
+print("Property:", attr(watcher))
+print("Subscript:", item(watcher, 7))
+
+print("Truth:", truth(watcher))
+
+print("Leaf:", leaf(0), leaf(None))
+print("Leaf no raise:", leafRaising(None, 1))
+
+print("Leaf int division:", leafIntDivision(1))
+
+for func, args in (
+    (leafRaising, (1, 2)),
+    (leafDivision, (1, 0)),
+    (leafIntDivision, (None,)),
+):
+    try:
+        func(*args)
+    except Exception as e:  # pylint: disable=broad-except
+        print("Caught:", type(e).__name__)
+        print(
+            "Traceback functions:",
+            [entry[2] for entry in traceback.extract_tb(sys.exc_info()[2])],
+        )
+
+        tb = sys.exc_info()[2]
+        while tb.tb_next is not None:
+            tb = tb.tb_next
+        print(
+            "Innermost frame:",
+            tb.tb_frame.f_code.co_name,
+            tb.tb_lineno,
+            sorted(tb.tb_frame.f_locals),
+        )
+
+# Again, now with the frames cached.
+try:
+    leafRaising(1, 2)
+except ValueError as e:
+    print("Caught again:", e)
+
+print("Frame after:", sys._getframe().f_code.co_name)
+
+#     Python tests originally created or extracted from other peoples work. The
+#     parts were too small to be protected.
+#
+#     Licensed under the Apache License, Version 2.0 (the "License");
+#     you may not use this file except in compliance with the License.
+#     You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#     Unless required by applicable law or agreed to in writing, software
+#     distributed under the License is distributed on an "AS IS" BASIS,
+#     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#     See the License for the specific language governing permissions and
+#     limitations under the License.
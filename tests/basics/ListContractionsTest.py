@@ -106,6 +106,24 @@ def allowedDelOnIteratorVariable(z):
 
 print(allowedDelOnIteratorVariable(3))
 
+print("Contractions over iterables with known length:")
+
+
+def sizedContractions(items):
+    print([x * 2 for x in items])
+    print([x for x in tuple(items)])
+    print([x for x in range(len(items))])
+    print(displayDict({x: x * 3 for x in items}))
+    print(displayDict({x: 0 for x in dict.fromkeys(items)}))
+
+    # Shrinking the list while iterating, gives less values than the length hint.
+    items = list(items)
+    print([items.pop() for x in items], items)
+
+
+sizedContractions([1, 2, 3, 4])
+sizedContractions([])
+
 #     Python tests originally created or extracted from other peoples work. The
 #     parts were too small to be protected.
 #
@@ -0,0 +1,89 @@
+#     Copyright 2026, Kay Hayen, mailto:kay.hayen@gmail.com find license text at end of file
+
+
+"""Tests for calls of module level functions, which are made directly."""
+
+from __future__ import print_function
+
+import sys
+
+
+def add(a, b):
+    return a + b
+
+
+def makeList():
+    return [0]
+
+
+def generateValues(n):
+    for i in range(n):
+        yield i
+
+
+def multiply(a, b=2):
+    return a * b
+
+
+def countDown(n):
+    if n == 0:
+        return 0
+
+    return countDown(n - 1) + 1
+
+
+def divide(a, b):
+    return a // b
+
+
+def callLayers(x):
+    return (
+        add(x, 1)
+        + add(1, 2)
+        + len(makeList())
+        + sum(generateValues(3))
+        + multiply(x, 3)
+    )
+
+
+print("Direct calls:", callLayers(5), countDown(50))
+
+try:
+    divide(1, 0)
+except ZeroDivisionError:
+    tb = sys.exc_info()[2]
+    names = []
+
+    while tb is not None:
+        names.append(tb.tb_frame.f_code.co_name)
+        tb = tb.tb_next
+
+    print("Traceback of direct call:", names)
+
+
+def callAdd():
+    return add(10, 3)
+
+
+print("Before rebinding:", callAdd())
+
+globals()["add"] = lambda a, b: -1
+print("After rebinding from outside:", callAdd(), callLayers(5))
+
+sys.modules[__name__].add = min
+print("After rebinding via module:", callAdd())
+
+#     Python tests originally created or extracted from other peoples work. The
+#     parts were too small to be protected.
+#
+#     Licensed under the Apache License, Version 2.0 (the "License");
+#     you may not use this file except in compliance with the License.
+#     You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#     Unless required by applicable law or agreed to in writing, software
+#     distributed under the License is distributed on an "AS IS" BASIS,
+#     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#     See the License for the specific language governing permissions and
+#     limitations under the License.
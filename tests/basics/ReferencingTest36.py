@@ -266,6 +266,28 @@ def simpleFunction10():
     loop.close()
 
 
+class FormatFails:
+    def __format__(self, spec):
+        raise ValueError(spec)
+
+
+def simpleFunction11():
+    a = "a" * 3
+    b = "\u20ac" * 2
+    c = ""
+
+    x = f"{a}{b}{c}:{a!r}"
+    y = f"{c}{a}"
+    z = f"{a}{b}{'wide':>{len(x)}}"
+
+    try:
+        z = f"{a}{FormatFails():{b}}"
+    except ValueError:
+        pass
+
+    return x, y, z
+
+
 # These need stderr to be wrapped.
 tests_stderr = ()
 
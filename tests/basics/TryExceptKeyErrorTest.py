@@ -0,0 +1,141 @@
+#     Copyright 2026, Kay Hayen, mailto:kay.hayen@gmail.com find license text at end of file
+
+
+"""Tests for subscript lookups with "KeyError" handlers, which are optimized."""
+
+from __future__ import print_function
+
+import sys
+
+
+class MissingDict(dict):
+    def __missing__(self, key):
+        if key == "raise":
+            raise KeyError("from missing")
+
+        return key * 2
+
+
+class LookupRaising(object):
+    def __getitem__(self, key):
+        if key == 1:
+            raise KeyError(key)
+        if key == 2:
+            raise IndexError(key)
+
+        return key
+
+
+class SubKeyError(KeyError):
+    pass
+
+
+class SubKeyErrorRaising(object):
+    def __getitem__(self, key):
+        raise SubKeyError(key)
+
+
+def lookupWithDefault(d, k):
+    try:
+        v = d[k]
+    except KeyError:
+        v = "default"
+
+    return v
+
+
+def lookupWithReturn(d, k):
+    try:
+        v = d[k]
+    except KeyError:
+        return "returned"
+
+    return v
+
+
+def lookupWithContinue(d, keys):
+    total = 0
+
+    for k in keys:
+        try:
+            v = d[k]
+        except KeyError:
+            continue
+
+        total += v
+
+    return total
+
+
+def lookupWithExceptionValue(d, k):
+    try:
+        v = d[k]
+    except KeyError as e:
+        v = e
+
+    return v
+
+
+def lookupWithPass(d, k):
+    v = None
+
+    try:
+        v = d[k]
+    except KeyError:
+        pass
+
+    return v
+
+
+print(
+    "Dictionary hit and miss:",
+    lookupWithDefault({1: 2}, 1),
+    lookupWithDefault({1: 2}, 3),
+)
+print(
+    "Dictionary subclass with missing:",
+    lookupWithDefault(MissingDict(), 4),
+    lookupWithDefault(MissingDict(), "raise"),
+)
+print(
+    "Lookup raising KeyError:",
+    lookupWithDefault(LookupRaising(), 1),
+    lookupWithDefault(LookupRaising(), 5),
+)
+print("Lookup raising subclass:", lookupWithDefault(SubKeyErrorRaising(), 1))
+print("Returning handler:", lookupWithReturn({}, 1), lookupWithReturn({1: 3}, 1))
+print("Continuing handler:", lookupWithContinue({1: 2, 3: 4}, range(6)))
+print("Passing handler:", lookupWithPass({}, 1), lookupWithPass({1: 5}, 1))
+print(
+    "Handler using exception:",
+    repr(lookupWithExceptionValue({}, 7)),
+    lookupWithExceptionValue({}, 7).args,
+    lookupWithExceptionValue({7: 8}, 7),
+)
+
+try:
+    lookupWithDefault(LookupRaising(), 2)
+except IndexError as e:
+    print("Other exceptions are not handled:", repr(e))
+
+try:
+    lookupWithDefault({}, [])
+except TypeError as e:
+    print("Hashing errors are not handled:", repr(e))
+
+print("No exception left behind:", sys.exc_info())
+
+#     Python tests originally created or extracted from other peoples work. The
+#     parts were too small to be protected.
+#
+#     Licensed under the Apache License, Version 2.0 (the "License");
+#     you may not use this file except in compliance with the License.
+#     You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#     Unless required by applicable law or agreed to in writing, software
+#     distributed under the License is distributed on an "AS IS" BASIS,
+#     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#     See the License for the specific language governing permissions and
+#     limitations under the License.
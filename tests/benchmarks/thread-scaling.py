@@ -0,0 +1,115 @@
+#     Copyright 2026, Kay Hayen, mailto:kay.hayen@gmail.com find license text at end of file
+
+
+"""Scaling of object creation with threads.
+
+Creates closures, generators, and frames from a given number of threads, which
+for free-threaded Python runs in parallel and stresses the free lists of the
+compiled types. Give the thread count as argument, defaults to 1.
+
+With "churn" as second argument, instead many short lived threads each keep
+many objects alive at once, filling their free lists, and the resident memory
+is reported, which must not grow with the number of threads exited.
+"""
+
+import os
+import sys
+import threading
+import time
+
+
+def makeAdder(x):
+    def adder(y):
+        return x + y
+
+    return adder
+
+
+def generate(count):
+    for i in range(count):
+        yield i
+
+
+def work(iterations):
+    total = 0
+
+    for i in range(iterations):
+        total += makeAdder(i)(1)
+        total += sum(generate(3))
+
+    return total
+
+
+def hold(count):
+    generators = [generate(3) for _ in range(count)]
+    adders = [makeAdder(i) for i in range(count)]
+
+    return len(generators) + len(adders) + work(100)
+
+
+def getResidentMemory():
+    with open("/proc/self/statm") as statm_file:
+        return int(statm_file.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") // 1024
+
+
+def churn(thread_count):
+    for wave in range(1, 101):
+        threads = [
+            threading.Thread(target=hold, args=(2000,)) for _ in range(thread_count)
+        ]
+
+        for thread in threads:
+            thread.start()
+
+        for thread in threads:
+            thread.join()
+
+        if wave % 25 == 0:
+            print(
+                "Threads %d exited, resident memory %d KiB."
+                % (wave * thread_count, getResidentMemory())
+            )
+
+
+def main():
+    thread_count = int(sys.argv[1]) if len(sys.argv) > 1 else 1
+    iterations = 200000
+
+    if len(sys.argv) > 2 and sys.argv[2] == "churn":
+        churn(thread_count)
+        return
+
+    threads = [
+        threading.Thread(target=work, args=(iterations,)) for _ in range(thread_count)
+    ]
+
+    start = time.time()
+
+    for thread in threads:
+        thread.start()
+
+    for thread in threads:
+        thread.join()
+
+    print("Threads %d took %.3f seconds." % (thread_count, time.time() - start))
+
+
+if __name__ == "__main__":
+    main()
+
+#     Python test originally created or extracted from other peoples work. The
+#     parts from me are licensed as below. It is at least Free Software where
+#     it's copied from other people. In these cases, that will normally be
+#     indicated.
+#
+#     Licensed under the Apache License, Version 2.0 (the "License");
+#     you may not use this file except in compliance with the License.
+#     You may obtain a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#     Unless required by applicable law or agreed to in writing, software
+#     distributed under the License is distributed on an "AS IS" BASIS,
+#     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#     See the License for the specific language governing permissions and
+#     limitations under the License.
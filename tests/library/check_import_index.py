@@ -0,0 +1,205 @@
+#!/usr/bin/env python
+#     Copyright 2026, Kay Hayen, mailto:kay.hayen@gmail.com find license text at end of file
+
+
+"""This test checks the persistent import index used to locate modules.
+
+It works on temporary directories only, with a temporary cache directory, and
+checks that listings are persisted, invalidated when the directory modification
+time changes, flushed with the import cache, and looked up case insensitive if
+the platform requires that.
+"""
+
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+# Find nuitka package relative to us.
+sys.path.insert(
+    0,
+    os.path.normpath(
+        os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..")
+    ),
+)
+
+# isort:start
+
+from nuitka.importing import ImportIndex
+from nuitka.importing.Importing import flushImportCache
+from nuitka.tools.testing.Common import my_print, setup, test_logger
+from nuitka.utils.FileOperations import putTextFileContents
+
+
+def _touch(filename):
+    putTextFileContents(filename, contents="")
+
+
+def _setOldMtime(dirname, age):
+    # Old enough to not be in the racy window, so it gets stored.
+    mtime = time.time() - 3600 - age
+    os.utime(dirname, (mtime, mtime))
+
+
+def _restartProcess():
+    """Forget all in-memory state, like a new compilation would."""
+    ImportIndex._index = None
+    ImportIndex._index_changed = False
+    ImportIndex.flushImportIndex()
+
+
+def _check(description, value, expected):
+    my_print("%s: %s" % (description, value))
+
+    if value != expected:
+        test_logger.sysexit(
+            "Error, expected %r for '%s' but got %r." % (expected, description, value)
+        )
+
+
+def checkPersistence(dirname):
+    _touch(os.path.join(dirname, "a.py"))
+    os.mkdir(os.path.join(dirname, "pkg"))
+    _setOldMtime(dirname, age=0)
+
+    _check("File found", ImportIndex.isIndexedFile(os.path.join(dirname, "a.py")), True)
+    _check(
+        "Directory found",
+        ImportIndex.isIndexedDirectory(os.path.join(dirname, "pkg")),
+        True,
+    )
+    _check(
+        "Directory not file",
+        ImportIndex.isIndexedFile(os.path.join(dirname, "pkg")),
+        False,
+    )
+
+    ImportIndex.saveImportIndex()
+    _check("Index file written", os.path.exists(ImportIndex._getIndexFilename()), True)
+
+    # Sneak in a file without changing the modification time, the stored
+    # listing is to be trusted then, proving that it is used.
+    mtime = os.stat(dirname).st_mtime
+    _touch(os.path.join(dirname, "hidden.py"))
+    os.utime(dirname, (mtime, mtime))
+
+    _restartProcess()
+    _check(
+        "Persisted listing used",
+        ImportIndex.isIndexedFile(os.path.join(dirname, "hidden.py")),
+        False,
+    )
+    _check(
+        "Persisted listing file",
+        ImportIndex.isIndexedFile(os.path.join(dirname, "a.py")),
+        True,
+    )
+
+
+def checkMtimeInvalidation(dirname):
+    _touch(os.path.join(dirname, "b.py"))
+    _setOldMtime(dirname, age=10)
+
+    # Within a process, listings are validated once only.
+    _check(
+        "New file unseen before flush",
+        ImportIndex.isIndexedFile(os.path.join(dirname, "b.py")),
+        False,
+    )
+
+    flushImportCache()
+    _check(
+        "New file seen after flush",
+        ImportIndex.isIndexedFile(os.path.join(dirname, "b.py")),
+        True,
+    )
+
+    ImportIndex.saveImportIndex()
+
+    # The changed modification time must invalidate the stored listing.
+    os.unlink(os.path.join(dirname, "b.py"))
+    _setOldMtime(dirname, age=20)
+
+    _restartProcess()
+    _check(
+        "Removed file unseen after mtime change",
+        ImportIndex.isIndexedFile(os.path.join(dirname, "b.py")),
+        False,
+    )
+    _check(
+        "Sneaked in file seen after mtime change",
+        ImportIndex.isIndexedFile(os.path.join(dirname, "hidden.py")),
+        True,
+    )
+
+
+def checkCaseInsensitive(dirname):
+    old_case_sensitive = ImportIndex._case_sensitive
+
+    ImportIndex._case_sensitive = False
+    try:
+        _restartProcess()
+
+        _check(
+            "Case insensitive file",
+            ImportIndex.isIndexedFile(os.path.join(dirname, "A.PY")),
+            True,
+        )
+        _check(
+            "Case insensitive directory",
+            ImportIndex.isIndexedDirectory(os.path.join(dirname, "Pkg")),
+            True,
+        )
+    finally:
+        ImportIndex._case_sensitive = old_case_sensitive
+
+    _restartProcess()
+    _check(
+        "Case sensitive file",
+        ImportIndex.isIndexedFile(os.path.join(dirname, "A.PY")),
+        ImportIndex._case_sensitive is False,
+    )
+
+
+def main():
+    setup(suite="import_index")
+
+    tmp_dir = tempfile.mkdtemp(prefix="nuitka-import-index-")
+    os.environ["NUITKA_CACHE_DIR_IMPORT_INDEX"] = os.path.join(tmp_dir, "cache")
+
+    try:
+        dirname = os.path.join(tmp_dir, "search_path")
+        os.mkdir(dirname)
+
+        ImportIndex.setupImportIndex(enabled=True)
+        _restartProcess()
+
+        checkPersistence(dirname)
+        checkMtimeInvalidation(dirname)
+        checkCaseInsensitive(dirname)
+    finally:
+        shutil.rmtree(tmp_dir)
+
+    my_print("OK.")
+
+
+if __name__ == "__main__":
+    main()
+
+#     Python test originally created or extracted from other peoples work. The
+#     parts from me are licensed as below. It is at least Free Software where
+#     it's copied from other people. In these cases, that will normally be
+#     indicated.
+#
+#     Licensed under the Apache License, Version 2.0 (the "License");
+#     you may not use this file except in compliance with the License.
+#     You may obtain a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#     Unless required by applicable law or agreed to in writing, software
+#     distributed under the License is distributed on an "AS IS" BASIS,
+#     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#     See the License for the specific language governing permissions and
+#     limitations under the License.
@@ -0,0 +1,98 @@
+#     Copyright 2026, Kay Hayen, mailto:kay.hayen@gmail.com find license text at end of file
+
+
+"""Test data files embedded into the binary, next to ones on disk.
+
+The embedded files are not in the dist folder, so all accesses must be served
+by the loader and its resource reader.
+"""
+
+# nuitka-project: --mode=standalone
+# nuitka-project: --include-package=embedded_data_package
+# nuitka-project: --include-package-data=embedded_data_package
+# nuitka-project: --include-data-files-embedded=embedded_data_package/data.txt
+# nuitka-project: --include-data-files-embedded=embedded_data_package/sub/inner.txt
+
+import os
+import pkgutil
+from importlib.resources import as_file, files
+
+import embedded_data_package
+
+
+def listNames(traversable):
+    # Code files are not data files, and not present in the dist folder.
+    return sorted(
+        entry.name
+        for entry in traversable.iterdir()
+        if entry.name != "__pycache__" and not entry.name.endswith((".py", ".pyc"))
+    )
+
+
+# Embedded files must not be in the dist folder, only the other ones.
+if "__compiled__" in globals():
+    package_dir = os.path.dirname(embedded_data_package.__file__)
+
+    assert not os.path.exists(os.path.join(package_dir, "data.txt"))
+    assert not os.path.exists(os.path.join(package_dir, "sub", "inner.txt"))
+    assert os.path.exists(os.path.join(package_dir, "on_disk.txt"))
+    assert os.path.exists(os.path.join(package_dir, "sub", "disk.txt"))
+
+print("get_data embedded:", pkgutil.get_data("embedded_data_package", "data.txt"))
+print(
+    "get_data embedded in sub directory:",
+    pkgutil.get_data("embedded_data_package", "sub/inner.txt"),
+)
+print("get_data on disk:", pkgutil.get_data("embedded_data_package", "on_disk.txt"))
+
+try:
+    print("get_data missing:", pkgutil.get_data("embedded_data_package", "missing.txt"))
+except (IOError, OSError) as e:
+    print("get_data missing:", type(e).__name__)
+
+package_files = files("embedded_data_package")
+data_file = package_files / "data.txt"
+
+print("read_text:", repr(data_file.read_text()))
+print("read_bytes:", data_file.read_bytes())
+
+with data_file.open("rb") as f:
+    print("open binary:", f.read())
+
+with data_file.open("r") as f:
+    print("open text:", f.readlines())
+
+print("exists embedded:", data_file.exists(), data_file.is_file(), data_file.is_dir())
+print("exists missing:", (package_files / "missing.txt").exists())
+print("read_text on disk:", repr((package_files / "on_disk.txt").read_text()))
+
+sub_dir = package_files / "sub"
+
+print("sub is_dir:", sub_dir.is_dir(), sub_dir.is_file(), sub_dir.exists())
+print("package listing:", listNames(package_files))
+print("sub listing:", listNames(sub_dir))
+print("sub embedded read_text:", repr(sub_dir.joinpath("inner.txt").read_text()))
+print("sub on disk read_text:", repr(sub_dir.joinpath("disk.txt").read_text()))
+
+with as_file(data_file) as path:
+    with open(path, "rb") as f:
+        print("as_file embedded:", f.read())
+
+with as_file(sub_dir / "disk.txt") as path:
+    with open(path, "rb") as f:
+        print("as_file on disk:", f.read())
+
+#     Python tests originally created or extracted from other peoples work. The
+#     parts were too small to be protected.
+#
+#     Licensed under the Apache License, Version 2.0 (the "License");
+#     you may not use this file except in compliance with the License.
+#     You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#     Unless required by applicable law or agreed to in writing, software
+#     distributed under the License is distributed on an "AS IS" BASIS,
+#     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#     See the License for the specific language governing permissions and
+#     limitations under the License.